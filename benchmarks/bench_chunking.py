@@ -0,0 +1,50 @@
+"""Benchmark chunking throughput against document size.
+
+Run with ``python benchmarks/bench_chunking.py``. The chunker should scale
+linearly: the time per word stays flat as the page count grows.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from thedebator.retrieval.pdf import chunk_pages  # noqa: E402
+
+WORDS_PER_PAGE = 500
+PAGE_COUNTS = (50, 100, 200, 400, 800)
+
+
+def synthetic_pages(count: int):
+    vocab = ["the", "model", "attention", "layer", "results", "table", "figure", "loss"]
+    for page in range(1, count + 1):
+        words = (vocab[(page * 7 + i) % len(vocab)] for i in range(WORDS_PER_PAGE))
+        yield page, " ".join(words)
+
+
+def time_chunking(pages: int, chunk_size: int = 1000, chunk_overlap: int = 250) -> float:
+    data = list(synthetic_pages(pages))
+    start = time.perf_counter()
+    for _ in chunk_pages(data, chunk_size, chunk_overlap):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'pages':>6} {'words':>8} {'seconds':>9} {'us/word':>8}")
+    baseline = None
+    for pages in PAGE_COUNTS:
+        elapsed = min(time_chunking(pages) for _ in range(3))
+        words = pages * WORDS_PER_PAGE
+        per_word = elapsed / words * 1e6
+        baseline = baseline or per_word
+        print(f"{pages:>6} {words:>8} {elapsed:>9.4f} {per_word:>8.3f}")
+    print(f"\nus/word ratio largest/smallest: {per_word / baseline:.2f} (≈1.0 means linear)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark embedding throughput across batch sizes and thread counts.
+
+Run with ``python benchmarks/bench_embedding.py [hashing|default]``. The
+``default`` backend downloads Chroma's ONNX model on first use.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.synthetic import synthetic_page_text  # noqa: E402
+from thedebator.backends.embedder import ChromaDefaultEmbedder, HashingEmbedder  # noqa: E402
+
+TEXTS = 2000
+SETTINGS = [(16, 1), (64, 1), (256, 1), (64, 2), (64, 4)]
+
+
+def main() -> None:
+    backend = sys.argv[1] if len(sys.argv) > 1 else "hashing"
+    texts = [synthetic_page_text(i, words=150) for i in range(TEXTS)]
+
+    print(f"backend={backend} texts={TEXTS}")
+    print(f"{'batch':>6} {'threads':>8} {'texts/s':>10}")
+    for batch_size, threads in SETTINGS:
+        if backend == "default":
+            embedder = ChromaDefaultEmbedder(batch_size=batch_size, threads=threads)
+        else:
+            embedder = HashingEmbedder(batch_size=batch_size, threads=threads)
+        start = time.perf_counter()
+        embedder.embed(texts)
+        elapsed = time.perf_counter() - start
+        print(f"{batch_size:>6} {threads:>8} {TEXTS / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark serial vs. process-pool PDF page extraction.
+
+Run with ``python benchmarks/bench_extraction.py [pages] [workers]``.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.synthetic import write_synthetic_pdf  # noqa: E402
+from thedebator.retrieval.pdf import PDFIngestor  # noqa: E402
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else min(os.cpu_count() or 1, 8)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = write_synthetic_pdf(Path(tmp) / "synthetic.pdf", pages=pages, words_per_page=400)
+        ingestor = PDFIngestor(pdf_path)
+
+        start = time.perf_counter()
+        serial = ingestor.read_pages()
+        serial_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = ingestor.read_pages(workers=workers)
+        parallel_s = time.perf_counter() - start
+
+    assert parallel == serial, "parallel extraction diverged from serial output"
+    print(f"pages={pages} workers={workers}")
+    print(f"serial   {serial_s:8.3f}s")
+    print(f"parallel {parallel_s:8.3f}s  ({serial_s / parallel_s:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark the per-token cost of streaming debate output.
+
+Run with ``python benchmarks/bench_render.py``. A ``FakeBackend`` streams a
+reply instantly into a log file, once writing and flushing every token (the
+old ``print(..., flush=True)`` loop) and once through ``TokenRenderer``, which
+writes time- or size-bounded frames. The difference is pure output overhead.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, TextIO
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from thedebator.backends import FakeBackend  # noqa: E402
+from thedebator.render import TokenRenderer  # noqa: E402
+
+TOKEN_COUNTS = (1_000, 10_000, 50_000)
+
+
+def _per_token_flush(tokens, stream: TextIO) -> None:
+    for token in tokens:
+        print(token, end="", flush=True, file=stream)
+        stream.flush()
+
+
+def _framed(tokens, stream: TextIO) -> None:
+    renderer = TokenRenderer(stream)
+    for token in tokens:
+        renderer.write(token)
+    renderer.flush()
+
+
+def time_render(token_count: int, repeats: int = 3) -> Dict[str, float]:
+    """Best-of-``repeats`` microseconds per token for each way of writing the stream."""
+    backend = FakeBackend(response_tokens=token_count)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, render in (("flush", _per_token_flush), ("framed", _framed)):
+            best = float("inf")
+            for _ in range(repeats):
+                with (Path(tmp) / f"{name}.log").open("w", encoding="utf-8") as stream:
+                    start = time.perf_counter()
+                    render(backend.generate_stream("What is the main contribution?"), stream)
+                    best = min(best, time.perf_counter() - start)
+            results[f"{name}_per_token_us"] = best / token_count * 1e6
+    return results
+
+
+def main() -> None:
+    print(f"{'tokens':>7} {'flush us/tok':>13} {'framed us/tok':>14} {'speed-up':>9}")
+    for tokens in TOKEN_COUNTS:
+        result = time_render(tokens)
+        flushed, framed = result["flush_per_token_us"], result["framed_per_token_us"]
+        print(f"{tokens:>7} {flushed:>13.2f} {framed:>14.2f} {flushed / framed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
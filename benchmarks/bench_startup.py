@@ -0,0 +1,76 @@
+"""Benchmark CLI startup: how long importing each entry point takes.
+
+Run with ``python benchmarks/bench_startup.py``. Each module is imported in a
+fresh interpreter under ``python -X importtime``. The script reports the
+cumulative import time and the slowest packages it pulled in, and flags any
+heavy dependency that was loaded eagerly.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+MODULES = ("thedebator.cli", "thedebator.conversation", "thedebator.retrieval", "thedebator.backends")
+# Loaded only by the commands that need them; never by a bare ``import``.
+HEAVY = ("chromadb", "ollama", "httpx", "PyPDF2", "numpy", "tokenizers")
+REPEATS = 5
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float]]:
+    """Import ``module`` in a new interpreter.
+
+    Returns its cumulative seconds and, for every other top-level package it
+    pulled in, the cumulative seconds of that package's outermost import.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages: Dict[str, float] = {}
+    total = 0.0
+    for match in _LINE.finditer(result.stderr):
+        cumulative = int(match.group(2)) / 1e6
+        name = match.group(3)
+        if name == module:
+            total = cumulative
+        root = name.split(".")[0]
+        if root not in ("thedebator", "site", "encodings"):
+            packages[root] = max(packages.get(root, 0.0), cumulative)
+    return total, packages
+
+
+def loaded_heavy(module: str) -> List[str]:
+    """Heavy dependencies that ``import module`` loads."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main() -> None:
+    print(f"{'module':<26} {'import ms':>10}  slowest packages")
+    for module in MODULES:
+        profiles = [import_profile(module) for _ in range(REPEATS)]
+        total, packages = min(profiles, key=lambda profile: profile[0])
+        slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:3]
+        detail = ", ".join(f"{name} {seconds * 1e3:.0f}" for name, seconds in slowest)
+        print(f"{module:<26} {total * 1e3:>10.1f}  {detail}")
+        heavy = loaded_heavy(module)
+        if heavy:
+            print(f"{'':<26} {'':>10}  eagerly loads: {', '.join(heavy)}")
+
+
+if __name__ == "__main__":
+    main()
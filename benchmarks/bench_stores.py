@@ -0,0 +1,73 @@
+"""Benchmark Chroma against the in-process NumPy index.
+
+Run with ``python benchmarks/bench_stores.py [chunks]``. Both stores use the
+offline hashing embedder so only index overhead is measured. "load" is the
+time to open a persisted store and answer the first query, which is what a
+``debate`` run pays at startup.
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.synthetic import synthetic_page_text  # noqa: E402
+from thedebator.backends.embedder import HashingEmbedder  # noqa: E402
+from thedebator.retrieval import NumpyVectorStore, VectorStore  # noqa: E402
+from thedebator.retrieval.types import DocumentChunk, content_chunk_id  # noqa: E402
+
+QUERIES = 50
+
+
+def make_chunks(count: int):
+    chunks = []
+    for i in range(count):
+        text = f"chunk {i} " + synthetic_page_text(i, words=120)
+        chunks.append(DocumentChunk(chunk_id=content_chunk_id(text, i, i), content=text, page=i // 4 + 1))
+    return chunks
+
+
+def bench(store_type, directory: Path, chunks) -> dict:
+    def open_store():
+        return store_type(directory, embedder=HashingEmbedder(), cache_embeddings=False)
+
+    store = open_store()
+    for start in range(0, len(chunks), 500):
+        store.upsert(chunks[start : start + 500])
+    store.flush()
+    del store
+
+    start = time.perf_counter()
+    store = open_store()
+    store.similarity_search("attention layer results", k=5)
+    load_s = time.perf_counter() - start
+
+    latencies = []
+    for i in range(QUERIES):
+        query = synthetic_page_text(i * 13, words=12)
+        start = time.perf_counter()
+        store.similarity_search(query, k=5)
+        latencies.append(time.perf_counter() - start)
+    return {"load_ms": load_s * 1e3, "p50_ms": statistics.median(latencies) * 1e3}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    chunks = make_chunks(count)
+    print(f"chunks={count} queries={QUERIES}")
+    print(f"{'store':>8} {'load ms':>9} {'query p50 ms':>13}")
+    for name, store_type in (("chroma", VectorStore), ("numpy", NumpyVectorStore)):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = bench(store_type, Path(tmp), chunks)
+        print(f"{name:>8} {result['load_ms']:>9.1f} {result['p50_ms']:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
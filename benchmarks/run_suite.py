@@ -0,0 +1,279 @@
+"""Run the benchmark suite and write machine-readable results.
+
+Run with ``python benchmarks/run_suite.py [--quick] [--output FILE]``.
+Covers:
+
+- ingest: throughput against document size, for synthetic PDFs through
+  extraction, chunking, hashing embeddings and the NumPy store.
+- retrieval: dense and hybrid query latency against chunk count.
+- startup: import time of the CLI entry point (see ``bench_startup.py``).
+- debate: orchestration overhead per round. ``FakeBackend`` answers
+  instantly, so all measured time is our own code.
+- render: per-token cost of streaming output to a file (see ``bench_render.py``).
+
+Results are a JSON document with one record per (benchmark, params). Pass
+``--baseline`` with an earlier results file to flag metrics that got worse
+by more than ``--tolerance``; the exit status is 1 if any did.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.bench_render import time_render  # noqa: E402
+from benchmarks.bench_startup import import_profile  # noqa: E402
+from benchmarks.synthetic import synthetic_page_text, write_synthetic_pdf  # noqa: E402
+from thedebator import __version__  # noqa: E402
+from thedebator.agents import ExplainerAgent, ReviewerAgent  # noqa: E402
+from thedebator.backends import FakeBackend, HashingEmbedder  # noqa: E402
+from thedebator.conversation import Conversation  # noqa: E402
+from thedebator.metrics import Metrics  # noqa: E402
+from thedebator.retrieval import BM25Index, HybridRetriever, NumpyVectorStore, PDFIngestor, ingest_stream  # noqa: E402
+from thedebator.retrieval.types import DocumentChunk, content_chunk_id  # noqa: E402
+
+SCHEMA_VERSION = 1
+QUERIES = 50
+
+SIZES = {
+    "full": {
+        "ingest_pages": (25, 100, 400),
+        "retrieval_chunks": (1_000, 5_000, 20_000),
+        "debate_rounds": (1, 3, 6),
+        "render_tokens": (10_000, 50_000),
+    },
+    "quick": {
+        "ingest_pages": (5, 20),
+        "retrieval_chunks": (200, 1_000),
+        "debate_rounds": (1, 2),
+        "render_tokens": (2_000,),
+    },
+}
+
+
+def _record(benchmark: str, params: Dict[str, Any], metrics: Dict[str, float]) -> Dict[str, Any]:
+    return {"benchmark": benchmark, "params": params, "metrics": metrics}
+
+
+def _store(directory: Path, **kwargs) -> NumpyVectorStore:
+    return NumpyVectorStore(directory, embedder=HashingEmbedder(), cache_embeddings=False, **kwargs)
+
+
+def bench_ingest(page_counts) -> List[Dict[str, Any]]:
+    records = []
+    for pages in page_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = write_synthetic_pdf(Path(tmp) / "paper.pdf", pages=pages, words_per_page=400)
+            metrics = Metrics()
+            store = _store(Path(tmp) / "store", metrics=metrics)
+            start = time.perf_counter()
+            stats = ingest_stream(
+                PDFIngestor(pdf).iter_pages(),
+                store,
+                chunk_size=800,
+                chunk_overlap=200,
+                lexical_index=BM25Index(Path(tmp) / "store" / "debate.bm25.npz"),
+                metrics=metrics,
+            )
+            elapsed = time.perf_counter() - start
+        result = {
+            "seconds_s": elapsed,
+            "pages_per_s": pages / elapsed,
+            "chunks_per_s": stats.chunks / elapsed,
+            "chunks": stats.chunks,
+        }
+        result.update({f"{name}_s": stats_.total for name, stats_ in metrics.timers.items()})
+        records.append(_record("ingest", {"pages": pages}, result))
+    return records
+
+
+def _percentile_ms(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1e3
+
+
+def bench_retrieval(chunk_counts) -> List[Dict[str, Any]]:
+    records = []
+    queries = [synthetic_page_text(i * 13, words=12) for i in range(QUERIES)]
+    for count in chunk_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = _store(Path(tmp), query_cache_size=0)
+            index = BM25Index(Path(tmp) / "debate.bm25.npz")
+            chunks = []
+            for i in range(count):
+                text = f"chunk {i} " + synthetic_page_text(i, words=120)
+                chunks.append(DocumentChunk(chunk_id=content_chunk_id(text, i, i), content=text, page=i // 4 + 1))
+                index.add(chunks[-1])
+            for start in range(0, count, 500):
+                store.upsert(chunks[start : start + 500])
+            store.flush()
+            index.build()
+
+            result: Dict[str, float] = {}
+            for name, retriever in (("dense", store), ("hybrid", HybridRetriever(store, index))):
+                latencies = []
+                for query in queries:
+                    start = time.perf_counter()
+                    retriever.similarity_search(query, k=5)
+                    latencies.append(time.perf_counter() - start)
+                result[f"{name}_p50_ms"] = statistics.median(latencies) * 1e3
+                result[f"{name}_p95_ms"] = _percentile_ms(latencies, 0.95)
+        records.append(_record("retrieval", {"chunks": count}, result))
+    return records
+
+
+def bench_debate(round_counts) -> List[Dict[str, Any]]:
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(Path(tmp))
+        store.upsert(
+            DocumentChunk(chunk_id=f"c{i}", content=synthetic_page_text(i, words=150), page=i + 1) for i in range(200)
+        )
+        store.flush()
+        for rounds in round_counts:
+            backend = FakeBackend(response_tokens=200)
+            conversation = Conversation(
+                explainer=ExplainerAgent(backend=backend),
+                reviewer=ReviewerAgent(backend=backend),
+                rounds=rounds,
+                store=store,
+                top_k=5,
+            )
+            start = time.perf_counter()
+            conversation.run("What is the main contribution of the attention model?")
+            elapsed = time.perf_counter() - start
+            metrics = conversation.metrics
+            records.append(
+                _record(
+                    "debate",
+                    {"rounds": rounds, "response_tokens": 200},
+                    {
+                        "seconds_s": elapsed,
+                        "overhead_per_round_ms": elapsed / rounds * 1e3,
+                        "retrieval_s": metrics.total("retrieval"),
+                        "retrieval_wait_s": metrics.total("retrieval_wait"),
+                        "generation_s": metrics.total("generation"),
+                    },
+                )
+            )
+    return records
+
+
+def bench_render(token_counts) -> List[Dict[str, Any]]:
+    return [_record("render", {"tokens": tokens}, time_render(tokens)) for tokens in token_counts]
+
+
+def bench_startup() -> List[Dict[str, Any]]:
+    seconds = min(import_profile("thedebator.cli")[0] for _ in range(3))
+    return [_record("startup", {"module": "thedebator.cli"}, {"import_ms": seconds * 1e3})]
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "version": __version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_suite(quick: bool = False) -> Dict[str, Any]:
+    sizes = SIZES["quick" if quick else "full"]
+    results = [
+        *bench_startup(),
+        *bench_ingest(sizes["ingest_pages"]),
+        *bench_retrieval(sizes["retrieval_chunks"]),
+        *bench_debate(sizes["debate_rounds"]),
+        *bench_render(sizes["render_tokens"]),
+    ]
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "quick": quick,
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def _lower_is_better(metric: str) -> bool | None:
+    if metric.endswith("_per_s"):
+        return False
+    if metric.endswith(("_s", "_ms", "_us")):
+        return True
+    return None  # counts and sizes are not performance figures
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Describe every metric in ``current`` that is worse than ``baseline`` by more than ``tolerance``."""
+
+    def key(record):
+        return record["benchmark"], json.dumps(record["params"], sort_keys=True)
+
+    previous = {key(record): record["metrics"] for record in baseline.get("results", [])}
+    regressions = []
+    for record in current["results"]:
+        old = previous.get(key(record))
+        if old is None:
+            continue
+        for metric, value in record["metrics"].items():
+            lower = _lower_is_better(metric)
+            before = old.get(metric)
+            if lower is None or not before:
+                continue
+            change = (value - before) / before if lower else (before - value) / before
+            if change > tolerance:
+                regressions.append(
+                    f"{record['benchmark']} {record['params']} {metric}: {before:.4g} -> {value:.4g} ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Small sizes, for CI smoke runs")
+    parser.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = run_suite(quick=args.quick)
+    output = args.output or ROOT / "benchmarks" / "results" / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    for record in results["results"]:
+        figures = ", ".join(f"{name}={value:.4g}" for name, value in sorted(record["metrics"].items()))
+        print(f"{record['benchmark']:<10} {json.dumps(record['params'])}: {figures}")
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Synthetic PDF generation for benchmarks and tests.
+
+Writes minimal, valid PDFs with one text stream per page so the real
+``PyPDF2`` extraction path can be exercised without sample papers.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+
+VOCABULARY = (
+    "attention model layer results table figure loss gradient dataset baseline "
+    "transformer encoder decoder token embedding accuracy ablation variance"
+).split()
+
+
+def synthetic_page_text(page: int, words: int = 300) -> str:
+    """Return deterministic page text that differs from page to page."""
+    size = len(VOCABULARY)
+    return " ".join(VOCABULARY[(page * 31 + i * 7) % size] for i in range(words))
+
+
+def write_pdf(path: Path, pages: Iterable[str]) -> Path:
+    """Write ``pages`` (one string per page) to a minimal PDF at ``path``."""
+    objects: List[bytes] = []
+    page_ids: List[int] = []
+
+    # 1: catalog, 2: page tree, 3: font; pages and content streams follow.
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(b"")  # page tree, filled in once page ids are known
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for text in pages:
+        lines = _wrap(text, 90)
+        ops = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        for line in lines:
+            ops.append(f"({_escape(line)}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids).encode("ascii")
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    path = Path(path)
+    path.write_bytes(bytes(out))
+    return path
+
+
+def write_synthetic_pdf(path: Path, pages: int, words_per_page: int = 300) -> Path:
+    """Write a ``pages``-page PDF of deterministic filler text."""
+    return write_pdf(path, (synthetic_page_text(p, words_per_page) for p in range(1, pages + 1)))
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    lines: List[str] = []
+    current: List[str] = []
+    length = 0
+    for word in text.split():
+        if current and length + len(word) + 1 > width:
+            lines.append(" ".join(current))
+            current, length = [], 0
+        current.append(word)
+        length += len(word) + 1
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
@@ -1,10 +1,11 @@
 """Base agent abstraction."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List
 
-from thedebator.backends import Backend
+from thedebator.backends import AsyncBackend, Backend
 
 
 @dataclass
@@ -19,10 +20,21 @@ class Agent(ABC):
         """Return the system prompt describing the agent."""
         raise NotImplementedError
 
-    def respond(self, message: str, context: str = "", history: List[str] | None = None) -> str:
+    def build_prompt(self, message: str, context: str = "") -> str:
+        """Combine system prompt, retrieved context and the incoming message."""
         parts = [self.system_prompt()]
         if context:
             parts.append("Context:\n" + context)
         parts.append("Message:\n" + message)
-        prompt = "\n\n".join(parts)
+        return "\n\n".join(parts)
+
+    def respond(self, message: str, context: str = "", history: List[str] | None = None) -> str:
+        prompt = self.build_prompt(message, context)
         return self.backend.generate(prompt, history=history)
+
+    async def arespond(self, message: str, context: str = "", history: List[str] | None = None) -> str:
+        """Async ``respond``; blocking backends run in a worker thread."""
+        prompt = self.build_prompt(message, context)
+        if isinstance(self.backend, AsyncBackend):
+            return await self.backend.agenerate(prompt, history=history)
+        return await asyncio.to_thread(self.backend.generate, prompt, history)
@@ -6,12 +6,23 @@ from .agent import Agent
 
 
 class ReviewerAgent(Agent):
-    """Challenges claims and requests evidence."""
+    """Challenges claims and requests evidence.
 
-    def __init__(self, backend: Backend) -> None:
-        super().__init__(name="Reviewer B", backend=backend)
+    A reviewer with a ``focus`` is one of a panel of specialists (see
+    ``Conversation.panel``) and concentrates its critique on that aspect.
+    """
+
+    def __init__(self, backend: Backend, name: str = "Reviewer B", focus: str = "") -> None:
+        super().__init__(name=name, backend=backend)
+        self.focus = focus
 
     def system_prompt(self) -> str:
+        if self.focus:
+            return (
+                f"You are {self.name}, one reviewer on a panel. Critically evaluate Explainer A's claims "
+                f"with a focus on {self.focus}, leaving other aspects to the other reviewers. Demand evidence, "
+                "highlight weak arguments and ensure every assertion is grounded and cited as [p.X]."
+            )
         return (
             "You are Reviewer B. Critically evaluate Explainer A's claims, demanding evidence and citations. "
             "Highlight weak arguments and ensure every assertion is grounded and cited as [p.X]."
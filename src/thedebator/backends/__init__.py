@@ -1,9 +1,51 @@
-"""Model backends."""
+"""Model backends.
 
-from .base import Backend
-from .ollama import OllamaBackend
+Embedders need NumPy, ``OllamaBackend`` needs the ollama client and the
+response cache needs SQLite, so those are imported on first attribute access
+rather than with the package.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .base import AsyncBackend, Backend, GenerationStats
+from .fake import FakeBackend
+
+if TYPE_CHECKING:
+    from .embedder import ChromaDefaultEmbedder, Embedder, HashingEmbedder
+    from .ollama import OllamaBackend
+    from .response_cache import CachedBackend, ResponseCache
+
+_LAZY = {
+    "CachedBackend": ".response_cache",
+    "ChromaDefaultEmbedder": ".embedder",
+    "Embedder": ".embedder",
+    "HashingEmbedder": ".embedder",
+    "OllamaBackend": ".ollama",
+    "ResponseCache": ".response_cache",
+}
 
 __all__ = [
+    "AsyncBackend",
     "Backend",
+    "CachedBackend",
+    "ChromaDefaultEmbedder",
+    "Embedder",
+    "FakeBackend",
+    "GenerationStats",
+    "HashingEmbedder",
     "OllamaBackend",
+    "ResponseCache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
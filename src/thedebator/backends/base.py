@@ -1,7 +1,23 @@
 """Backend abstraction for language models."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from typing import AsyncIterator, List
+
+
+@dataclass
+class GenerationStats:
+    """Token counts and timings reported for one generation call."""
+
+    prompt_tokens: int = 0
+    prompt_seconds: float = 0.0
+    eval_tokens: int = 0
+    eval_seconds: float = 0.0
+    reused_context: bool = False
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.eval_tokens / max(self.eval_seconds, 0.001)
 
 
 class Backend(ABC):
@@ -11,3 +27,17 @@ class Backend(ABC):
     def generate(self, prompt: str, history: List[str] | None = None) -> str:
         """Generate a response given a prompt and optional history."""
         raise NotImplementedError
+
+
+class AsyncBackend(ABC):
+    """Language model backend that can be awaited without blocking the event loop."""
+
+    @abstractmethod
+    async def agenerate(self, prompt: str, history: List[str] | None = None) -> str:
+        """Generate a complete response given a prompt and optional history."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def astream(self, prompt: str, history: List[str] | None = None) -> AsyncIterator[str]:
+        """Yield response tokens as they are generated."""
+        raise NotImplementedError
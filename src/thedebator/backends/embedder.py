@@ -0,0 +1,94 @@
+"""Embedding backends used by the retrieval layer."""
+
+import re
+import zlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class Embedder(ABC):
+    """Turn texts into fixed-size float32 vectors in batches.
+
+    Subclasses implement ``_embed_batch``; ``embed`` splits the input into
+    ``batch_size`` slices and, with ``threads > 1``, encodes them concurrently.
+    """
+
+    name: str = "embedder"
+
+    def __init__(self, batch_size: int = 64, threads: int = 1) -> None:
+        self.batch_size = max(batch_size, 1)
+        self.threads = max(threads, 1)
+
+    @abstractmethod
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed one batch and return an ``(len(texts), dim)`` array."""
+        raise NotImplementedError
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed ``texts`` and return a contiguous ``(len(texts), dim)`` float32 array."""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        if self.threads > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                results = list(executor.map(self._embed_batch, batches))
+        else:
+            results = [self._embed_batch(batch) for batch in batches]
+        return np.ascontiguousarray(np.vstack(results), dtype=np.float32)
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        return self.embed(texts)
+
+
+class HashingEmbedder(Embedder):
+    """Deterministic offline embedder using the hashing trick.
+
+    Tokens are hashed into ``dimension`` signed buckets with sublinear term
+    frequency and the result is L2-normalised, so cosine similarity reflects
+    word overlap. Needs no model download, which makes it suitable for tests
+    and air-gapped machines.
+    """
+
+    def __init__(self, dimension: int = 384, batch_size: int = 256, threads: int = 1) -> None:
+        super().__init__(batch_size=batch_size, threads=threads)
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        signs: List[float] = []
+        for row, text in enumerate(texts):
+            for token in _TOKEN_RE.findall(text.lower()):
+                digest = zlib.crc32(token.encode("utf-8"))
+                rows.append(row)
+                cols.append(digest % self.dimension)
+                signs.append(1.0 if digest & 0x80000000 else -1.0)
+
+        counts = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), signs)
+        vectors = np.sign(counts) * np.log1p(np.abs(counts))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class ChromaDefaultEmbedder(Embedder):
+    """Chroma's bundled ONNX ``all-MiniLM-L6-v2`` sentence embedder."""
+
+    name = "all-MiniLM-L6-v2"
+
+    def __init__(self, batch_size: int = 64, threads: int = 1) -> None:
+        super().__init__(batch_size=batch_size, threads=threads)
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+        self._function = DefaultEmbeddingFunction()
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self._function(texts), dtype=np.float32)
@@ -0,0 +1,94 @@
+"""Deterministic stand-in for a language model, for tests and benchmarks."""
+
+import asyncio
+import random
+import time
+import zlib
+from typing import Any, AsyncIterator, Dict, Generator, List, Sequence
+
+from .base import AsyncBackend, Backend, GenerationStats
+
+_VOCABULARY = (
+    "the model attention layer results table figure loss training data baseline accuracy "
+    "method evaluation dataset improvement transformer encoder decoder ablation claim evidence"
+).split()
+
+
+class FakeBackend(Backend, AsyncBackend):
+    """Emit a reproducible reply with a fixed latency and token rate.
+
+    The reply depends only on ``seed`` and the prompt. Before the first token
+    the backend waits ``latency`` seconds, standing in for model load and prompt
+    evaluation. Tokens then arrive at ``tokens_per_second``; ``None`` means
+    instantly. ``last_stats`` is reported like ``OllamaBackend`` does, so
+    timings from this backend show up in turn metrics too.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        tokens_per_second: float | None = None,
+        response_tokens: int = 64,
+        seed: int = 0,
+        vocabulary: Sequence[str] = _VOCABULARY,
+    ) -> None:
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.seed = seed
+        self.vocabulary = list(vocabulary)
+        self.model = "fake"
+        self.calls = 0
+        self.last_stats: GenerationStats | None = None
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        return {"seed": self.seed, "response_tokens": self.response_tokens}
+
+    def generate(self, prompt: str, history: List[str] | None = None) -> str:
+        return "".join(self.generate_stream(prompt, history))
+
+    def generate_stream(
+        self, prompt: str, history: List[str] | None = None
+    ) -> Generator[str, None, None]:
+        tokens = self._start(prompt)
+        time.sleep(self.latency)
+        for token in tokens:
+            if self.tokens_per_second:
+                time.sleep(1.0 / self.tokens_per_second)
+            yield token
+        self._finish(prompt, tokens)
+
+    async def agenerate(self, prompt: str, history: List[str] | None = None) -> str:
+        return "".join([token async for token in self.astream(prompt, history)])
+
+    async def astream(self, prompt: str, history: List[str] | None = None) -> AsyncIterator[str]:
+        tokens = self._start(prompt)
+        await asyncio.sleep(self.latency)
+        for token in tokens:
+            if self.tokens_per_second:
+                await asyncio.sleep(1.0 / self.tokens_per_second)
+            yield token
+        self._finish(prompt, tokens)
+
+    def reply(self, prompt: str) -> List[str]:
+        """The tokens this backend answers ``prompt`` with."""
+        rng = random.Random(self.seed * 1_000_003 + zlib.crc32(prompt.encode("utf-8")))
+        tokens = []
+        for i in range(self.response_tokens):
+            word = rng.choice(self.vocabulary)
+            end_of_sentence = i % 12 == 11 or i == self.response_tokens - 1
+            tokens.append(word + (". " if end_of_sentence else " "))
+        return tokens
+
+    def _start(self, prompt: str) -> List[str]:
+        self.calls += 1
+        return self.reply(prompt)
+
+    def _finish(self, prompt: str, tokens: List[str]) -> None:
+        self.last_stats = GenerationStats(
+            prompt_tokens=max(1, len(prompt) // 4),
+            prompt_seconds=self.latency,
+            eval_tokens=len(tokens),
+            eval_seconds=len(tokens) / self.tokens_per_second if self.tokens_per_second else 0.0,
+        )
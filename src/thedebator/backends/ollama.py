@@ -1,83 +1,314 @@
 """Ollama backend implementation."""
 
-from typing import Generator, List
+import asyncio
+import itertools
+import logging
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Dict, Generator, Iterator, List, Tuple, TypeVar
 
+import httpx
 import ollama
 
-from .base import Backend
+from thedebator.history import TokenCounter, trim_history
 
+from .base import AsyncBackend, Backend, GenerationStats
 
-class OllamaBackend(Backend):
-    """Generate responses using a local Ollama model."""
+logger = logging.getLogger(__name__)
 
-    def __init__(self, model: str, max_history_tokens: int = 2000) -> None:
+# Explicit context window requested from Ollama.
+NUM_CTX = 4096
+# Share of the window a reused session may fill before it is rebuilt from trimmed history.
+_CONTEXT_FILL = 0.75
+# HTTP statuses worth retrying: overloaded or restarting server.
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+T = TypeVar("T")
+
+_ClientKey = Tuple[str | None, float | None]
+_clients: Dict[_ClientKey, ollama.Client] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, ollama.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def shared_client(host: str | None = None, timeout: float | None = None) -> ollama.Client:
+    """Return the process-wide client for ``host``, reusing its pooled keep-alive connections."""
+    with _clients_lock:
+        client = _clients.get((host, timeout))
+        if client is None:
+            client = _clients[(host, timeout)] = ollama.Client(host=host, timeout=timeout)
+        return client
+
+
+def shared_async_client(host: str | None = None, timeout: float | None = None) -> ollama.AsyncClient:
+    """Like ``shared_client`` for the running event loop (httpx async clients are loop-bound)."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get((host, timeout))
+        if client is None:
+            client = clients[(host, timeout)] = ollama.AsyncClient(host=host, timeout=timeout)
+        return client
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, ollama.ResponseError):
+        return error.status_code in _RETRY_STATUSES
+    return isinstance(error, (ConnectionError, httpx.TransportError))
+
+
+class OllamaBackend(Backend, AsyncBackend):
+    """Generate responses using a local Ollama model.
+
+    Supports blocking (``generate``/``generate_stream``) and asyncio
+    (``agenerate``/``astream``) use. ``host`` defaults to the Ollama client's
+    own default (``OLLAMA_HOST`` or ``http://localhost:11434``).
+
+    With ``reuse_context`` the backend behaves as one agent's session: it
+    keeps the ``context`` tokens Ollama returns and, on the next turn, sends
+    only the history added since then plus the new prompt, so the server does
+    not re-evaluate the earlier prefix. The session is rebuilt from trimmed
+    history when it would overflow the context window or the history does not
+    continue it. Use one backend per agent and per conversation.
+
+    Backends for the same host share one pooled HTTP client. Every request
+    asks the server to keep the model loaded for ``keep_alive``; connection
+    errors and overloaded-server responses are retried ``retries`` times with
+    exponential backoff before any token has been produced.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        max_history_tokens: int = 2000,
+        host: str | None = None,
+        reuse_context: bool = True,
+        keep_alive: float | str | None = "30m",
+        timeout: float | None = 300.0,
+        retries: int = 2,
+        retry_backoff: float = 0.5,
+        token_counter: TokenCounter | None = None,
+    ) -> None:
         self.model = model
         self.max_history_tokens = max_history_tokens
+        self.host = host
+        self.reuse_context = reuse_context
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.retries = max(retries, 0)
+        self.retry_backoff = retry_backoff
+        self.token_counter = token_counter or TokenCounter()
+        self.last_stats: GenerationStats | None = None
+        self.stats: List[GenerationStats] = []
+        self._client = shared_client(host, timeout)
+        self._context: List[int] | None = None
+        self._last_turn: str | None = None
+        self._last_response = ""
 
-    def generate(self, prompt: str, history: List[str] | None = None) -> str:
-        """Generate a complete response with token budget management."""
-        # Take only recent history to prevent token overflow
-        history_blocks = ""
-        if history:
-            # Estimate ~4 chars per token, keep last N turns within budget
-            char_budget = self.max_history_tokens * 4
-            recent = []
-            char_count = 0
-            for turn in reversed(history):
-                if char_count + len(turn) > char_budget:
-                    break
-                recent.insert(0, turn)
-                char_count += len(turn)
-            history_blocks = "\n\n".join(recent)
-
-        full_prompt = f"{history_blocks}\n\n{prompt}" if history_blocks else prompt
-
-        response = ollama.generate(
-            model=self.model,
-            prompt=full_prompt,
-            options={
-                "num_ctx": 4096,  # explicit context window
-                "num_gpu": 1,  # force Metal acceleration on M2
-            },
-        )
+    def reset_session(self) -> None:
+        """Forget the cached context; the next call sends the full trimmed history."""
+        self._context = None
+        self._last_turn = None
+        self._last_response = ""
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """Settings that, with the prompt and history, determine what the model is asked."""
+        return {
+            "num_ctx": NUM_CTX,
+            "max_history_tokens": self.max_history_tokens,
+            "reuse_context": self.reuse_context,
+        }
+
+    @property
+    def has_session(self) -> bool:
+        """Whether the next call may continue the cached context (and the prompts in it)."""
+        return self.reuse_context and self._context is not None
 
-        # Log token metrics for debugging
-        if "eval_count" in response:
-            eval_count = response.get("eval_count", 0)
-            eval_duration = response.get("eval_duration", 1) / 1e9  # nanoseconds to seconds
-            tokens_per_sec = eval_count / max(eval_duration, 0.001)
-            print(f"[{self.model}] Generated {eval_count} tokens @ {tokens_per_sec:.1f} tok/s")
+    def will_continue(self, prompt: str, history: List[str] | None = None) -> bool:
+        """Whether a call with ``prompt`` and ``history`` would continue the session rather than rebuild it."""
+        return self._session_suffix(prompt, history or []) is not None
 
+    def warm(self) -> None:
+        """Load the model on the server now so the first turn does not pay for it."""
+        self._retry(lambda: self._client.generate(model=self.model, prompt="", keep_alive=self.keep_alive))
+
+    async def awarm(self) -> None:
+        await self._aretry(
+            lambda: self._aclient().generate(model=self.model, prompt="", keep_alive=self.keep_alive)
+        )
+
+    def generate(self, prompt: str, history: List[str] | None = None) -> str:
+        """Generate a complete response with token budget management."""
+        request = self._request(prompt, history)
+        response = self._retry(lambda: self._client.generate(**request))
+        self._finish(request, history, response, response["response"])
         return response["response"]
 
     def generate_stream(
         self, prompt: str, history: List[str] | None = None
     ) -> Generator[str, None, None]:
         """Stream tokens as they're generated for real-time output."""
-        history_blocks = ""
-        if history:
-            char_budget = self.max_history_tokens * 4
-            recent = []
-            char_count = 0
-            for turn in reversed(history):
-                if char_count + len(turn) > char_budget:
-                    break
-                recent.insert(0, turn)
-                char_count += len(turn)
-            history_blocks = "\n\n".join(recent)
-
-        full_prompt = f"{history_blocks}\n\n{prompt}" if history_blocks else prompt
-
-        stream = ollama.generate(
-            model=self.model,
-            prompt=full_prompt,
-            stream=True,
-            options={
-                "num_ctx": 4096,
-                "num_gpu": 1,
-            },
-        )
+        request = self._request(prompt, history)
+        stream = self._retry(lambda: _prime(self._client.generate(**request, stream=True)))
 
+        parts: List[str] = []
         for chunk in stream:
             if "response" in chunk:
+                parts.append(chunk["response"])
                 yield chunk["response"]
+            if chunk.get("done"):
+                self._finish(request, history, chunk, "".join(parts))
+
+    async def agenerate(self, prompt: str, history: List[str] | None = None) -> str:
+        """Generate a complete response without blocking the event loop."""
+        request = self._request(prompt, history)
+        response = await self._aretry(lambda: self._aclient().generate(**request))
+        self._finish(request, history, response, response["response"])
+        return response["response"]
+
+    async def astream(self, prompt: str, history: List[str] | None = None) -> AsyncIterator[str]:
+        """Yield tokens as they're generated without blocking the event loop."""
+        request = self._request(prompt, history)
+        stream = await self._aretry(
+            lambda: _aprime(self._aclient().generate(**request, stream=True))
+        )
+
+        parts: List[str] = []
+        async for chunk in stream:
+            if "response" in chunk:
+                parts.append(chunk["response"])
+                yield chunk["response"]
+            if chunk.get("done"):
+                self._finish(request, history, chunk, "".join(parts))
+
+    def _aclient(self) -> ollama.AsyncClient:
+        return shared_async_client(self.host, self.timeout)
+
+    def _retry(self, call: Callable[[], T]) -> T:
+        for attempt in itertools.count():
+            try:
+                return call()
+            except Exception as error:
+                if attempt >= self.retries or not _is_retryable(error):
+                    raise
+                time.sleep(self.retry_backoff * 2**attempt)
+        raise AssertionError("unreachable")
+
+    async def _aretry(self, call: Callable[[], Any]) -> Any:
+        for attempt in itertools.count():
+            try:
+                return await call()
+            except Exception as error:
+                if attempt >= self.retries or not _is_retryable(error):
+                    raise
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+        raise AssertionError("unreachable")
+
+    def _request(self, prompt: str, history: List[str] | None) -> Dict[str, Any]:
+        history = history or []
+        request: Dict[str, Any] = {
+            "model": self.model,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "num_ctx": NUM_CTX,  # explicit context window
+                "num_gpu": 1,  # force Metal acceleration on M2
+            },
+        }
+
+        suffix = self._session_suffix(prompt, history)
+        if suffix is not None:
+            request["prompt"] = suffix
+            request["context"] = self._context
+            return request
+
+        self.reset_session()
+        history_blocks = "\n\n".join(trim_history(history, self.max_history_tokens, self.token_counter))
+        request["prompt"] = f"{history_blocks}\n\n{prompt}" if history_blocks else prompt
+        return request
+
+    def _session_suffix(self, prompt: str, history: List[str]) -> str | None:
+        """Text to send on top of the cached context, or ``None`` to start afresh."""
+        if not self.reuse_context or self._context is None:
+            return None
+        new_turns = self._turns_since_last_call(history)
+        if new_turns is None:
+            return None
+        # Our own last reply is already part of the cached context.
+        if new_turns and self._last_response and new_turns[0].rstrip().endswith(self._last_response):
+            new_turns = new_turns[1:]
+        suffix = "\n\n".join([*new_turns, prompt])
+        # Leave room for the reply.
+        if len(self._context) + self.token_counter.count(suffix) > NUM_CTX * _CONTEXT_FILL:
+            return None
+        return suffix
+
+    def _turns_since_last_call(self, history: List[str]) -> List[str] | None:
+        # History may be a sliding window, so find the newest turn seen last time
+        # rather than trusting list positions.
+        if self._last_turn is None:
+            return list(history)
+        for index in range(len(history) - 1, -1, -1):
+            if history[index] == self._last_turn:
+                return history[index + 1 :]
+        return None
+
+    def _finish(self, request: Dict[str, Any], history: List[str] | None, response: Any, text: str) -> None:
+        """Record timings and keep the returned context for the next turn."""
+        stats = GenerationStats(
+            prompt_tokens=int(response.get("prompt_eval_count") or 0),
+            prompt_seconds=(response.get("prompt_eval_duration") or 0) / 1e9,
+            eval_tokens=int(response.get("eval_count") or 0),
+            eval_seconds=(response.get("eval_duration") or 0) / 1e9,
+            reused_context="context" in request,
+        )
+        self.last_stats = stats
+        self.stats.append(stats)
+        if not stats.reused_context:
+            self.token_counter.calibrate(len(request["prompt"]), stats.prompt_tokens)
+
+        context = response.get("context")
+        if self.reuse_context and context:
+            self._context = list(context)
+            self._last_turn = history[-1] if history else None
+            self._last_response = text.strip()
+        else:
+            self.reset_session()
+        self._log_metrics(stats)
+
+    def _log_metrics(self, stats: GenerationStats) -> None:
+        # Structured per-turn figures are collected by the conversation (see thedebator.metrics).
+        if stats.eval_tokens:
+            logger.debug(
+                "[%s] generated %d tokens @ %.1f tok/s (prompt eval %d tokens in %.2fs, reused context: %s)",
+                self.model,
+                stats.eval_tokens,
+                stats.tokens_per_second,
+                stats.prompt_tokens,
+                stats.prompt_seconds,
+                stats.reused_context,
+            )
+
+
+def _prime(stream: Iterator[T]) -> Iterator[T]:
+    """Start a lazy stream so connection errors surface here, where they can be retried."""
+    first = next(stream, None)
+    return stream if first is None else itertools.chain([first], stream)
+
+
+async def _aprime(stream: Any) -> AsyncIterator[Any]:
+    stream = await stream
+    try:
+        first = await stream.__anext__()
+    except StopAsyncIteration:
+        return stream
+
+    async def chained():
+        yield first
+        async for item in stream:
+            yield item
+
+    return chained()
@@ -0,0 +1,141 @@
+"""Persistent response cache for model backends, backed by SQLite."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Generator, List, Optional
+
+from thedebator.metrics import CacheStats
+
+from .base import AsyncBackend, Backend, GenerationStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key BLOB PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created REAL NOT NULL
+);
+"""
+
+
+class ResponseCache:
+    """Map ``sha256(model, options, history, prompt)`` to a generated response.
+
+    Entries never expire: the cache is meant for deterministic re-runs and
+    replays, where the same request should always get the same answer. Safe to
+    share between threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def key(model: str, prompt: str, history: List[str] | None, options: Dict[str, Any]) -> bytes:
+        material = json.dumps([model, options, list(history or []), prompt], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return row[0]
+
+    def put(self, key: bytes, model: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created) VALUES (?, ?, ?, ?)",
+                (key, model, response, time.time()),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedBackend(Backend, AsyncBackend):
+    """Wrap a backend so a request seen before is answered from a ``ResponseCache``.
+
+    Requests are keyed by the inner backend's ``model`` and ``options`` plus
+    the prompt and history. A hit returns the stored text, in one piece when
+    streaming, without calling the inner backend. Since cached turns never
+    reach the model, the wrapper does not claim a model session, so prompts
+    always carry their full evidence and replays produce the same keys.
+    """
+
+    def __init__(self, inner: Backend, cache: ResponseCache) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.model = str(getattr(inner, "model", type(inner).__name__))
+        self.last_stats: GenerationStats | None = None
+
+    def generate(self, prompt: str, history: List[str] | None = None) -> str:
+        return "".join(self.generate_stream(prompt, history))
+
+    def generate_stream(
+        self, prompt: str, history: List[str] | None = None
+    ) -> Generator[str, None, None]:
+        key = self._key(prompt, history)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.last_stats = GenerationStats()
+            yield cached
+            return
+        if hasattr(self.inner, "generate_stream"):
+            parts = []
+            for token in self.inner.generate_stream(prompt, history):
+                parts.append(token)
+                yield token
+            response = "".join(parts)
+        else:
+            response = self.inner.generate(prompt, history=history)
+            yield response
+        self.last_stats = getattr(self.inner, "last_stats", None)
+        self.cache.put(key, self.model, response)
+
+    async def agenerate(self, prompt: str, history: List[str] | None = None) -> str:
+        return "".join([token async for token in self.astream(prompt, history)])
+
+    async def astream(self, prompt: str, history: List[str] | None = None) -> AsyncIterator[str]:
+        key = self._key(prompt, history)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            self.last_stats = GenerationStats()
+            yield cached
+            return
+        if isinstance(self.inner, AsyncBackend):
+            parts = []
+            async for token in self.inner.astream(prompt, history):
+                parts.append(token)
+                yield token
+            response = "".join(parts)
+        else:
+            response = await asyncio.to_thread(self.inner.generate, prompt, history)
+            yield response
+        self.last_stats = getattr(self.inner, "last_stats", None)
+        await asyncio.to_thread(self.cache.put, key, self.model, response)
+
+    def reset_session(self) -> None:
+        reset = getattr(self.inner, "reset_session", None)
+        if reset is not None:
+            reset()
+
+    def _key(self, prompt: str, history: List[str] | None) -> bytes:
+        return self.cache.key(self.model, prompt, history, dict(getattr(self.inner, "options", {})))
@@ -0,0 +1,100 @@
+"""Turn-by-turn debate checkpoints, so an interrupted debate can be resumed."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from thedebator.conversation import ConversationTurn
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    """Where the checkpoint of the debate written to ``output_path`` lives."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.checkpoint.jsonl")
+
+
+class TurnCheckpoint:
+    """Append-only JSON Lines file: a header naming the debate, then one line per turn.
+
+    Each turn is flushed and synced as soon as it is appended, so a crash
+    loses at most the turn being generated. Pass ``append`` as the
+    conversation's ``on_turn`` callback.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._file = None
+
+    @classmethod
+    def start(cls, path: Path, topic: str, rounds: int) -> "TurnCheckpoint":
+        """Begin a new checkpoint, replacing any earlier one at ``path``."""
+        checkpoint = cls(path)
+        checkpoint.path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint._file = checkpoint.path.open("w", encoding="utf-8")
+        checkpoint._write({"type": "debate", "topic": topic, "rounds": rounds})
+        return checkpoint
+
+    @classmethod
+    def resume(cls, path: Path) -> Tuple["TurnCheckpoint", Dict[str, Any], List[ConversationTurn]]:
+        """Open an existing checkpoint for appending; return it with its header and turns.
+
+        A partly written last line, left by a crash mid-write, is dropped.
+        """
+        checkpoint = cls(path)
+        header, turns, valid_bytes = checkpoint._read()
+        with checkpoint.path.open("r+b") as handle:
+            handle.truncate(valid_bytes)
+        checkpoint._file = checkpoint.path.open("a", encoding="utf-8")
+        return checkpoint, header, turns
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple[Dict[str, Any], List[ConversationTurn]]:
+        header, turns, _ = cls(path)._read()
+        return header, turns
+
+    def append(self, turn: ConversationTurn) -> None:
+        self._write(
+            {
+                "type": "turn",
+                "speaker": turn.speaker,
+                "message": turn.message,
+                "citations": turn.citations,
+                "metrics": turn.metrics,
+            }
+        )
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _read(self) -> Tuple[Dict[str, Any], List[ConversationTurn], int]:
+        header: Dict[str, Any] = {}
+        turns: List[ConversationTurn] = []
+        valid_bytes = 0
+        with self.path.open("rb") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                if record.get("type") == "debate":
+                    header = record
+                elif record.get("type") == "turn":
+                    turns.append(
+                        ConversationTurn(
+                            record["speaker"], record["message"], record.get("citations", []), record.get("metrics", {})
+                        )
+                    )
+                valid_bytes += len(line)
+        if not header:
+            raise ValueError(f"{self.path} is not a debate checkpoint")
+        return header, turns, valid_bytes
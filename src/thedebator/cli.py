@@ -1,14 +1,30 @@
 """Command-line interface for theDebator."""
 
+import asyncio
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 
 import click
 
 from thedebator.agents import ExplainerAgent, ReviewerAgent
-from thedebator.backends import OllamaBackend
+from thedebator.checkpoint import TurnCheckpoint, checkpoint_path
 from thedebator.config import AppConfig, load_config
-from thedebator.conversation import Conversation
-from thedebator.retrieval import PDFIngestor, VectorStore
+from thedebator.convergence import ConvergenceDetector, EarlyStop
+from thedebator.conversation import Conversation, ConversationTurn
+from thedebator.history import TokenCounter, load_tokenizer
+from thedebator.metrics import Metrics, turn_records, write_jsonl
+from thedebator.render import TranscriptWriter
+from thedebator.retrieval import Retriever
+
+# Stores, embedders, the PDF reader and the Ollama client are imported inside
+# the helpers that build them, so ``--help`` and commands that do not need
+# them start without loading chromadb, ollama, PyPDF2 or NumPy.
+if TYPE_CHECKING:
+    from thedebator.backends import Embedder, OllamaBackend, ResponseCache
+    from thedebator.retrieval import BaseVectorStore
 
 
 @click.group()
@@ -16,76 +32,535 @@ def cli() -> None:
     """Run theDebator CLI."""
 
 
+def _make_embedder(app_config: AppConfig) -> "Embedder":
+    from thedebator.backends import ChromaDefaultEmbedder, HashingEmbedder
+
+    embedding = app_config.embedding
+    if embedding.backend == "hashing":
+        return HashingEmbedder(
+            dimension=embedding.dimension, batch_size=embedding.batch_size, threads=embedding.threads
+        )
+    if embedding.backend == "default":
+        return ChromaDefaultEmbedder(batch_size=embedding.batch_size, threads=embedding.threads)
+    raise click.BadParameter(f"Unknown embedding backend '{embedding.backend}'", param_hint="embedding.backend")
+
+
+def _open_store(app_config: AppConfig, metrics: Metrics | None = None) -> "BaseVectorStore":
+    from thedebator.retrieval import NumpyVectorStore, VectorStore
+
+    retrieval = app_config.retrieval
+    store_types = {"chroma": VectorStore, "numpy": NumpyVectorStore}
+    if retrieval.store not in store_types:
+        raise click.BadParameter(f"Unknown vector store '{retrieval.store}'", param_hint="retrieval.store")
+    return store_types[retrieval.store](
+        Path(retrieval.persist_directory),
+        embedder=_make_embedder(app_config),
+        cache_embeddings=retrieval.embedding_cache,
+        embedding_cache_size=retrieval.embedding_cache_size,
+        query_cache_size=retrieval.query_cache_size,
+        metrics=metrics,
+    )
+
+
+def _make_token_counter(app_config: AppConfig) -> TokenCounter:
+    tokenizer_name = app_config.retrieval.tokenizer
+    tokenizer = load_tokenizer(tokenizer_name) if tokenizer_name else None
+    if tokenizer_name and tokenizer is None:
+        click.echo(f"Warning: tokenizer '{tokenizer_name}' unavailable, estimating token counts", err=True)
+    return TokenCounter(tokenizer)
+
+
+def _make_backend(
+    app_config: AppConfig, model: str, token_counter: TokenCounter | None = None
+) -> "OllamaBackend":
+    from thedebator.backends import OllamaBackend
+
+    ollama_config = app_config.ollama
+    return OllamaBackend(
+        model=model,
+        max_history_tokens=app_config.retrieval.max_history_tokens,
+        reuse_context=app_config.performance.reuse_context,
+        host=ollama_config.host,
+        keep_alive=ollama_config.keep_alive,
+        timeout=ollama_config.timeout,
+        retries=ollama_config.retries,
+        retry_backoff=ollama_config.retry_backoff,
+        token_counter=token_counter,
+    )
+
+
+def _make_agents(
+    app_config: AppConfig,
+    token_counter: TokenCounter | None = None,
+    response_cache: "ResponseCache | None" = None,
+) -> Tuple[ExplainerAgent, ReviewerAgent]:
+    # One backend per agent, even for the same model: each keeps its own
+    # session context on the Ollama server. HTTP connections are shared.
+    backends = [
+        _make_backend(app_config, app_config.models.explainer, token_counter),
+        _make_backend(app_config, app_config.models.reviewer, token_counter),
+    ]
+    if response_cache is not None:
+        from thedebator.backends import CachedBackend
+
+        backends = [CachedBackend(backend, response_cache) for backend in backends]
+    explainer_backend, reviewer_backend = backends
+    return ExplainerAgent(backend=explainer_backend), ReviewerAgent(backend=reviewer_backend)
+
+
+def _make_panel(
+    app_config: AppConfig,
+    token_counter: TokenCounter | None = None,
+    response_cache: "ResponseCache | None" = None,
+) -> List[ReviewerAgent]:
+    """The configured review panel, each reviewer with its own backend session."""
+    panel = []
+    for reviewer in app_config.panel:
+        backend = _make_backend(app_config, reviewer.model or app_config.models.reviewer, token_counter)
+        if response_cache is not None:
+            from thedebator.backends import CachedBackend
+
+            backend = CachedBackend(backend, response_cache)
+        panel.append(ReviewerAgent(backend=backend, name=reviewer.name, focus=reviewer.focus))
+    return panel
+
+
+def _open_response_cache(app_config: AppConfig, path: Path | None = None) -> "ResponseCache | None":
+    path = path or app_config.performance.response_cache
+    if not path:
+        return None
+    from thedebator.backends import ResponseCache
+
+    return ResponseCache(Path(path))
+
+
+def _open_checkpoint(
+    path: Path, topic: str, rounds: int, resume: bool
+) -> Tuple[TurnCheckpoint, List[ConversationTurn]]:
+    """Continue the checkpoint at ``path`` when resuming and it exists, else start a new one."""
+    if not (resume and path.exists()):
+        return TurnCheckpoint.start(path, topic, rounds), []
+    checkpoint, header, turns = TurnCheckpoint.resume(path)
+    if header.get("topic") != topic:
+        checkpoint.close()
+        raise click.ClickException(f"{path} is a checkpoint of a debate on {header.get('topic')!r}, not {topic!r}")
+    return checkpoint, turns
+
+
+def _record_turns(checkpoint: TurnCheckpoint, transcript: TranscriptWriter):
+    """``on_turn`` callback: checkpoint each turn, then add it to the transcript."""
+
+    def record(turn: ConversationTurn) -> None:
+        checkpoint.append(turn)
+        transcript.append(turn)
+
+    return record
+
+
+def _conversation_options(app_config: AppConfig, token_counter: TokenCounter | None) -> Dict[str, Any]:
+    """``Conversation`` settings taken from the config, shared by every debate command."""
+    return {
+        "top_k": app_config.retrieval.top_k,
+        "max_history_tokens": app_config.retrieval.max_history_tokens,
+        "summarize_history": app_config.retrieval.summarize_history,
+        "dedupe_evidence": app_config.retrieval.dedupe_evidence,
+        "token_counter": token_counter,
+        "prefetch": app_config.performance.prefetch,
+        "prefetch_min_chars": app_config.performance.prefetch_min_chars,
+        "convergence": _make_convergence(app_config),
+    }
+
+
+def _make_convergence(app_config: AppConfig) -> ConvergenceDetector | None:
+    settings = app_config.convergence
+    if not settings.enabled:
+        return None
+    return ConvergenceDetector(
+        similarity=settings.similarity, patience=settings.patience, min_rounds=settings.min_rounds
+    )
+
+
+def _warm_models(app_config: AppConfig) -> None:
+    """Load the debate's models in parallel so the first turns do not wait for them."""
+    if not app_config.ollama.warm:
+        return
+    models = sorted(
+        {app_config.models.explainer, app_config.models.reviewer}
+        | {reviewer.model for reviewer in app_config.panel if reviewer.model}
+    )
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        futures = {executor.submit(_make_backend(app_config, model).warm): model for model in models}
+    for future, model in futures.items():
+        if future.exception() is not None:
+            click.echo(f"Warning: could not preload {model}: {future.exception()}", err=True)
+
+
+def _open_retriever(
+    app_config: AppConfig, metrics: Metrics | None = None, papers: Sequence[str] = ()
+) -> Retriever:
+    """Open the configured retriever, scoped to ``papers`` when any are given."""
+    from thedebator.retrieval import HybridRetriever
+    from thedebator.retrieval.lexical import BM25Index, bm25_path, scope_to_papers
+
+    store = _open_store(app_config, metrics)
+    if papers:
+        _warn_unknown_papers(store, papers)
+    if not app_config.retrieval.hybrid:
+        return scope_to_papers(store, papers)
+    index = BM25Index.load(bm25_path(store.persist_directory, store.collection_name))
+    return scope_to_papers(HybridRetriever(store, index), papers)
+
+
+def _warn_unknown_papers(store: "BaseVectorStore", papers: Sequence[str]) -> None:
+    from thedebator.retrieval.corpus import CorpusManifest, corpus_manifest_path
+
+    known = CorpusManifest.load(corpus_manifest_path(store.persist_directory, store.collection_name)).papers
+    unknown = [paper for paper in papers if paper not in known]
+    if unknown:
+        click.echo(f"Warning: no ingested paper with ID {', '.join(unknown)}", err=True)
+
+
+def _metrics_options(command):
+    """Add ``--metrics`` and ``--metrics-file`` to a command."""
+    command = click.option(
+        "--metrics-file",
+        type=click.Path(dir_okay=False, path_type=Path),
+        default=None,
+        help="Write --metrics output here instead of the terminal",
+    )(command)
+    return click.option(
+        "--metrics",
+        "metrics_format",
+        type=click.Choice(["table", "jsonl"]),
+        default=None,
+        help="Report per-stage timings as a summary table or JSON lines",
+    )(command)
+
+
+def _emit_metrics(
+    metrics_format: str | None,
+    metrics: Metrics,
+    metrics_file: Path | None,
+    records: List[Dict[str, Any]] | None = None,
+) -> None:
+    if metrics_format is None:
+        return
+    if metrics_format == "table":
+        text = metrics.format_table() + "\n"
+    else:
+        buffer = io.StringIO()
+        write_jsonl([*(records or []), {"type": "summary", **metrics.snapshot()}], buffer)
+        text = buffer.getvalue()
+    if metrics_file is None:
+        click.echo("\n" + text, nl=False)
+    else:
+        metrics_file.write_text(text, encoding="utf-8")
+        click.echo(f"Metrics written to {metrics_file}")
+
+
 @cli.command()
 @click.option("--config", "config_path", type=click.Path(exists=True, path_type=Path), default=Path("config.yaml"))
-@click.option("--batch-size", default=100, help="Chunks per batch for ingestion")
-def ingest(config_path: Path, batch_size: int) -> None:
-    """Ingest the PDF into the vector store with progress tracking."""
+@click.option(
+    "--corpus",
+    "sources",
+    multiple=True,
+    help="Directory, glob or PDF to ingest (repeatable); defaults to paper.corpus, then paper.path",
+)
+@click.option("--batch-size", type=int, default=None, help="Chunks per batch for ingestion")
+@click.option("--workers", type=int, default=None, help="Processes extracting papers (or one paper's pages) in parallel")
+@click.option("--max-in-flight", type=int, default=None, help="Batches queued for the store before ingestion waits")
+@click.option("--prune-missing", is_flag=True, help="Delete papers that are stored but not in this corpus")
+@click.option("--rebuild", is_flag=True, help="Drop the collection and re-embed every chunk")
+@_metrics_options
+def ingest(
+    config_path: Path,
+    sources: Tuple[str, ...],
+    batch_size: int | None,
+    workers: int | None,
+    max_in_flight: int | None,
+    prune_missing: bool,
+    rebuild: bool,
+    metrics_format: str | None,
+    metrics_file: Path | None,
+) -> None:
+    """Ingest papers into the shared vector store, processing only new or changed ones."""
+    from thedebator.retrieval.corpus import discover_papers, ingest_corpus
+
     app_config = load_config(config_path)
-    pdf = PDFIngestor(app_config.paper.path)
-    store = VectorStore(Path(app_config.retrieval.persist_directory))
-    store.reset()
-
-    chunks = list(pdf.iter_chunks(app_config.retrieval.chunk_size, app_config.retrieval.chunk_overlap))
-    
-    if not chunks:
-        click.echo("No chunks to ingest.")
+    batch_size = batch_size or app_config.performance.batch_size
+    workers = workers or app_config.performance.workers
+    max_in_flight = max_in_flight or app_config.performance.max_in_flight
+    try:
+        papers = discover_papers(sources or app_config.paper.corpus or [app_config.paper.path])
+    except FileNotFoundError as exc:
+        raise click.BadParameter(str(exc), param_hint="--corpus") from exc
+    if not papers:
+        click.echo("No papers to ingest.")
         return
+    metrics = Metrics()
+    store = _open_store(app_config, metrics)
 
-    total = 0
-    batch = []
-    
-    with click.progressbar(chunks, label="Ingesting chunks") as bar:
-        for chunk in bar:
-            batch.append(chunk)
-            if len(batch) >= batch_size:
-                count = store.upsert(batch)
-                total += count
-                batch = []
-
-        if batch:
-            count = store.upsert(batch)
-            total += count
+    with click.progressbar(length=len(papers), label="Ingesting papers") as bar:
+        stats = ingest_corpus(
+            papers,
+            store,
+            chunk_size=app_config.retrieval.chunk_size,
+            chunk_overlap=app_config.retrieval.chunk_overlap,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            workers=workers,
+            lexical=app_config.retrieval.hybrid,
+            prune_missing=prune_missing,
+            rebuild=rebuild,
+            on_paper=lambda _paper, _stats: bar.update(1),
+            metrics=metrics,
+        )
 
-    click.echo(f"\nIngestion complete. Stored {total} chunks in collection '{store.collection_name}'.")
+    totals = stats.totals
+    removed = f", {stats.removed_papers} removed" if stats.removed_papers else ""
+    click.echo(
+        f"\nIngestion complete. {stats.ingested} papers ingested, {stats.skipped} unchanged{removed}. "
+        f"Stored {totals.stored} new chunks, kept {totals.unchanged} unchanged "
+        f"and removed {totals.removed} stale in collection '{store.collection_name}'."
+    )
+    _emit_metrics(metrics_format, metrics, metrics_file)
 
 
 @cli.command()
 @click.argument("topic")
 @click.option("--config", "config_path", type=click.Path(exists=True, path_type=Path), default=Path("config.yaml"))
 @click.option("--stream/--no-stream", default=True, help="Stream output in real-time")
-def debate(topic: str, config_path: Path, stream: bool) -> None:
+@click.option("--paper", "papers", multiple=True, help="Only retrieve from this paper ID (repeatable)")
+@click.option("--resume", is_flag=True, help="Continue an interrupted debate from its checkpoint")
+@click.option(
+    "--response-cache",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Replay identical model requests from this SQLite file (default from config)",
+)
+@_metrics_options
+def debate(
+    topic: str,
+    config_path: Path,
+    stream: bool,
+    papers: Tuple[str, ...],
+    resume: bool,
+    response_cache: Path | None,
+    metrics_format: str | None,
+    metrics_file: Path | None,
+) -> None:
     """Run the debate and output markdown with optional streaming."""
     app_config: AppConfig = load_config(config_path)
-    explainer_model = app_config.models.explainer
-    reviewer_model = app_config.models.reviewer
-
-    # Get max_history_tokens from config if available, else default to 2000
-    max_history = getattr(app_config.retrieval, "max_history_tokens", 2000)
-
-    if explainer_model == reviewer_model:
-        shared_backend = OllamaBackend(model=explainer_model, max_history_tokens=max_history)
-        explainer_backend = shared_backend
-        reviewer_backend = shared_backend
-    else:
-        explainer_backend = OllamaBackend(model=explainer_model, max_history_tokens=max_history)
-        reviewer_backend = OllamaBackend(model=reviewer_model, max_history_tokens=max_history)
-
-    explainer = ExplainerAgent(backend=explainer_backend)
-    reviewer = ReviewerAgent(backend=reviewer_backend)
+    metrics = Metrics()
+    token_counter = _make_token_counter(app_config)
+    cache = _open_response_cache(app_config, response_cache)
+    explainer, reviewer = _make_agents(app_config, token_counter, cache)
+    panel = _make_panel(app_config, token_counter, cache)
+    checkpoint, done = _open_checkpoint(checkpoint_path(app_config.output.path), topic, app_config.rounds, resume)
+    if done:
+        click.echo(f"Resuming after {len(done)} completed turns from {checkpoint.path}")
+    _warm_models(app_config)
 
-    store = VectorStore(Path(app_config.retrieval.persist_directory))
+    store = _open_retriever(app_config, metrics, papers)
+    transcript = TranscriptWriter(app_config.output.path, done, metrics)
     conversation = Conversation(
         explainer=explainer,
         reviewer=reviewer,
         rounds=app_config.rounds,
+        panel=panel,
         store=store,
-        top_k=app_config.retrieval.top_k,
         stream_output=stream,
+        history=done,
+        metrics=metrics,
+        on_turn=_record_turns(checkpoint, transcript),
+        **_conversation_options(app_config, token_counter),
     )
-    conversation.run(topic)
-    conversation.save_markdown(app_config.output.path)
+    try:
+        conversation.run(topic)
+    finally:
+        checkpoint.close()
+        transcript.close()
     click.echo(f"\nDebate complete. Output written to {app_config.output.path}")
+    if conversation.early_stop is not None:
+        click.echo(_describe_early_stop(conversation.early_stop))
+    prefetch = conversation.prefetch_stats
+    if prefetch.hits + prefetch.misses:
+        click.echo(f"Retrieval prefetch: {prefetch.hits}/{prefetch.hits + prefetch.misses} turns overlapped with generation")
+    stats = getattr(getattr(store, "store", store), "query_cache_stats", None)
+    if stats and stats.hits + stats.misses:
+        click.echo(f"Retrieval cache: {stats.hits}/{stats.hits + stats.misses} hits ({stats.hit_rate:.0%})")
+    if cache is not None and cache.stats.hits + cache.stats.misses:
+        click.echo(f"Response cache: {cache.stats.hits}/{cache.stats.hits + cache.stats.misses} turns replayed")
+    _emit_metrics(metrics_format, metrics, metrics_file, list(turn_records(conversation.history)))
+
+
+def _describe_early_stop(stop: EarlyStop) -> str:
+    return (
+        f"Converged after {stop.rounds_run} rounds ({stop.reason}); skipped {stop.rounds_skipped}, "
+        f"saving ~{stop.tokens_saved} generated tokens and ~{stop.seconds_saved:.1f}s"
+    )
+
+
+def _slugify(text: str, max_length: int = 40) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug[:max_length].rstrip("-") or "debate"
+
+
+async def run_debates(
+    topics: List[str],
+    app_config: AppConfig,
+    retriever: Retriever | None,
+    output_dir: Path,
+    concurrency: int,
+    metrics: Metrics | None = None,
+    records: List[Dict[str, Any]] | None = None,
+    resume: bool = False,
+    response_cache: "ResponseCache | None" = None,
+) -> List[Path]:
+    """Run one debate per topic, at most ``concurrency`` at a time.
+
+    Each debate gets its own agents and backends; the retriever, ``metrics``
+    and ``response_cache`` are shared. Every debate is checkpointed next to its
+    transcript and, with ``resume``, continues from that checkpoint. Per-turn
+    metric records, tagged with their debate, are appended to ``records`` if
+    given. Returns the markdown paths in topic order.
+    """
+    metrics = metrics or Metrics()
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    token_counter = _make_token_counter(app_config)
+
+    async def run_one(index: int, topic: str) -> Path:
+        async with semaphore:
+            path = output_dir / f"{index:03d}-{_slugify(topic)}.md"
+            checkpoint, done = _open_checkpoint(checkpoint_path(path), topic, app_config.rounds, resume)
+            transcript = TranscriptWriter(path, done, metrics)
+            explainer, reviewer = _make_agents(app_config, token_counter, response_cache)
+            conversation = Conversation(
+                explainer=explainer,
+                reviewer=reviewer,
+                rounds=app_config.rounds,
+                panel=_make_panel(app_config, token_counter, response_cache),
+                store=retriever,
+                stream_output=False,
+                history=done,
+                metrics=metrics,
+                on_turn=_record_turns(checkpoint, transcript),
+                **_conversation_options(app_config, token_counter),
+            )
+            try:
+                await conversation.arun(topic)
+            finally:
+                checkpoint.close()
+                transcript.close()
+            if records is not None:
+                records.extend({"debate": index, **record} for record in turn_records(conversation.history))
+            return path
+
+    return list(await asyncio.gather(*(run_one(i, topic) for i, topic in enumerate(topics, start=1))))
+
+
+@cli.command("debate-batch")
+@click.argument("topics_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--config", "config_path", type=click.Path(exists=True, path_type=Path), default=Path("config.yaml"))
+@click.option("--concurrency", type=int, default=None, help="Debates run at the same time")
+@click.option(
+    "--output-dir", type=click.Path(file_okay=False, path_type=Path), default=Path("debates"), help="Where transcripts go"
+)
+@click.option("--paper", "papers", multiple=True, help="Only retrieve from this paper ID (repeatable)")
+@click.option("--resume", is_flag=True, help="Continue interrupted debates from their checkpoints")
+@click.option(
+    "--response-cache",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Replay identical model requests from this SQLite file (default from config)",
+)
+@_metrics_options
+def debate_batch(
+    topics_file: Path,
+    config_path: Path,
+    concurrency: int | None,
+    output_dir: Path,
+    papers: Tuple[str, ...],
+    resume: bool,
+    response_cache: Path | None,
+    metrics_format: str | None,
+    metrics_file: Path | None,
+) -> None:
+    """Run one debate per line of TOPICS_FILE concurrently."""
+    app_config: AppConfig = load_config(config_path)
+    topics = [line.strip() for line in topics_file.read_text(encoding="utf-8").splitlines()]
+    topics = [topic for topic in topics if topic and not topic.startswith("#")]
+    if not topics:
+        click.echo("No topics to debate.")
+        return
+
+    concurrency = concurrency or app_config.performance.concurrency
+    _warm_models(app_config)
+    metrics = Metrics()
+    records: List[Dict[str, Any]] = []
+    retriever = _open_retriever(app_config, metrics, papers)
+    cache = _open_response_cache(app_config, response_cache)
+    paths = asyncio.run(
+        run_debates(topics, app_config, retriever, output_dir, concurrency, metrics, records, resume, cache)
+    )
+    click.echo(f"\n{len(paths)} debates complete. Output written to {output_dir}")
+    counters = metrics.snapshot()["counters"]
+    if counters.get("rounds_skipped"):
+        click.echo(
+            f"Converged early: skipped {counters['rounds_skipped']:g} rounds, saving "
+            f"~{counters['generated_tokens_saved']:g} generated tokens and ~{counters['generation_s_saved']:.1f}s"
+        )
+    _emit_metrics(metrics_format, metrics, metrics_file, records)
+
+
+@cli.command()
+@click.option("--config", "config_path", type=click.Path(exists=True, path_type=Path), default=Path("config.yaml"))
+@click.option("--host", default=None, help="Interface to listen on (default from config)")
+@click.option("--port", type=int, default=None, help="Port to listen on (default from config)")
+@click.option("--workers", type=int, default=None, help="Debates generated at the same time")
+@click.option("--queue-size", type=int, default=None, help="Debates waiting for a worker before new ones are refused")
+def serve(
+    config_path: Path, host: str | None, port: int | None, workers: int | None, queue_size: int | None
+) -> None:
+    """Serve debates over a local HTTP/JSON API, keeping models and index loaded."""
+    from thedebator.retrieval.lexical import scope_to_papers
+    from thedebator.server import DebateService, make_server
+
+    app_config: AppConfig = load_config(config_path)
+    server_config = app_config.server
+    metrics = Metrics()
+    token_counter = _make_token_counter(app_config)
+    _warm_models(app_config)
+
+    retriever = _open_retriever(app_config, metrics)
+    try:
+        retriever.similarity_search("warm up", k=1)  # loads the embedding model and the index
+    except Exception as exc:  # an empty or missing index is reported, not fatal
+        click.echo(f"Warning: retrieval warm-up failed: {exc}", err=True)
+
+    cache = _open_response_cache(app_config)
+    service = DebateService(
+        lambda: (*_make_agents(app_config, token_counter, cache), *_make_panel(app_config, token_counter, cache)),
+        lambda papers: scope_to_papers(retriever, papers),
+        workers=workers or server_config.workers,
+        queue_size=queue_size or server_config.queue_size,
+        default_rounds=app_config.rounds,
+        max_rounds=server_config.max_rounds,
+        keep_jobs=server_config.keep_jobs,
+        conversation_options=_conversation_options(app_config, token_counter),
+        metrics=metrics,
+    )
+    service.start()
+    server = make_server(service, host or server_config.host, port or server_config.port)
+    click.echo(f"Serving debates on http://{server.server_address[0]}:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("\nShutting down; waiting for running debates to finish")
+    finally:
+        server.server_close()
+        service.close()
 
 
 if __name__ == "__main__":  # pragma: no cover
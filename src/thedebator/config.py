@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Set
 
 import yaml
 
@@ -13,6 +13,23 @@ class RetrievalConfig:
     chunk_overlap: int = 200
     persist_directory: str = "chroma_store"
     top_k: int = 3
+    store: str = "chroma"
+    hybrid: bool = True
+    query_cache_size: int = 256
+    embedding_cache: bool = True
+    embedding_cache_size: int = 100_000
+    max_history_tokens: int = 2000
+    summarize_history: bool = False
+    dedupe_evidence: bool = True
+    tokenizer: str | None = None
+
+
+@dataclass
+class EmbeddingConfig:
+    backend: str = "default"
+    batch_size: int = 64
+    threads: int = 1
+    dimension: int = 384
 
 
 @dataclass
@@ -21,9 +38,40 @@ class ModelsConfig:
     reviewer: str = "llama3:8b"
 
 
+@dataclass
+class ConvergenceConfig:
+    """When a debate may end before ``rounds``; see ``ConvergenceDetector``."""
+
+    enabled: bool = False
+    similarity: float = 0.6
+    patience: int = 1
+    min_rounds: int = 2
+
+
+@dataclass
+class ReviewerConfig:
+    """One reviewer of a panel; ``model`` defaults to ``models.reviewer``."""
+
+    name: str
+    focus: str = ""
+    model: str | None = None
+
+
+@dataclass
+class OllamaConfig:
+    host: str | None = None
+    keep_alive: float | str = "30m"
+    timeout: float = 300.0
+    retries: int = 2
+    retry_backoff: float = 0.5
+    warm: bool = True
+
+
 @dataclass
 class PaperConfig:
     path: Path
+    # Directories, globs or files; when set, ``ingest`` uses these instead of ``path``.
+    corpus: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -31,15 +79,44 @@ class OutputConfig:
     path: Path = Path("discussion.md")
 
 
+@dataclass
+class PerformanceConfig:
+    batch_size: int = 100
+    workers: int = 1
+    max_in_flight: int = 2
+    concurrency: int = 4
+    reuse_context: bool = True
+    prefetch: bool = True
+    prefetch_min_chars: int = 300
+    response_cache: str | None = None
+
+
+@dataclass
+class ServerConfig:
+    host: str = "127.0.0.1"
+    port: int = 8765
+    workers: int = 2
+    queue_size: int = 32
+    max_rounds: int = 10
+    keep_jobs: int = 500
+
+
 @dataclass
 class AppConfig:
     backend: str = "ollama"
     model: str = "llama3:8b"
     models: ModelsConfig = field(default_factory=ModelsConfig)
+    ollama: OllamaConfig = field(default_factory=OllamaConfig)
     rounds: int = 3
     retrieval: RetrievalConfig = field(default_factory=RetrievalConfig)
+    embedding: EmbeddingConfig = field(default_factory=EmbeddingConfig)
     paper: PaperConfig = field(default_factory=lambda: PaperConfig(path=Path("sample.pdf")))
     output: OutputConfig = field(default_factory=OutputConfig)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
+    server: ServerConfig = field(default_factory=ServerConfig)
+    # Reviewers that replace the single reviewer and critique in parallel.
+    panel: List[ReviewerConfig] = field(default_factory=list)
+    convergence: ConvergenceConfig = field(default_factory=ConvergenceConfig)
 
 
 def load_config(path: Path) -> AppConfig:
@@ -48,9 +125,14 @@ def load_config(path: Path) -> AppConfig:
         data: Dict[str, Any] = yaml.safe_load(config_file) or {}
 
     models_cfg = data.get("models", {})
+    ollama_cfg = data.get("ollama", {})
     retrieval_cfg = data.get("retrieval", {})
+    embedding_cfg = data.get("embedding", {})
     paper_cfg = data.get("paper", {})
     output_cfg = data.get("output", {})
+    performance_cfg = data.get("performance", {})
+    server_cfg = data.get("server", {})
+    convergence_cfg = data.get("convergence", {})
 
     default_model = str(data.get("model", "llama3:8b"))
     models = ModelsConfig(
@@ -62,13 +144,112 @@ def load_config(path: Path) -> AppConfig:
         backend=data.get("backend", "ollama"),
         model=default_model,
         models=models,
+        ollama=OllamaConfig(
+            host=ollama_cfg.get("host"),
+            keep_alive=_keep_alive(ollama_cfg.get("keep_alive", "30m")),
+            timeout=float(ollama_cfg.get("timeout", 300.0)),
+            retries=int(ollama_cfg.get("retries", 2)),
+            retry_backoff=float(ollama_cfg.get("retry_backoff", 0.5)),
+            warm=bool(ollama_cfg.get("warm", True)),
+        ),
         rounds=int(data.get("rounds", 3)),
         retrieval=RetrievalConfig(
             chunk_size=int(retrieval_cfg.get("chunk_size", 800)),
             chunk_overlap=int(retrieval_cfg.get("chunk_overlap", 200)),
             persist_directory=str(retrieval_cfg.get("persist_directory", ".chroma")),
             top_k=int(retrieval_cfg.get("top_k", 3)),
+            store=str(retrieval_cfg.get("store", "chroma")),
+            hybrid=bool(retrieval_cfg.get("hybrid", True)),
+            query_cache_size=int(retrieval_cfg.get("query_cache_size", 256)),
+            embedding_cache=bool(retrieval_cfg.get("embedding_cache", True)),
+            embedding_cache_size=int(retrieval_cfg.get("embedding_cache_size", 100_000)),
+            max_history_tokens=int(retrieval_cfg.get("max_history_tokens", 2000)),
+            summarize_history=bool(retrieval_cfg.get("summarize_history", False)),
+            dedupe_evidence=bool(retrieval_cfg.get("dedupe_evidence", True)),
+            tokenizer=retrieval_cfg.get("tokenizer"),
+        ),
+        embedding=EmbeddingConfig(
+            backend=str(embedding_cfg.get("backend", "default")),
+            batch_size=int(embedding_cfg.get("batch_size", 64)),
+            threads=int(embedding_cfg.get("threads", 1)),
+            dimension=int(embedding_cfg.get("dimension", 384)),
+        ),
+        paper=PaperConfig(
+            path=Path(paper_cfg.get("path", "sample.pdf")),
+            corpus=_string_list(paper_cfg.get("corpus")),
         ),
-        paper=PaperConfig(path=Path(paper_cfg.get("path", "sample.pdf"))),
         output=OutputConfig(path=Path(output_cfg.get("path", "discussion.md"))),
+        performance=PerformanceConfig(
+            batch_size=int(performance_cfg.get("batch_size", 100)),
+            workers=int(performance_cfg.get("workers", 1)),
+            max_in_flight=int(performance_cfg.get("max_in_flight", 2)),
+            concurrency=int(performance_cfg.get("concurrency", 4)),
+            reuse_context=bool(performance_cfg.get("reuse_context", True)),
+            prefetch=bool(performance_cfg.get("prefetch", True)),
+            prefetch_min_chars=int(performance_cfg.get("prefetch_min_chars", 300)),
+            response_cache=performance_cfg.get("response_cache"),
+        ),
+        server=ServerConfig(
+            host=str(server_cfg.get("host", "127.0.0.1")),
+            port=int(server_cfg.get("port", 8765)),
+            workers=int(server_cfg.get("workers", 2)),
+            queue_size=int(server_cfg.get("queue_size", 32)),
+            max_rounds=int(server_cfg.get("max_rounds", 10)),
+            keep_jobs=int(server_cfg.get("keep_jobs", 500)),
+        ),
+        panel=_unique_names([_reviewer_config(entry) for entry in data.get("panel") or []]),
+        convergence=ConvergenceConfig(
+            enabled=bool(convergence_cfg.get("enabled", False)),
+            similarity=float(convergence_cfg.get("similarity", 0.6)),
+            patience=int(convergence_cfg.get("patience", 1)),
+            min_rounds=int(convergence_cfg.get("min_rounds", 2)),
+        ),
+    )
+
+
+def _unique_names(panel: List[ReviewerConfig]) -> List[ReviewerConfig]:
+    """Number reviewers that share a name ("Statistics Reviewer 2").
+
+    Names identify speakers in transcripts and checkpoints and key what
+    evidence each reviewer has read, so no two may be the same.
+    """
+    taken = {reviewer.name for reviewer in panel}
+    seen: Set[str] = set()
+    for reviewer in panel:
+        if reviewer.name in seen:
+            base, index = reviewer.name, 2
+            while f"{base} {index}" in taken:
+                index += 1
+            reviewer.name = f"{base} {index}"
+            taken.add(reviewer.name)
+        seen.add(reviewer.name)
+    return panel
+
+
+def _reviewer_config(entry: Any) -> ReviewerConfig:
+    """A panel entry is a focus (``statistics``) or a mapping with ``focus``, ``name`` and ``model``."""
+    if not isinstance(entry, dict):
+        entry = {"focus": str(entry)}
+    focus = str(entry.get("focus", ""))
+    default_name = f"{focus.title()} Reviewer" if focus else "Reviewer"
+    return ReviewerConfig(
+        name=str(entry.get("name", default_name)),
+        focus=focus,
+        model=entry.get("model"),
     )
+
+
+def _keep_alive(value: Any) -> float | str:
+    # Ollama takes numbers as seconds (-1 keeps the model loaded) but parses
+    # strings as durations, where "-1" or "3600" lack a unit and are rejected.
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return str(value)
+
+
+def _string_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (str, Path)):
+        return [str(value)]
+    return [str(item) for item in value]
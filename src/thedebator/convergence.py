@@ -0,0 +1,118 @@
+"""Ending a debate early once its rounds stop adding anything."""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional, Pattern, Sequence, Set
+
+from thedebator.evidence import CITATION_PATTERN
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Phrases a reviewer uses when it has nothing left to challenge.
+AGREEMENT_MARKERS = re.compile(
+    r"\b(?:i (?:now |fully |completely )?agree|(?:i am|i'm) (?:now )?(?:convinced|satisfied)"
+    r"|no (?:further|remaining|more) (?:concerns|objections|issues|questions)"
+    r"|(?:concerns|points) (?:have been|are) (?:fully |now )?addressed)\b",
+    re.IGNORECASE,
+)
+# Words that turn an agreement into a concession ("I agree X, but ...").
+CONTRAST_MARKERS = re.compile(
+    r"\b(?:but|however|although|though|yet|except|unless|whereas|nevertheless|nonetheless"
+    r"|not (?:yet |fully |entirely )?(?:established|convinced|supported|shown|demonstrated|clear|addressed)"
+    r"|unconvinc\w*|unclear|remains? to be)\b",
+    re.IGNORECASE,
+)
+
+
+def written_pages(text: str) -> Set[str]:
+    """Citations in ``text``, normalised (``[p. 2]`` is ``[p.2]``)."""
+    return {re.sub(r"\s+", "", citation) for citation in CITATION_PATTERN.findall(text)}
+
+
+def cited_pages(turn: Any) -> Set[str]:
+    """Citations a turn was given or wrote, normalised like ``written_pages``."""
+    return written_pages(turn.message) | {re.sub(r"\s+", "", citation) for citation in turn.citations}
+
+
+def _word_pairs(text: str) -> Counter:
+    words = _WORD.findall(text.lower())
+    return Counter(zip(words, words[1:]))
+
+
+def text_similarity(first: str, second: str) -> float:
+    """Cosine similarity of the two texts' counts of adjacent word pairs, from 0 to 1.
+
+    Pairs rather than single words, so that sharing the vocabulary of the
+    paper is not enough to look alike.
+    """
+    a, b = _word_pairs(first), _word_pairs(second)
+    norm = math.sqrt(sum(n * n for n in a.values())) * math.sqrt(sum(n * n for n in b.values()))
+    return sum(n * b[word] for word, n in a.items()) / norm if norm else 0.0
+
+
+@dataclass(frozen=True)
+class ConvergenceDetector:
+    """Decide between rounds whether a debate has stopped making progress.
+
+    A round is stale when every reviewer agrees (an agreement marker, no
+    contrast word such as "but", and no newly cited page), or when the round
+    cites no page the debate had not cited before and its explanation is at
+    least ``similarity`` alike the previous one (see ``text_similarity``; it
+    costs far less than a turn). The debate has converged after ``patience``
+    stale rounds in a row, and never before ``min_rounds`` rounds. The
+    detector keeps no state, so one instance can serve many debates.
+    """
+
+    similarity: float = 0.6
+    patience: int = 1
+    min_rounds: int = 2
+    agreement: Pattern[str] = AGREEMENT_MARKERS
+    contrast: Pattern[str] = CONTRAST_MARKERS
+
+    def check(self, rounds: Sequence[Sequence[Any]]) -> Optional[str]:
+        """Why the debate has converged after ``rounds``, or ``None`` to go on.
+
+        Each round is its turns in order, the explainer's first.
+        """
+        if len(rounds) < max(self.min_rounds, 1):
+            return None
+        seen: Set[str] = set()
+        previous = ""
+        streak, reason = 0, None
+        for explanation, *reviews in rounds:
+            reason = self._stale(explanation, reviews, seen, previous)
+            streak = streak + 1 if reason else 0
+            previous = explanation.message
+            for turn in (explanation, *reviews):
+                seen |= cited_pages(turn)
+        return reason if streak >= max(self.patience, 1) else None
+
+    def _stale(self, explanation: Any, reviews: Sequence[Any], seen: Set[str], previous: str) -> Optional[str]:
+        if reviews and all(self._agrees(review, seen) for review in reviews):
+            return "the reviewers agree"
+        if not previous or any(cited_pages(turn) - seen for turn in (explanation, *reviews)):
+            return None
+        similarity = text_similarity(explanation.message, previous)
+        if similarity < self.similarity:
+            return None
+        return f"no new citations and the explanation is {similarity:.0%} like the last one"
+
+    def _agrees(self, review: Any, seen: Set[str]) -> bool:
+        # Only pages the reviewer cites itself count; the evidence it was handed may be new either way.
+        if written_pages(review.message) - seen:
+            return False
+        return bool(self.agreement.search(review.message)) and not self.contrast.search(review.message)
+
+
+@dataclass
+class EarlyStop:
+    """A debate that converged before its last round, and what stopping saved."""
+
+    reason: str
+    rounds_run: int
+    rounds_skipped: int
+    # Estimated from the average of the rounds that ran.
+    tokens_saved: int = 0
+    seconds_saved: float = 0.0
@@ -1,12 +1,23 @@
 """Conversation loop between agents."""
 
-import sys
+import asyncio
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 from thedebator.agents import ExplainerAgent, ReviewerAgent
-from thedebator.retrieval import DocumentChunk, VectorStore
+from thedebator.backends import AsyncBackend
+from thedebator.convergence import ConvergenceDetector, EarlyStop
+from thedebator.evidence import CITATION_PATTERN, EvidenceLedger, RenderedEvidence
+from thedebator.history import HistoryWindow, TokenCounter
+from thedebator.metrics import CacheStats, GenerationTimer, Metrics
+from thedebator.prefetch import RetrievalPrefetcher
+from thedebator.render import TRANSCRIPT_HEADER, TokenRenderer, format_turn
+from thedebator.retrieval import DocumentChunk, Retriever
 
 
 @dataclass
@@ -14,6 +25,13 @@ class ConversationTurn:
     speaker: str
     message: str
     citations: List[str] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+def merge_critiques(turns: List[ConversationTurn]) -> str:
+    """The panel's critiques as one message for the explainer, one section per reviewer."""
+    sections = [f"### {turn.speaker}\n{turn.message.strip()}" for turn in turns]
+    return "Critiques from the review panel:\n\n" + "\n\n".join(sections)
 
 
 @dataclass
@@ -21,105 +39,501 @@ class Conversation:
     explainer: ExplainerAgent
     reviewer: ReviewerAgent
     rounds: int
-    store: VectorStore | None = None
+    store: Retriever | None = None
     top_k: int = 3
     stream_output: bool = False
     history: List[ConversationTurn] = field(default_factory=list)
+    max_claim_queries: int = 2
+    max_history_tokens: int = 2000
+    summarize_history: bool = False
+    token_counter: TokenCounter | None = None
+    prefetch: bool = True
+    prefetch_min_chars: int = 300
+    # Refer to evidence an agent has already read by its ID instead of repeating it.
+    dedupe_evidence: bool = True
+    prefetch_stats: CacheStats = field(init=False, repr=False, default_factory=CacheStats)
+    metrics: Metrics = field(default_factory=Metrics)
+    # Called with each turn as soon as it is recorded, e.g. to stream it to a client.
+    on_turn: Callable[[ConversationTurn], None] | None = None
+    # Where streamed output goes; defaults to stdout.
+    renderer: TokenRenderer = field(default_factory=TokenRenderer, repr=False)
+    # Reviewers that critique each explainer turn at the same time, replacing ``reviewer``.
+    panel: List[ReviewerAgent] = field(default_factory=list)
+    # Turns the panel's critiques into the explainer's next prompt.
+    aggregate: Callable[[List[ConversationTurn]], str] = merge_critiques
+    # Ends the debate before ``rounds`` once it stops making progress; see ``early_stop``.
+    convergence: ConvergenceDetector | None = None
+    early_stop: EarlyStop | None = field(init=False, repr=False, default=None)
+    history_window: HistoryWindow = field(init=False, repr=False)
+    evidence: EvidenceLedger = field(init=False, repr=False)
+    _topic: str = field(init=False, repr=False, default="")
+    _retrieval_wait: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.history_window = HistoryWindow(
+            max_tokens=self.max_history_tokens, counter=self.token_counter, summarize=self.summarize_history
+        )
+        self.evidence = EvidenceLedger(counter=self.token_counter or TokenCounter())
+        for turn in self.history:
+            self.history_window.append(f"{turn.speaker}: {turn.message}")
 
     def run(self, topic: str) -> List[ConversationTurn]:
-        prompt = topic
+        """Debate ``topic``, continuing after any turns already in ``history``.
+
+        Passing the turns of an interrupted debate (see ``TurnCheckpoint``)
+        resumes it at the next turn instead of regenerating them.
+        """
+        self._topic = topic
+        if len(self.history) >= self._turns_per_round() * self.rounds or self._converged():
+            return self.history
+        with self._prefetch_executor() as executor:
+            start = time.perf_counter()
+            prompt = self._resume_prompt(topic)
+            retrieved = self._build_context(prompt)
+            self._waited_for_retrieval(start)
+            for agent, is_last in self._turn_order(start=len(self.history)):
+                if isinstance(agent, list):
+                    prompt, retrieved = self._take_panel_turn(agent, prompt, retrieved, is_last)
+                else:
+                    prompt, retrieved = self._take_turn(agent, prompt, retrieved, executor, is_last)
+                if self.early_stop is not None:
+                    break
+
+        return self.history
+
+    async def arun(self, topic: str) -> List[ConversationTurn]:
+        """Async ``run``: many debates can share one event loop.
+
+        Generation awaits ``AsyncBackend`` backends directly; retrieval and
+        blocking backends run in worker threads.
+        """
+        self._topic = topic
+        if len(self.history) >= self._turns_per_round() * self.rounds or self._converged():
+            return self.history
+        with self._prefetch_executor() as executor:
+            start = time.perf_counter()
+            prompt = self._resume_prompt(topic)
+            retrieved = await asyncio.to_thread(self._build_context, prompt)
+            self._waited_for_retrieval(start)
+            for agent, is_last in self._turn_order(start=len(self.history)):
+                if isinstance(agent, list):
+                    prompt, retrieved = await self._atake_panel_turn(agent, prompt, retrieved, is_last)
+                else:
+                    prompt, retrieved = await self._atake_turn(agent, prompt, retrieved, executor, is_last)
+                if self.early_stop is not None:
+                    break
+
+        return self.history
+
+    def _turns_per_round(self) -> int:
+        return 1 + (len(self.panel) or 1)
+
+    def _turn_order(
+        self, start: int = 0
+    ) -> Iterator[Tuple[ExplainerAgent | ReviewerAgent | List[ReviewerAgent], bool]]:
+        """Yield ``(agent, is_last_turn)`` for every turn from ``start``, announcing rounds as they start.
+
+        With a panel, its reviewers are yielded together as one list (those
+        still to speak, when resuming part-way through the panel).
+        """
         for round_num in range(self.rounds):
-            if self.stream_output:
-                print(f"\n{'='*60}")
-                print(f"Round {round_num + 1}/{self.rounds}")
-                print(f"{'='*60}\n")
-
-            # Explainer's turn
-            explainer_context, explainer_citations = self._build_context(prompt)
-            explainer_response = self._generate_response(
-                agent=self.explainer,
-                prompt=prompt,
-                context=explainer_context,
-                citations=explainer_citations,
-            )
-            self.history.append(
-                ConversationTurn(self.explainer.name, explainer_response, explainer_citations)
-            )
+            offset = start - self._turns_per_round() * round_num
+            steps: List[Tuple[Any, bool]] = []
+            if offset <= 0:
+                steps.append((self.explainer, False))
+            if self.panel and offset < self._turns_per_round():
+                steps.append((self.panel[max(offset - 1, 0) :], round_num == self.rounds - 1))
+            elif offset <= 1:
+                steps.append((self.reviewer, round_num == self.rounds - 1))
+            if steps:
+                self._announce_round(round_num)
+            yield from steps
 
-            # Reviewer's turn
-            reviewer_context, reviewer_citations = self._build_context(explainer_response)
-            reviewer_response = self._generate_response(
-                agent=self.reviewer,
-                prompt=explainer_response,
-                context=reviewer_context,
-                citations=reviewer_citations,
-            )
-            self.history.append(
-                ConversationTurn(self.reviewer.name, reviewer_response, reviewer_citations)
+    def _ends_debate(self, is_last: bool) -> bool:
+        """Whether the turn just recorded is the debate's last, so its response needs no retrieval."""
+        return is_last or self._converged()
+
+    def _converged(self) -> bool:
+        """Check the finished rounds for convergence and, if so, record the early stop."""
+        per_round = self._turns_per_round()
+        if self.convergence is None or len(self.history) % per_round:
+            return False
+        rounds = [self.history[i : i + per_round] for i in range(0, len(self.history), per_round)]
+        reason = self.convergence.check(rounds)
+        if reason is None:
+            return False
+        skipped = self.rounds - len(rounds)
+        # A round costs the explainer's turn plus its slowest reviewer (panels run in parallel).
+        tokens = [sum(turn.metrics.get("generated_tokens", 0) for turn in turns) for turns in rounds]
+        seconds = [
+            turns[0].metrics.get("generation_s", 0.0) + max(t.metrics.get("generation_s", 0.0) for t in turns[1:])
+            for turns in rounds
+        ]
+        self.early_stop = EarlyStop(
+            reason=reason,
+            rounds_run=len(rounds),
+            rounds_skipped=skipped,
+            tokens_saved=round(skipped * sum(tokens) / len(rounds)),
+            seconds_saved=skipped * sum(seconds) / len(rounds),
+        )
+        self.metrics.incr("rounds_skipped", skipped)
+        self.metrics.incr("generated_tokens_saved", self.early_stop.tokens_saved)
+        self.metrics.incr("generation_s_saved", self.early_stop.seconds_saved)
+        if self.stream_output:
+            self.renderer.line(f"\nDebate converged after round {len(rounds)}/{self.rounds}: {reason}")
+        return True
+
+    def _resume_prompt(self, topic: str) -> str:
+        # Each turn answers the previous one; the first answers the topic.
+        if not self.history:
+            return topic
+        if self.panel:
+            # The panel answers the explainer turn ``position`` turns back.
+            position = len(self.history) % self._turns_per_round()
+            if position:
+                return self.history[-position].message
+            return self.aggregate(self.history[-len(self.panel) :])
+        return self.history[-1].message
+
+    @contextmanager
+    def _prefetch_executor(self) -> Iterator[ThreadPoolExecutor | None]:
+        if not (self.prefetch and self.store):
+            yield None
+            return
+        # Waiting would only block on speculations whose results are no longer needed.
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        try:
+            yield executor
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _announce_round(self, round_num: int) -> None:
+        if self.stream_output:
+            self.renderer.line(f"\n{'='*60}\nRound {round_num + 1}/{self.rounds}\n{'='*60}\n")
+
+    def _take_turn(
+        self,
+        agent: ExplainerAgent | ReviewerAgent,
+        prompt: str,
+        retrieved: List[DocumentChunk],
+        executor: ThreadPoolExecutor | None = None,
+        is_last: bool = False,
+    ) -> Tuple[str, List[DocumentChunk]]:
+        """Answer ``prompt`` with already retrieved context; return the response and its context.
+
+        With an ``executor``, retrieval for the response starts while it is
+        still being generated. The last turn's response needs no retrieval.
+        """
+        evidence = self._render_evidence(agent, prompt, retrieved)
+        prefetcher = None if is_last else self._prefetcher(executor)
+        timer = GenerationTimer(agent.backend, self.metrics)
+        response = self._generate_response(
+            agent=agent,
+            prompt=prompt,
+            context=evidence.text,
+            citations=evidence.citations,
+            on_token=_chain(timer.on_token, prefetcher.feed if prefetcher else None),
+        )
+        self._evidence_sent(agent, evidence)
+        self._record(ConversationTurn(agent.name, response, evidence.citations, self._turn_metrics(timer, evidence)))
+        if self._ends_debate(is_last):
+            return response, []
+        start = time.perf_counter()
+        if prefetcher is None:
+            retrieved = self._build_context(response)
+        else:
+            retrieved = self._prefetched(prefetcher.result(response))
+        self._waited_for_retrieval(start)
+        return response, retrieved
+
+    async def _atake_turn(
+        self,
+        agent: ExplainerAgent | ReviewerAgent,
+        prompt: str,
+        retrieved: List[DocumentChunk],
+        executor: ThreadPoolExecutor | None = None,
+        is_last: bool = False,
+    ) -> Tuple[str, List[DocumentChunk]]:
+        evidence = self._render_evidence(agent, prompt, retrieved)
+        prefetcher = None if is_last else self._prefetcher(executor)
+        timer = GenerationTimer(agent.backend, self.metrics)
+        response = await self._agenerate_response(
+            agent=agent,
+            prompt=prompt,
+            context=evidence.text,
+            citations=evidence.citations,
+            on_token=_chain(timer.on_token, prefetcher.feed if prefetcher else None),
+        )
+        self._evidence_sent(agent, evidence)
+        self._record(ConversationTurn(agent.name, response, evidence.citations, self._turn_metrics(timer, evidence)))
+        if self._ends_debate(is_last):
+            return response, []
+        start = time.perf_counter()
+        if prefetcher is None:
+            retrieved = await asyncio.to_thread(self._build_context, response)
+        else:
+            retrieved = self._prefetched(await asyncio.to_thread(prefetcher.result, response))
+        self._waited_for_retrieval(start)
+        return response, retrieved
+
+    def _take_panel_turn(
+        self, panel: List[ReviewerAgent], prompt: str, retrieved: List[DocumentChunk], is_last: bool = False
+    ) -> Tuple[str, List[DocumentChunk]]:
+        """Have the ``panel`` reviewers critique ``prompt`` at once; return the merged critique and its context.
+
+        The reviewers share one retrieval pass and generate in parallel
+        threads, so the round waits for the slowest reviewer only.
+        """
+        jobs = [(reviewer, self._render_evidence(reviewer, prompt, retrieved)) for reviewer in panel]
+        with self.metrics.timer("panel"), ThreadPoolExecutor(len(jobs), thread_name_prefix="panel") as pool:
+            futures = [pool.submit(self._critique, reviewer, prompt, evidence) for reviewer, evidence in jobs]
+            results = [future.result() for future in futures]
+        merged = self._record_panel(jobs, results)
+        if self._ends_debate(is_last):
+            return merged, []
+        start = time.perf_counter()
+        retrieved = self._build_context(merged)
+        self._waited_for_retrieval(start)
+        return merged, retrieved
+
+    async def _atake_panel_turn(
+        self, panel: List[ReviewerAgent], prompt: str, retrieved: List[DocumentChunk], is_last: bool = False
+    ) -> Tuple[str, List[DocumentChunk]]:
+        jobs = [(reviewer, self._render_evidence(reviewer, prompt, retrieved)) for reviewer in panel]
+        with self.metrics.timer("panel"):
+            results = await asyncio.gather(
+                *(self._acritique(reviewer, prompt, evidence) for reviewer, evidence in jobs)
             )
-            prompt = reviewer_response
+        merged = self._record_panel(jobs, list(results))
+        if self._ends_debate(is_last):
+            return merged, []
+        start = time.perf_counter()
+        retrieved = await asyncio.to_thread(self._build_context, merged)
+        self._waited_for_retrieval(start)
+        return merged, retrieved
 
-        return self.history
+    def _critique(
+        self, reviewer: ReviewerAgent, prompt: str, evidence: RenderedEvidence
+    ) -> Tuple[str, Dict[str, Any]]:
+        timer = GenerationTimer(reviewer.backend, self.metrics)
+        response = self._generate_response(
+            reviewer, prompt, evidence.text, evidence.citations, on_token=timer.on_token, echo=False
+        )
+        return response, self._turn_metrics(timer, evidence)
+
+    async def _acritique(
+        self, reviewer: ReviewerAgent, prompt: str, evidence: RenderedEvidence
+    ) -> Tuple[str, Dict[str, Any]]:
+        timer = GenerationTimer(reviewer.backend, self.metrics)
+        response = await self._agenerate_response(
+            reviewer, prompt, evidence.text, evidence.citations, on_token=timer.on_token, echo=False
+        )
+        return response, self._turn_metrics(timer, evidence)
+
+    def _record_panel(
+        self, jobs: List[Tuple[ReviewerAgent, RenderedEvidence]], results: List[Tuple[str, Dict[str, Any]]]
+    ) -> str:
+        """Record the panel's turns in panel order and return the merged critique of the round."""
+        for (reviewer, evidence), (response, metrics) in zip(jobs, results):
+            if self.stream_output:
+                # Critiques were generated side by side; show each one whole.
+                self.renderer.line(f"\n## {reviewer.name}\n{response.strip()}")
+                self._end_streamed_turn(evidence.citations)
+            self._evidence_sent(reviewer, evidence)
+            self._record(ConversationTurn(reviewer.name, response, evidence.citations, metrics))
+        return self.aggregate(self.history[-len(self.panel) :])
+
+    def _waited_for_retrieval(self, start: float) -> None:
+        # Time the next turn could not start because its context was not ready.
+        self._retrieval_wait = time.perf_counter() - start
+        self.metrics.record("retrieval_wait", self._retrieval_wait)
+
+    def _turn_metrics(self, timer: GenerationTimer, evidence: RenderedEvidence) -> Dict[str, Any]:
+        return {
+            "retrieval_wait_s": self._retrieval_wait,
+            "evidence_tokens_saved": evidence.tokens_saved,
+            **timer.finish(),
+        }
+
+    def _render_evidence(
+        self, agent: ExplainerAgent | ReviewerAgent, prompt: str, chunks: List[DocumentChunk]
+    ) -> RenderedEvidence:
+        # Earlier evidence can only be referenced while the model still holds the
+        # prompts it arrived in, i.e. when this very call continues the backend's
+        # session. A session rebuilt for overflow or a slid history window holds
+        # none of them, so the evidence then goes out in full.
+        if self.dedupe_evidence and getattr(agent.backend, "has_session", False):
+            evidence = self.evidence.render(agent.name, chunks)
+            if not evidence.referenced or self._continues_session(agent, prompt, evidence):
+                return evidence
+        self.evidence.forget(agent.name)
+        return self.evidence.render(agent.name, chunks)
+
+    def _continues_session(
+        self, agent: ExplainerAgent | ReviewerAgent, prompt: str, evidence: RenderedEvidence
+    ) -> bool:
+        will_continue = getattr(agent.backend, "will_continue", None)
+        if will_continue is None:
+            return True
+        return will_continue(agent.build_prompt(prompt, evidence.text), self._history_text())
+
+    def _evidence_sent(self, agent: ExplainerAgent | ReviewerAgent, evidence: RenderedEvidence) -> None:
+        if evidence.tokens_saved:
+            self.metrics.incr("evidence_tokens_saved", evidence.tokens_saved)
+        if not (self.dedupe_evidence and getattr(agent.backend, "has_session", False)):
+            return
+        stats = getattr(agent.backend, "last_stats", None)
+        # A prompt that did not continue the session started a new one holding only itself.
+        new_session = not (stats and stats.reused_context)
+        self.evidence.mark_seen(agent.name, evidence.sent, new_session=new_session)
+
+    def _prefetcher(self, executor: ThreadPoolExecutor | None) -> RetrievalPrefetcher | None:
+        if executor is None:
+            return None
+        return RetrievalPrefetcher(self._build_context, executor, min_chars=self.prefetch_min_chars)
+
+    def _prefetched(self, result: Tuple[List[DocumentChunk], bool]) -> List[DocumentChunk]:
+        retrieved, speculative = result
+        if speculative:
+            self.prefetch_stats.hits += 1
+        else:
+            self.prefetch_stats.misses += 1
+        return retrieved
 
     def _generate_response(
-        self, agent: ExplainerAgent | ReviewerAgent, prompt: str, context: str, citations: List[str]
+        self,
+        agent: ExplainerAgent | ReviewerAgent,
+        prompt: str,
+        context: str,
+        citations: List[str],
+        on_token: Callable[[str], None] | None = None,
+        echo: bool = True,
     ) -> str:
-        """Generate response with optional streaming output."""
-        # Build the full prompt with system + context + message
-        parts = [agent.system_prompt()]
-        if context:
-            parts.append("Context:\n" + context)
-        parts.append("Message:\n" + prompt)
-        full_prompt = "\n\n".join(parts)
-
-        if self.stream_output and hasattr(agent.backend, "generate_stream"):
-            # Stream tokens in real-time
-            print(f"\n## {agent.name}")
-            response_parts = []
-            for token in agent.backend.generate_stream(full_prompt, self._history_text()):
-                print(token, end="", flush=True)
-                sys.stdout.flush()
-                response_parts.append(token)
-            print()  # newline after streaming
+        """Generate response with optional streaming output.
 
-            if citations:
-                print(f"_Sources_: {' '.join(citations)}\n")
+        Streaming is also used silently when ``on_token`` wants partial output,
+        or when ``echo`` is off because other responses are generated alongside.
+        """
+        stream_output = self.stream_output and echo
+        if (stream_output or on_token) and hasattr(agent.backend, "generate_stream"):
+            full_prompt = agent.build_prompt(prompt, context)
+            tokens = agent.backend.generate_stream(full_prompt, self._history_text())
+            if not stream_output:
+                return "".join(_tap(tokens, on_token))
 
+            # Stream tokens in real-time, coalesced into frames
+            self.renderer.line(f"\n## {agent.name}")
+            response_parts = []
+            for token in _tap(tokens, on_token):
+                self.renderer.write(token)
+                response_parts.append(token)
+            self._end_streamed_turn(citations)
             return "".join(response_parts)
         else:
             # Standard non-streaming generation
             return agent.respond(prompt, context=context, history=self._history_text())
 
+    async def _agenerate_response(
+        self,
+        agent: ExplainerAgent | ReviewerAgent,
+        prompt: str,
+        context: str,
+        citations: List[str],
+        on_token: Callable[[str], None] | None = None,
+        echo: bool = True,
+    ) -> str:
+        stream_output = self.stream_output and echo
+        if (stream_output or on_token) and isinstance(agent.backend, AsyncBackend):
+            full_prompt = agent.build_prompt(prompt, context)
+            if stream_output:
+                self.renderer.line(f"\n## {agent.name}")
+            response_parts = []
+            async for token in agent.backend.astream(full_prompt, self._history_text()):
+                if on_token:
+                    on_token(token)
+                if stream_output:
+                    self.renderer.write(token)
+                response_parts.append(token)
+            if stream_output:
+                self._end_streamed_turn(citations)
+
+            return "".join(response_parts)
+        return await agent.arespond(prompt, context=context, history=self._history_text())
+
+    def _end_streamed_turn(self, citations: List[str]) -> None:
+        self.renderer.line()  # newline after streaming
+        if citations:
+            self.renderer.line(f"_Sources_: {' '.join(citations)}\n")
+
     def save_markdown(self, output_path: Path) -> None:
-        lines = ["# Debate Discussion", ""]
-        for turn in self.history:
-            lines.append(f"## {turn.speaker}")
-            lines.append(turn.message.strip())
-            if turn.citations:
-                lines.append(f"_Sources_: {' '.join(turn.citations)}")
-            lines.append("")
-        output_path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
+        output_path.write_text(self.to_markdown(), encoding="utf-8")
+
+    def to_markdown(self) -> str:
+        """The transcript; ``TranscriptWriter`` builds the same text turn by turn."""
+        turns = ("\n" + format_turn(turn.speaker, turn.message, turn.citations) for turn in self.history)
+        return TRANSCRIPT_HEADER + "".join(turns)
+
+    def _record(self, turn: ConversationTurn) -> None:
+        self.history.append(turn)
+        self.history_window.append(f"{turn.speaker}: {turn.message}")
+        if self.on_turn is not None:
+            self.on_turn(turn)
 
     def _history_text(self) -> List[str]:
-        return [f"{turn.speaker}: {turn.message}" for turn in self.history]
+        return self.history_window.texts()
 
-    def _build_context(self, query: str) -> Tuple[str, List[str]]:
+    def _build_context(self, query: str) -> List[DocumentChunk]:
+        """Chunks for the next prompt; they are formatted per agent when it takes its turn."""
         if not self.store or not query.strip():
-            return "", []
-
-        chunks = self.store.similarity_search(query, k=self.top_k)
-        if not chunks:
-            return "", []
-
-        return self._format_chunks(chunks)
-
-    def _format_chunks(self, chunks: List[DocumentChunk]) -> Tuple[str, List[str]]:
-        context_lines: List[str] = []
-        citations: List[str] = []
-        for chunk in chunks:
-            citation = f"[p.{chunk.page}]"
-            if citation not in citations:
-                citations.append(citation)
-            snippet = chunk.content.replace("\n", " ").strip()
-            context_lines.append(f"{citation} {snippet}")
-        return "\n".join(context_lines), citations
+            return []
+        with self.metrics.timer("retrieval"):
+            return self._retrieve(query)
+
+    def _retrieve(self, query: str) -> List[DocumentChunk]:
+        search_many = getattr(self.store, "similarity_search_many", None)
+        if search_many is not None:
+            # Message, its cited claims and the topic in a single retrieval round-trip.
+            chunks = search_many(self._sub_queries(query), k=self.top_k, limit=self.top_k)
+        else:
+            chunks = self.store.similarity_search(query, k=self.top_k)
+        return list(chunks or [])
+
+    def _sub_queries(self, query: str) -> List[str]:
+        queries = [query]
+        queries.extend(_extract_claims(query, self.max_claim_queries))
+        if self._topic and self._topic != query:
+            queries.append(self._topic)
+        return list(dict.fromkeys(q for q in queries if q.strip()))
+
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def _chain(*callbacks: Callable[[str], None] | None) -> Callable[[str], None]:
+    active = [callback for callback in callbacks if callback is not None]
+
+    def call(token: str) -> None:
+        for callback in active:
+            callback(token)
+
+    return call
+
+
+def _tap(tokens: Iterable[str], on_token: Callable[[str], None] | None) -> Iterator[str]:
+    for token in tokens:
+        if on_token:
+            on_token(token)
+        yield token
+
+
+def _extract_claims(text: str, limit: int) -> List[str]:
+    """Return up to ``limit`` sentences of ``text`` that carry a ``[p.X]`` citation."""
+    claims: List[str] = []
+    for sentence in _SENTENCE_SPLIT.split(text):
+        if len(claims) >= limit:
+            break
+        if CITATION_PATTERN.search(sentence):
+            claim = re.sub(r"\s+([.,;:!?])", r"\1", CITATION_PATTERN.sub("", sentence)).strip()
+            if claim:
+                claims.append(claim)
+    return claims
@@ -0,0 +1,85 @@
+"""Evidence already shown to each agent, referenced by short IDs instead of repeated."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Set
+
+from thedebator.history import TokenCounter
+from thedebator.retrieval import DocumentChunk
+
+
+# A ``[p.N]`` or ``[p.N, paper]`` citation in an agent's text.
+CITATION_PATTERN = re.compile(r"\[p\.\s*\d+[^\]]*\]")
+
+
+def citation_for(chunk: DocumentChunk) -> str:
+    """The ``[p.N]`` (or ``[p.N, paper]``) citation agents use for ``chunk``."""
+    return f"[p.{chunk.page}, {chunk.paper_id}]" if chunk.paper_id else f"[p.{chunk.page}]"
+
+
+@dataclass
+class RenderedEvidence:
+    """Context text for one prompt and what it cost."""
+
+    text: str = ""
+    citations: List[str] = field(default_factory=list)
+    # Chunks whose full text is in ``text``.
+    sent: List[str] = field(default_factory=list)
+    # Chunks only referenced by ID, and the prompt tokens that avoided.
+    referenced: List[str] = field(default_factory=list)
+    tokens_saved: int = 0
+
+
+@dataclass
+class EvidenceLedger:
+    """Short IDs for one conversation's retrieved chunks and what each agent has read.
+
+    Every chunk gets an ID such as ``E3`` the first time it is rendered. A
+    chunk a reader has already received in full is rendered as a one-line
+    reference to its ID instead of its text. That only helps while the
+    reader's backend still holds the earlier prompt, so callers ``forget`` a
+    reader whose model session was reset, and record what it read with
+    ``mark_seen`` once a prompt has actually been sent.
+    """
+
+    counter: TokenCounter = field(default_factory=TokenCounter)
+    ids: Dict[str, str] = field(default_factory=dict)
+    seen: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def evidence_id(self, chunk: DocumentChunk) -> str:
+        evidence_id = self.ids.get(chunk.chunk_id)
+        if evidence_id is None:
+            evidence_id = self.ids[chunk.chunk_id] = f"E{len(self.ids) + 1}"
+        return evidence_id
+
+    def render(self, reader: str, chunks: Sequence[DocumentChunk]) -> RenderedEvidence:
+        rendered = RenderedEvidence()
+        lines: List[str] = []
+        seen = self.seen.get(reader, set())
+        for chunk in chunks:
+            citation = citation_for(chunk)
+            if citation not in rendered.citations:
+                rendered.citations.append(citation)
+            label = f"[{self.evidence_id(chunk)}] {citation}"
+            snippet = chunk.content.replace("\n", " ").strip()
+            full = f"{label} {snippet}"
+            if chunk.chunk_id in seen:
+                reference = f"{label} (quoted earlier)"
+                rendered.tokens_saved += max(self.counter.count(full) - self.counter.count(reference), 0)
+                rendered.referenced.append(chunk.chunk_id)
+                lines.append(reference)
+            else:
+                rendered.sent.append(chunk.chunk_id)
+                lines.append(full)
+        rendered.text = "\n".join(lines)
+        return rendered
+
+    def mark_seen(self, reader: str, chunk_ids: Sequence[str], new_session: bool = False) -> None:
+        """Record that ``reader`` was sent ``chunk_ids``; a new session drops everything older."""
+        if new_session:
+            self.seen[reader] = set(chunk_ids)
+        else:
+            self.seen.setdefault(reader, set()).update(chunk_ids)
+
+    def forget(self, reader: str) -> None:
+        self.seen.pop(reader, None)
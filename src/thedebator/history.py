@@ -0,0 +1,157 @@
+"""Token-budgeted conversation history."""
+
+import re
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, List, Optional, Sequence, Tuple
+
+# Chars per token for English prose with Llama/Qwen-style BPE vocabularies.
+DEFAULT_CHARS_PER_TOKEN = 4.0
+# Observed ratios outside this range come from cached prompt prefixes or
+# template overhead rather than from the text itself; they are ignored.
+_PLAUSIBLE_RATIO = (1.5, 8.0)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class TokenCounter:
+    """Count tokens with a real tokenizer when one is given, else by a calibrated estimate.
+
+    The estimate divides the character count by ``chars_per_token``, which
+    ``calibrate`` nudges towards the ratio seen in actual prompt token counts
+    (as reported by the model server).
+    """
+
+    def __init__(
+        self,
+        tokenizer: Optional[Callable[[str], Sequence]] = None,
+        chars_per_token: float = DEFAULT_CHARS_PER_TOKEN,
+        smoothing: float = 0.2,
+    ) -> None:
+        self.tokenizer = tokenizer
+        self.chars_per_token = chars_per_token
+        self.smoothing = smoothing
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.tokenizer is not None:
+            return len(self.tokenizer(text))
+        return max(1, round(len(text) / self.chars_per_token))
+
+    def calibrate(self, chars: int, tokens: int) -> None:
+        """Fold an observed ``chars``/``tokens`` pair into the estimate."""
+        if self.tokenizer is not None or chars <= 0 or tokens <= 0:
+            return
+        ratio = chars / tokens
+        low, high = _PLAUSIBLE_RATIO
+        if low <= ratio <= high:
+            self.chars_per_token += self.smoothing * (ratio - self.chars_per_token)
+
+
+def load_tokenizer(name_or_path: str) -> Optional[Callable[[str], Sequence]]:
+    """Load a Hugging Face ``tokenizers`` tokenizer from a file or hub name, if possible."""
+    try:
+        from tokenizers import Tokenizer
+    except ImportError:
+        return None
+    try:
+        if Path(name_or_path).is_file():
+            tokenizer = Tokenizer.from_file(name_or_path)
+        else:
+            tokenizer = Tokenizer.from_pretrained(name_or_path)
+    except Exception:
+        return None
+    return lambda text: tokenizer.encode(text, add_special_tokens=False).ids
+
+
+def trim_history(history: Sequence[str], max_tokens: int, counter: Optional[TokenCounter] = None) -> List[str]:
+    """Return the most recent turns of ``history`` that fit in ``max_tokens``."""
+    counter = counter or TokenCounter()
+    kept: List[str] = []
+    total = 0
+    for turn in reversed(history):
+        tokens = counter.count(turn)
+        if total + tokens > max_tokens:
+            break
+        kept.append(turn)
+        total += tokens
+    kept.reverse()
+    return kept
+
+
+class HistoryWindow:
+    """Most recent conversation turns that fit a token budget.
+
+    Turns are formatted and counted once, on ``append``; the running total is
+    kept up to date as old turns are evicted from the left, so each turn costs
+    O(1) amortised however long the debate runs. With ``summarize`` the
+    evicted turns are condensed to their speaker and opening sentence and kept
+    in a summary capped at ``summary_tokens`` (taken out of ``max_tokens``).
+    """
+
+    SUMMARY_HEADER = "Earlier in the debate:"
+
+    def __init__(
+        self,
+        max_tokens: int = 2000,
+        counter: Optional[TokenCounter] = None,
+        summarize: bool = False,
+        summary_tokens: int = 200,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.counter = counter or TokenCounter()
+        self.summarize = summarize
+        self.summary_tokens = min(summary_tokens, max_tokens // 2) if summarize else 0
+        self.tokens = 0
+        self.evicted = 0
+        self._turns: Deque[Tuple[str, int]] = deque()
+        self._summary: Deque[Tuple[str, int]] = deque()
+        self._summary_total = 0
+        self._texts: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def append(self, turn: str) -> None:
+        tokens = self.counter.count(turn)
+        self._turns.append((turn, tokens))
+        self.tokens += tokens
+        budget = self.max_tokens - self.summary_tokens
+        while self._turns and self.tokens > budget:
+            evicted, evicted_tokens = self._turns.popleft()
+            self.tokens -= evicted_tokens
+            self.evicted += 1
+            if self.summarize:
+                self._add_summary(evicted)
+        self._texts = None
+
+    def texts(self) -> List[str]:
+        """Turns to send to the model, oldest first, with the summary (if any) in front."""
+        if self._texts is None:
+            texts = [turn for turn, _ in self._turns]
+            if self._summary:
+                lines = "\n".join(line for line, _ in self._summary)
+                texts.insert(0, f"{self.SUMMARY_HEADER}\n{lines}")
+            self._texts = texts
+        return list(self._texts)
+
+    def _add_summary(self, turn: str) -> None:
+        line = _summarize_turn(turn)
+        tokens = self.counter.count(line)
+        self._summary.append((line, tokens))
+        self._summary_total += tokens
+        while self._summary and self._summary_total > self.summary_tokens:
+            _, dropped = self._summary.popleft()
+            self._summary_total -= dropped
+
+
+def _summarize_turn(turn: str, max_words: int = 30) -> str:
+    speaker, sep, message = turn.partition(": ")
+    if not sep:
+        speaker, message = "", turn
+    first = _SENTENCE_END.split(message.strip(), 1)[0]
+    words = first.split()
+    if len(words) > max_words:
+        first = " ".join(words[:max_words]) + " ..."
+    return f"- {speaker}: {first}" if speaker else f"- {first}"
@@ -0,0 +1,180 @@
+"""Timers and counters for ingestion and debate runs."""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, IO, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one cache instance."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class TimerStats:
+    """Aggregate of every sample recorded under one timer name."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class Metrics:
+    """Thread-safe named timers (seconds) and counters for one run.
+
+    Timers are usually stage names such as ``pdf_extraction``, ``embedding``,
+    ``retrieval`` or ``generation``; counters hold totals such as
+    ``generated_tokens``. Code that accepts an optional ``Metrics`` records
+    nothing when it is ``None``.
+    """
+
+    def __init__(self) -> None:
+        self.timers: Dict[str, TimerStats] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.timers.setdefault(name, TimerStats()).add(seconds)
+
+    def incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed_iter(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Yield from ``items``, timing how long each item takes to produce."""
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.record(name, time.perf_counter() - start)
+            yield item
+
+    def discard(self, name: str) -> None:
+        """Drop a timer that was only needed to derive another figure."""
+        with self._lock:
+            self.timers.pop(name, None)
+
+    def total(self, name: str) -> float:
+        stats = self.timers.get(name)
+        return stats.total if stats else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view suitable for JSON."""
+        with self._lock:
+            return {
+                "timers": {
+                    name: {"count": s.count, "total_s": s.total, "mean_s": s.mean, "max_s": s.max}
+                    for name, s in self.timers.items()
+                },
+                "counters": dict(self.counters),
+            }
+
+    def format_table(self) -> str:
+        """Fixed-width summary: one row per timer, then the counters."""
+        with self._lock:
+            rows = sorted(self.timers.items(), key=lambda item: item[1].total, reverse=True)
+            counters = sorted(self.counters.items())
+        width = max([len(name) for name, _ in rows] + [len(name) for name, _ in counters] + [5])
+        lines = [f"{'stage':<{width}}  {'count':>6}  {'total s':>9}  {'mean s':>9}  {'max s':>9}"]
+        for name, stats in rows:
+            lines.append(
+                f"{name:<{width}}  {stats.count:>6}  {stats.total:>9.3f}  {stats.mean:>9.3f}  {stats.max:>9.3f}"
+            )
+        for name, value in counters:
+            lines.append(f"{name:<{width}}  {value:>6g}")
+        return "\n".join(lines)
+
+
+def write_jsonl(records: Iterable[Dict[str, Any]], stream: IO[str]) -> None:
+    for record in records:
+        stream.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def turn_records(turns: List[Any]) -> Iterator[Dict[str, Any]]:
+    """One JSON-able record per conversation turn that carries metrics."""
+    for index, turn in enumerate(turns, start=1):
+        yield {"type": "turn", "turn": index, "speaker": turn.speaker, **turn.metrics}
+
+
+class GenerationTimer:
+    """Measure one generation: time to first token, duration and throughput.
+
+    Pass ``on_token`` as the streaming callback. Token counts and prompt-eval
+    timings come from the backend's ``last_stats`` when it reports them (see
+    ``GenerationStats``); otherwise streamed chunks are counted as tokens.
+    """
+
+    def __init__(self, backend: Any, metrics: Metrics) -> None:
+        self.backend = backend
+        self.metrics = metrics
+        self._stats_before = getattr(backend, "last_stats", None)
+        self._start = time.perf_counter()
+        self._first_token: float | None = None
+        self._chunks = 0
+
+    def on_token(self, token: str) -> None:
+        if self._first_token is None:
+            self._first_token = time.perf_counter()
+        self._chunks += 1
+
+    def finish(self) -> Dict[str, Any]:
+        """Record the generation in ``metrics`` and return its per-turn figures."""
+        elapsed = time.perf_counter() - self._start
+        result: Dict[str, Any] = {"generation_s": elapsed}
+        self.metrics.record("generation", elapsed)
+        if self._first_token is not None:
+            result["ttft_s"] = self._first_token - self._start
+            self.metrics.record("time_to_first_token", result["ttft_s"])
+
+        stats = getattr(self.backend, "last_stats", None)
+        if stats is not None and stats is not self._stats_before:
+            result.update(
+                prompt_tokens=stats.prompt_tokens,
+                prompt_eval_s=stats.prompt_seconds,
+                generated_tokens=stats.eval_tokens,
+                tokens_per_s=stats.tokens_per_second,
+                context_reused=stats.reused_context,
+            )
+            self.metrics.record("prompt_eval", stats.prompt_seconds)
+            self.metrics.incr("prompt_tokens", stats.prompt_tokens)
+        elif self._chunks:
+            decode_seconds = elapsed - result.get("ttft_s", 0.0)
+            result.update(generated_tokens=self._chunks, tokens_per_s=self._chunks / max(decode_seconds, 1e-3))
+        if "generated_tokens" in result:
+            self.metrics.incr("generated_tokens", result["generated_tokens"])
+        return result
@@ -0,0 +1,74 @@
+"""Speculative retrieval that overlaps generation."""
+
+import re
+from concurrent.futures import Executor, Future
+from typing import Callable, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Text ending a sentence or a line: a point where partial output is a usable query.
+_BOUNDARY = re.compile(r"(?:[.!?][\"')\]]?|\n)\s*$")
+
+
+class RetrievalPrefetcher(Generic[T]):
+    """Start retrieval for a response while it is still being streamed.
+
+    Feed streamed tokens to ``feed``. Once at least ``min_chars`` new
+    characters have arrived and a token ends a sentence or line, ``retrieve``
+    runs on the partial text in ``executor``. At most one speculation is in
+    flight, and the next one starts from the latest text.
+
+    ``result`` returns a speculative result computed from at least
+    ``min_coverage`` of the final text, preferring one that has already
+    finished over waiting for a longer one. Otherwise it refines by retrieving
+    for the final text, which is the serial behaviour.
+    """
+
+    def __init__(
+        self,
+        retrieve: Callable[[str], T],
+        executor: Executor,
+        min_chars: int = 300,
+        min_coverage: float = 0.7,
+    ) -> None:
+        self.retrieve = retrieve
+        self.executor = executor
+        self.min_chars = min_chars
+        self.min_coverage = min_coverage
+        self.speculations = 0
+        self._parts: List[str] = []
+        self._length = 0
+        self._launched_at = 0
+        # Newest speculation last; the one before it is kept in case it already finished.
+        self._speculations: List[Tuple[str, Future]] = []
+
+    def feed(self, token: str) -> None:
+        self._parts.append(token)
+        self._length += len(token)
+        if self._length - self._launched_at < self.min_chars or not _BOUNDARY.search(token):
+            return
+        if self._speculations and not self._speculations[-1][1].done():
+            return
+        text = "".join(self._parts)
+        self._parts = [text]
+        self._launch(text)
+
+    def result(self, final_text: str) -> Tuple[T, bool]:
+        """Return ``(result, speculative)`` for ``final_text``."""
+        usable = [
+            future
+            for text, future in self._speculations
+            if final_text.startswith(text) and len(text) >= self.min_coverage * len(final_text)
+        ]
+        # Finished speculations first, newest first; then wait for the newest pending one.
+        for future in sorted(reversed(usable), key=lambda future: not future.done()):
+            try:
+                return future.result(), True
+            except Exception:
+                continue  # fall back to an older speculation or a fresh retrieval
+        return self.retrieve(final_text), False
+
+    def _launch(self, text: str) -> None:
+        self._launched_at = self._length
+        self.speculations += 1
+        self._speculations = [*self._speculations[-1:], (text, self.executor.submit(self.retrieve, text))]
@@ -0,0 +1,94 @@
+"""Terminal and transcript output for debates."""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, TextIO
+
+from thedebator.metrics import Metrics
+
+TRANSCRIPT_HEADER = "# Debate Discussion\n"
+
+
+def format_turn(speaker: str, message: str, citations: Sequence[str]) -> str:
+    """One turn of the markdown transcript, ending in a newline."""
+    lines = [f"## {speaker}", message.strip()]
+    if citations:
+        lines.append(f"_Sources_: {' '.join(citations)}")
+    return "\n".join(lines) + "\n"
+
+
+class TokenRenderer:
+    """Write streamed tokens to a terminal or pipe in frames rather than one by one.
+
+    Tokens are buffered until ``max_chars`` characters have accumulated or
+    ``max_delay`` seconds have passed since the last frame, then written and
+    flushed together. The delay is checked as tokens arrive, so a stalled model
+    leaves at most its last partial frame unwritten until the next token or
+    ``flush``. Use ``line`` for headings and other whole lines; it flushes
+    pending tokens first.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        max_delay: float = 0.05,
+        max_chars: int = 256,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.stream = stream
+        self.max_delay = max_delay
+        self.max_chars = max_chars
+        self.clock = clock
+        self.frames = 0
+        self._parts: List[str] = []
+        self._size = 0
+        self._last_frame = clock()
+
+    def write(self, token: str) -> None:
+        self._parts.append(token)
+        self._size += len(token)
+        if self._size >= self.max_chars or self.clock() - self._last_frame >= self.max_delay:
+            self.flush()
+
+    def line(self, text: str = "") -> None:
+        self._parts.append(text + "\n")
+        self.flush()
+
+    def flush(self) -> None:
+        stream = self.stream or sys.stdout  # looked up late so redirection (and capsys) applies
+        if self._parts:
+            stream.write("".join(self._parts))
+            self._parts, self._size = [], 0
+            self.frames += 1
+        stream.flush()
+        self._last_frame = self.clock()
+
+
+class TranscriptWriter:
+    """Append each turn to a markdown transcript as soon as it is finished.
+
+    The file holds the same text as ``Conversation.to_markdown`` at every
+    point, so an interrupted debate still leaves a readable transcript and the
+    end of a debate costs no rewrite. ``turns`` are written first, for a
+    resumed debate. Pass ``append`` as the conversation's ``on_turn`` callback.
+    """
+
+    def __init__(self, path: Path, turns: Sequence[Any] = (), metrics: Optional[Metrics] = None) -> None:
+        self.path = Path(path)
+        self.metrics = metrics or Metrics()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        self._file.write(TRANSCRIPT_HEADER)
+        for turn in turns:
+            self._file.write("\n" + format_turn(turn.speaker, turn.message, turn.citations))
+        self._file.flush()
+
+    def append(self, turn: Any) -> None:
+        with self.metrics.timer("markdown"):
+            self._file.write("\n" + format_turn(turn.speaker, turn.message, turn.citations))
+            self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
@@ -1,11 +1,54 @@
-"""Retrieval utilities."""
+"""Retrieval utilities.
 
-from .pdf import PDFIngestor
-from .store import VectorStore
-from .types import DocumentChunk
+Store, index and ingestion classes pull in NumPy, chromadb or PyPDF2, so they
+are imported on first attribute access rather than with the package.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .types import DocumentChunk, Retriever
+
+if TYPE_CHECKING:
+    from .base import BaseVectorStore
+    from .lexical import BM25Index, HybridRetriever
+    from .numpy_store import NumpyVectorStore
+    from .pdf import PDFIngestor
+    from .pipeline import IngestStats, ingest_stream
+    from .store import VectorStore
+
+_LAZY = {
+    "BM25Index": ".lexical",
+    "BaseVectorStore": ".base",
+    "HybridRetriever": ".lexical",
+    "IngestStats": ".pipeline",
+    "NumpyVectorStore": ".numpy_store",
+    "PDFIngestor": ".pdf",
+    "VectorStore": ".store",
+    "ingest_stream": ".pipeline",
+}
 
 __all__ = [
+    "BM25Index",
+    "BaseVectorStore",
+    "HybridRetriever",
+    "NumpyVectorStore",
     "PDFIngestor",
+    "Retriever",
     "VectorStore",
     "DocumentChunk",
+    "IngestStats",
+    "ingest_stream",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
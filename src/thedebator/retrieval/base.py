@@ -0,0 +1,201 @@
+"""Common interface for vector stores."""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from thedebator.backends.embedder import ChromaDefaultEmbedder, Embedder
+from thedebator.metrics import Metrics
+
+from .embedding_cache import CacheStats, CachedEmbedder, EmbeddingCache
+from .types import DocumentChunk
+
+# Matches with a cosine distance above this are considered irrelevant.
+MAX_DISTANCE = 0.5
+
+
+@dataclass
+class BaseVectorStore(ABC):
+    """Shared embedding setup and the interface every vector store implements.
+
+    Vectors are computed by ``embedder`` (Chroma's ONNX MiniLM by default),
+    optionally through a persistent ``EmbeddingCache`` in ``persist_directory``.
+
+    Search results are kept in a bounded LRU cache keyed by the normalised
+    query, ``k``, the paper filter and the store's write version. Subclasses call ``_invalidate``
+    whenever their contents change, so stale results are never served.
+    """
+
+    persist_directory: Path
+    collection_name: str = "debate"
+    embedder: Optional[Embedder] = None
+    embedding_cache: Optional[EmbeddingCache] = None
+    cache_embeddings: bool = True
+    embedding_cache_size: int = 100_000
+    query_cache_size: int = 256
+    metrics: Optional[Metrics] = None
+    query_cache_stats: CacheStats = field(init=False, repr=False, default_factory=CacheStats)
+    _query_cache: OrderedDict = field(init=False, repr=False, default_factory=OrderedDict)
+    _query_cache_lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+    _version: int = field(init=False, repr=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.persist_directory = Path(self.persist_directory)
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+
+        if self.embedder is None:
+            self.embedder = ChromaDefaultEmbedder()
+        if self.embedding_cache is None and self.cache_embeddings:
+            self.embedding_cache = EmbeddingCache(
+                self.persist_directory / "embedding_cache.sqlite",
+                max_entries=self.embedding_cache_size,
+            )
+        if self.embedding_cache is not None:
+            self.embedder = CachedEmbedder(self.embedder, self.embedding_cache)
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed ``texts`` with the configured embedder (cached when enabled)."""
+        if self.metrics is None:
+            return self.embedder.embed(texts)
+        with self.metrics.timer("embedding"):
+            vectors = self.embedder.embed(texts)
+        self.metrics.incr("embedded_texts", len(texts))
+        return vectors
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop every stored chunk."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert(self, chunks: Iterable[DocumentChunk]) -> int:
+        """Store chunks that are not persisted yet and return how many were written."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def prune(self, keep_ids: Iterable[str], paper_id: Optional[str] = None) -> int:
+        """Delete stored chunks whose IDs are not in ``keep_ids``; return the count removed.
+
+        With ``paper_id`` only that paper's chunks are considered, so other
+        papers in the collection are left alone.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, chunk_ids: Sequence[str]) -> List[DocumentChunk]:
+        """Return the stored chunks for ``chunk_ids`` (missing IDs are skipped)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _search_many(
+        self, queries: Sequence[str], k: int, papers: Optional[FrozenSet[str]] = None
+    ) -> List[List[Tuple[DocumentChunk, float]]]:
+        """Run one batched search for ``queries``, bypassing the result cache.
+
+        With ``papers`` only chunks of those paper IDs are candidates.
+        """
+        raise NotImplementedError
+
+    def search_many_with_distances(
+        self, queries: Sequence[str], k: int = 3, papers: Optional[Iterable[str]] = None
+    ) -> List[List[Tuple[DocumentChunk, float]]]:
+        """Search all ``queries`` in one batch.
+
+        Returns, per query, up to ``k`` ``(chunk, cosine distance)`` pairs,
+        nearest first and unfiltered. ``papers`` restricts the search to those
+        paper IDs. Cached queries are answered without touching the index; the
+        rest go out in a single batched search.
+        """
+        papers = frozenset(papers) if papers is not None else None
+        if self.query_cache_size <= 0:
+            return self._search_many(queries, k, papers)
+
+        keys = [(" ".join(query.split()).casefold(), k, papers, self._version) for query in queries]
+        results: List[Optional[List[Tuple[DocumentChunk, float]]]] = []
+        with self._query_cache_lock:
+            for key in keys:
+                hit = self._query_cache.get(key)
+                if hit is not None:
+                    self._query_cache.move_to_end(key)
+                results.append(hit)
+        missing = [i for i, hit in enumerate(results) if hit is None]
+        self.query_cache_stats.hits += len(keys) - len(missing)
+        self.query_cache_stats.misses += len(missing)
+        if not missing:
+            return results
+
+        # Duplicate queries within one call are searched once.
+        unique = list(dict.fromkeys(keys[i] for i in missing))
+        first_query = {keys[i]: queries[i] for i in reversed(missing)}
+        fresh = dict(zip(unique, self._search_many([first_query[key] for key in unique], k, papers)))
+        with self._query_cache_lock:
+            for key, hits in fresh.items():
+                if key[3] != self._version:
+                    continue  # the store changed while searching
+                self._query_cache[key] = hits
+                self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+                self.query_cache_stats.evictions += 1
+        for i in missing:
+            results[i] = fresh[keys[i]]
+        return results
+
+    def _invalidate(self) -> None:
+        """Bump the write version so cached search results are no longer used."""
+        with self._query_cache_lock:
+            self._version += 1
+            self._query_cache.clear()
+
+    def search_with_distances(
+        self, query: str, k: int = 3, papers: Optional[Iterable[str]] = None
+    ) -> List[Tuple[DocumentChunk, float]]:
+        """Return up to ``k`` ``(chunk, cosine distance)`` pairs, nearest first, unfiltered."""
+        return self.search_many_with_distances([query], k=k, papers=papers)[0]
+
+    def similarity_search(
+        self, query: str, k: int = 3, papers: Optional[Iterable[str]] = None
+    ) -> List[DocumentChunk]:
+        """Return up to ``k`` relevant chunks for ``query``, best first."""
+        return self.similarity_search_many([query], k=k, papers=papers)
+
+    def similarity_search_many(
+        self,
+        queries: Sequence[str],
+        k: int = 3,
+        limit: Optional[int] = None,
+        papers: Optional[Iterable[str]] = None,
+    ) -> List[DocumentChunk]:
+        """Search several queries in one round-trip and merge the results.
+
+        Each query contributes up to ``k`` relevant chunks; chunks found by more
+        than one query are kept once, at their best distance. The merged list is
+        ordered nearest first and cut to ``limit`` if given.
+        """
+        if not queries:
+            return []
+        return merge_results(self.search_many_with_distances(queries, k=k, papers=papers), limit=limit)
+
+    def flush(self) -> None:
+        """Persist buffered writes. Stores that write through need not override this."""
+
+
+def merge_results(
+    results: Sequence[Sequence[Tuple[DocumentChunk, float]]], limit: Optional[int] = None
+) -> List[DocumentChunk]:
+    """De-duplicate per-query ``(chunk, distance)`` lists into one relevant, nearest-first list."""
+    best: dict = {}
+    for hits in results:
+        for chunk, distance in hits:
+            # Filter low-relevance chunks (cosine distance > 0.5 means weak match)
+            if distance > MAX_DISTANCE:
+                continue
+            if chunk.chunk_id not in best or distance < best[chunk.chunk_id][1]:
+                best[chunk.chunk_id] = (chunk, distance)
+    ranked = sorted(best.values(), key=lambda pair: pair[1])
+    return [chunk for chunk, _ in ranked[:limit]]
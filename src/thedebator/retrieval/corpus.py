@@ -0,0 +1,275 @@
+"""Multi-paper corpus ingestion into one shared collection.
+
+Each paper is a namespace inside the collection: its chunks carry its
+``paper_id`` and title, it is pruned on its own, and it gets its own BM25
+shard. A JSON manifest next to the store records the file each paper was
+ingested from, so re-running ingestion only processes new or changed papers.
+"""
+
+import glob
+import hashlib
+import json
+import re
+import shutil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from thedebator.metrics import Metrics
+
+from .base import BaseVectorStore
+from .lexical import BM25Index, bm25_path, bm25_shard_path
+from .pdf import PDFIngestor, read_paper
+from .pipeline import IngestStats, ingest_stream
+
+
+@dataclass(frozen=True)
+class Paper:
+    """One PDF of the corpus and the ID its chunks are stored under."""
+
+    paper_id: str
+    path: Path
+
+
+@dataclass
+class CorpusStats:
+    """Counters reported at the end of a corpus ingestion run."""
+
+    papers: int = 0
+    ingested: int = 0
+    skipped: int = 0
+    removed_papers: int = 0
+    totals: IngestStats = field(default_factory=IngestStats)
+
+    def add(self, stats: IngestStats) -> None:
+        self.ingested += 1
+        for name in ("pages", "chunks", "batches", "stored", "removed"):
+            setattr(self.totals, name, getattr(self.totals, name) + getattr(stats, name))
+
+
+def paper_id_for(path: Path) -> str:
+    """A short, filesystem- and metadata-safe ID from the file name."""
+    return re.sub(r"[^a-z0-9]+", "-", Path(path).stem.lower()).strip("-") or "paper"
+
+
+def discover_papers(sources: Iterable[str | Path]) -> List[Paper]:
+    """Expand directories (searched recursively), globs and file paths into papers.
+
+    Files are de-duplicated and sorted. Papers whose file names map to the same
+    ID are told apart by a hash of their path.
+    """
+    paths: Dict[Path, None] = {}
+    for source in sources:
+        source = str(source)
+        if Path(source).is_dir():
+            matches = sorted(Path(source).rglob("*.pdf"))
+        elif glob.has_magic(source):
+            matches = sorted(Path(match) for match in glob.glob(source, recursive=True))
+        elif Path(source).is_file():
+            matches = [Path(source)]
+        else:
+            raise FileNotFoundError(f"No such paper, directory or glob match: {source}")
+        for match in matches:
+            if match.is_file():
+                paths.setdefault(match.resolve(), None)
+
+    by_id: Dict[str, List[Path]] = {}
+    for path in sorted(paths):
+        by_id.setdefault(paper_id_for(path), []).append(path)
+    papers = []
+    for paper_id, matches in by_id.items():
+        for path in matches:
+            if len(matches) > 1:
+                papers.append(Paper(f"{paper_id}-{hashlib.sha1(str(path).encode()).hexdigest()[:6]}", path))
+            else:
+                papers.append(Paper(paper_id, path))
+    return sorted(papers, key=lambda paper: paper.paper_id)
+
+
+def corpus_manifest_path(persist_directory: Path, collection_name: str) -> Path:
+    """Where the manifest of a collection's papers lives."""
+    return Path(persist_directory) / f"{collection_name}.corpus.json"
+
+
+class CorpusManifest:
+    """The papers in a collection, with the file fingerprint each was ingested from.
+
+    A paper is current when it was chunked with the same settings and its
+    file has the same size and modification time as recorded, or, if only the
+    time changed, the same SHA-256.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.papers: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "CorpusManifest":
+        manifest = cls(path)
+        if manifest.path.exists():
+            manifest.papers = json.loads(manifest.path.read_text(encoding="utf-8")).get("papers", {})
+        return manifest
+
+    def save(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"papers": self.papers}, indent=1), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def is_current(self, paper: Paper, settings: Dict[str, Any]) -> bool:
+        entry = self.papers.get(paper.paper_id)
+        if entry is None or entry.get("settings") != settings:
+            return False
+        stat = paper.path.stat()
+        if entry["size"] != stat.st_size:
+            return False
+        if entry["mtime_ns"] != stat.st_mtime_ns:
+            if entry["sha256"] != _sha256(paper.path):
+                return False
+            entry["mtime_ns"] = stat.st_mtime_ns  # touched, not changed
+        entry["path"] = str(paper.path)
+        return True
+
+    def record(self, paper: Paper, title: str, chunks: int, settings: Dict[str, Any]) -> None:
+        stat = paper.path.stat()
+        self.papers[paper.paper_id] = {
+            "path": str(paper.path),
+            "title": title,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": _sha256(paper.path),
+            "chunks": chunks,
+            "settings": settings,
+        }
+
+
+def ingest_corpus(
+    papers: Sequence[Paper],
+    store: BaseVectorStore,
+    chunk_size: int = 800,
+    chunk_overlap: int = 200,
+    batch_size: int = 100,
+    max_in_flight: int = 2,
+    workers: int = 1,
+    lexical: bool = True,
+    prune_missing: bool = False,
+    rebuild: bool = False,
+    on_paper: Callable[[Paper, Optional[IngestStats]], None] | None = None,
+    on_page: Callable[[int], None] | None = None,
+    metrics: Optional[Metrics] = None,
+) -> CorpusStats:
+    """Ingest ``papers`` into ``store``, skipping those the manifest shows unchanged.
+
+    Changed papers are re-chunked and pruned on their own; other papers'
+    chunks are never touched. With ``workers > 1`` several papers are
+    extracted in parallel processes (or, for a single paper, its pages), while
+    embedding and writes stay in this process. Papers in the manifest but not in
+    ``papers`` are deleted only with ``prune_missing``. ``on_paper`` is called
+    with each paper and its ``IngestStats``, or ``None`` when it was skipped.
+
+    With ``rebuild`` the collection, its manifest and its BM25 shards are
+    dropped first. A collection without a manifest was written before corpus
+    ingestion, so it is rebuilt too.
+    """
+    stats = CorpusStats(papers=len(papers))
+    manifest_path = corpus_manifest_path(store.persist_directory, store.collection_name)
+    if rebuild or not manifest_path.exists():
+        store.reset()
+        manifest_path.unlink(missing_ok=True)
+        shutil.rmtree(bm25_shard_path(store.persist_directory, store.collection_name, "").parent, ignore_errors=True)
+    manifest = CorpusManifest.load(manifest_path)
+    settings = {"chunk_size": chunk_size, "chunk_overlap": chunk_overlap}
+
+    stale = []
+    for paper in papers:
+        if manifest.is_current(paper, settings):
+            stats.skipped += 1
+            if on_paper:
+                on_paper(paper, None)
+        else:
+            stale.append(paper)
+
+    for paper, title, pages in _extract_papers(stale, workers, metrics):
+        shard = None
+        if lexical:
+            shard = BM25Index(bm25_shard_path(store.persist_directory, store.collection_name, paper.paper_id))
+        paper_stats = ingest_stream(
+            pages,
+            store,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            on_page=on_page,
+            prune=True,
+            lexical_index=shard,
+            metrics=metrics,
+            paper_id=paper.paper_id,
+            title=title,
+        )
+        stats.add(paper_stats)
+        manifest.record(paper, title, paper_stats.chunks, settings)
+        manifest.save()  # progress survives an interrupted run
+        if on_paper:
+            on_paper(paper, paper_stats)
+
+    if prune_missing:
+        wanted = {paper.paper_id for paper in papers}
+        for paper_id in [paper_id for paper_id in manifest.papers if paper_id not in wanted]:
+            stats.totals.removed += store.prune([], paper_id=paper_id)
+            shard_path = bm25_shard_path(store.persist_directory, store.collection_name, paper_id)
+            for path in (shard_path, BM25Index(shard_path).vocab_path):
+                path.unlink(missing_ok=True)
+            del manifest.papers[paper_id]
+            stats.removed_papers += 1
+
+    store.flush()
+    manifest.save()
+    merged = bm25_path(store.persist_directory, store.collection_name)
+    if lexical and (stats.ingested or stats.removed_papers or not merged.exists()):
+        _merge_lexical(store, manifest, merged, metrics)
+    return stats
+
+
+def _merge_lexical(store: BaseVectorStore, manifest: CorpusManifest, path: Path, metrics: Optional[Metrics]) -> None:
+    """Combine the papers' BM25 shards into the collection's index."""
+    metrics = metrics or Metrics()
+    with metrics.timer("lexical_merge"):
+        shards = [
+            BM25Index.load(bm25_shard_path(store.persist_directory, store.collection_name, paper_id))
+            for paper_id in sorted(manifest.papers)
+        ]
+        BM25Index.merge(path, [shard for shard in shards if shard is not None]).save()
+
+
+def _extract_papers(
+    papers: Sequence[Paper], workers: int, metrics: Optional[Metrics]
+) -> Iterator[Tuple[Paper, str, Iterable[Tuple[int, str]]]]:
+    """Yield ``(paper, title, pages)`` in order, extracting up to ``workers`` papers at once."""
+    if workers <= 1 or len(papers) <= 1:
+        for paper in papers:
+            ingestor = PDFIngestor(paper.path)
+            yield paper, ingestor.title(), ingestor.iter_pages(workers=workers)
+        return
+
+    metrics = metrics or Metrics()
+    queue = deque(papers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        while queue or pending:
+            while queue and len(pending) < workers * 2:
+                paper = queue.popleft()
+                pending.append((paper, executor.submit(read_paper, str(paper.path))))
+            paper, future = pending.popleft()
+            with metrics.timer("pdf_extraction"):
+                title, pages = future.result()
+            yield paper, title, pages
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,144 @@
+"""Persistent embedding cache backed by SQLite."""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from thedebator.backends.embedder import Embedder
+from thedebator.metrics import CacheStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    key BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (model, key)
+);
+CREATE INDEX IF NOT EXISTS embeddings_used ON embeddings (used);
+"""
+
+
+class EmbeddingCache:
+    """Map ``(model, sha256(text))`` to a float32 vector stored as a blob.
+
+    Entries carry a monotonically increasing ``used`` stamp that is refreshed on
+    every hit; once the table grows past ``max_entries`` the least recently used
+    rows are evicted. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 100_000) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT COALESCE(MAX(used), 0) FROM embeddings").fetchone()
+        self._clock = int(row[0])
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Return cached vectors in ``texts`` order, ``None`` where missing."""
+        keys = [self.key(text) for text in texts]
+        found = {}
+        with self._lock:
+            # SQLite limits bound parameters per statement; look up in slices.
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE model = ? AND key IN ({placeholders})",
+                    (model, *batch),
+                ).fetchall()
+                found.update(rows)
+            if found:
+                self._clock += 1
+                self._conn.executemany(
+                    "UPDATE embeddings SET used = ? WHERE model = ? AND key = ?",
+                    [(self._clock, model, key) for key in found],
+                )
+                self._conn.commit()
+
+        vectors: List[Optional[np.ndarray]] = []
+        for key in keys:
+            blob = found.get(key)
+            vectors.append(np.frombuffer(blob, dtype=np.float32) if blob is not None else None)
+        hits = sum(vector is not None for vector in vectors)
+        self.stats.hits += hits
+        self.stats.misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store vectors for ``texts`` and evict least recently used rows if over capacity."""
+        if not texts:
+            return
+        with self._lock:
+            self._clock += 1
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, key, vector, used) VALUES (?, ?, ?, ?)",
+                [
+                    (model, self.key(text), np.asarray(vector, dtype=np.float32).tobytes(), self._clock)
+                    for text, vector in zip(texts, vectors)
+                ],
+            )
+            self._evict()
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        count = int(self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0])
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN "
+            "(SELECT rowid FROM embeddings ORDER BY used LIMIT ?)",
+            (excess,),
+        )
+        self.stats.evictions += excess
+
+
+class CachedEmbedder(Embedder):
+    """Wrap an ``Embedder`` so repeated texts are served from an ``EmbeddingCache``."""
+
+    def __init__(self, inner: Embedder, cache: EmbeddingCache) -> None:
+        super().__init__(batch_size=inner.batch_size, threads=inner.threads)
+        self.inner = inner
+        self.cache = cache
+        self.name = inner.name
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        return self.inner.embed(texts)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        texts = list(texts)
+        if not texts:
+            return self.inner.embed(texts)
+
+        cached = self.cache.get_many(self.name, texts)
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if missing:
+            # Embed each distinct missing text once, even if it repeats in ``texts``.
+            unique_texts = list(dict.fromkeys(texts[i] for i in missing))
+            computed = self.inner.embed(unique_texts)
+            self.cache.put_many(self.name, unique_texts, computed)
+            rows = dict(zip(unique_texts, computed))
+            for i in missing:
+                cached[i] = rows[texts[i]]
+        return np.ascontiguousarray(np.vstack(cached), dtype=np.float32)
@@ -0,0 +1,279 @@
+"""BM25 inverted index and hybrid (lexical + dense) retrieval."""
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import MAX_DISTANCE, BaseVectorStore
+from .types import DocumentChunk
+
+# Words plus compounds joined by -, ., +, / or : ("BERT-base", "F1.5", "k/v").
+_TOKEN_RE = re.compile(r"\w+(?:[-.+/:]\w+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens; compounds are indexed whole and as their parts."""
+    tokens: List[str] = []
+    for match in _TOKEN_RE.findall(text.lower()):
+        tokens.append(match)
+        if not match.isalnum():
+            tokens.extend(part for part in re.split(r"[-.+/:]", match) if part)
+    return tokens
+
+
+class BM25Index:
+    """Okapi BM25 over chunk text, stored as flat postings arrays.
+
+    Postings for term ``t`` are ``doc_ids[offsets[t]:offsets[t + 1]]`` with the
+    matching term frequencies in ``tfs``. A lookup slices the postings of each
+    query term and accumulates scores with a single ``np.bincount``. Build with
+    ``add`` and ``save``; ``load`` reads the ``.npz`` arrays plus a small JSON
+    vocabulary. A built index is immutable: re-ingestion writes a new one, and
+    ``merge`` combines per-paper indexes into one for a corpus.
+    """
+
+    def __init__(self, path: Path, k1: float = 1.5, b: float = 0.75) -> None:
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+        self.chunk_ids: List[str] = []
+        self.paper_ids: List[str] = []
+        self._paper_array: Optional[np.ndarray] = None
+        self._pending: List[Counter] = []
+        self._vocab: Dict[str, int] = {}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._doc_ids = np.zeros(0, dtype=np.int32)
+        self._tfs = np.zeros(0, dtype=np.float32)
+        self._doc_len = np.zeros(0, dtype=np.float32)
+        self._idf = np.zeros(0, dtype=np.float32)
+
+    @property
+    def vocab_path(self) -> Path:
+        return self.path.with_suffix(".vocab.json")
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def add(self, chunk: DocumentChunk) -> None:
+        """Queue ``chunk`` for indexing; call ``build`` or ``save`` to finalise."""
+        self.chunk_ids.append(chunk.chunk_id)
+        self.paper_ids.append(chunk.paper_id)
+        self._paper_array = None
+        self._pending.append(Counter(tokenize(chunk.content)))
+
+    def build(self) -> None:
+        """Turn queued documents into postings arrays."""
+        if not self._pending:
+            return
+        if len(self._doc_len):
+            raise RuntimeError("BM25Index cannot add documents after it has been built")
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, counts in enumerate(self._pending):
+            for term, tf in counts.items():
+                postings.setdefault(term, []).append((doc_id, tf))
+
+        terms = sorted(postings)
+        self._vocab = {term: i for i, term in enumerate(terms)}
+        lengths = [len(postings[term]) for term in terms]
+        self._offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._offsets[1:])
+        flat = [pair for term in terms for pair in postings[term]]
+        self._doc_ids = np.array([doc for doc, _ in flat], dtype=np.int32)
+        self._tfs = np.array([tf for _, tf in flat], dtype=np.float32)
+        self._doc_len = np.array([sum(c.values()) for c in self._pending], dtype=np.float32)
+        n_docs = len(self._pending)
+        df = np.asarray(lengths, dtype=np.float32)
+        self._idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        self._pending = []
+
+    def save(self) -> None:
+        self.build()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            self.path,
+            offsets=self._offsets,
+            doc_ids=self._doc_ids,
+            tfs=self._tfs,
+            doc_len=self._doc_len,
+            idf=self._idf,
+        )
+        vocab = {
+            "terms": sorted(self._vocab, key=self._vocab.get),
+            "chunk_ids": self.chunk_ids,
+            "paper_ids": self.paper_ids,
+        }
+        self.vocab_path.write_text(json.dumps(vocab), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path, k1: float = 1.5, b: float = 0.75) -> Optional["BM25Index"]:
+        """Load a saved index, or return ``None`` if none exists at ``path``."""
+        index = cls(path, k1=k1, b=b)
+        if not (index.path.exists() and index.vocab_path.exists()):
+            return None
+        with np.load(index.path) as arrays:
+            index._offsets = arrays["offsets"]
+            index._doc_ids = arrays["doc_ids"]
+            index._tfs = arrays["tfs"]
+            index._doc_len = arrays["doc_len"]
+            index._idf = arrays["idf"]
+        vocab = json.loads(index.vocab_path.read_text(encoding="utf-8"))
+        index._vocab = {term: i for i, term in enumerate(vocab["terms"])}
+        index.chunk_ids = vocab["chunk_ids"]
+        index.paper_ids = vocab.get("paper_ids", [""] * len(index.chunk_ids))
+        return index
+
+    @classmethod
+    def merge(cls, path: Path, shards: Sequence["BM25Index"], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        """Combine indexes (e.g. one per paper) into one over all their documents.
+
+        Postings are concatenated with shifted document IDs and regrouped by
+        term; IDF is recomputed over the combined documents, so scores match
+        an index built in one pass.
+        """
+        index = cls(path, k1=k1, b=b)
+        for shard in shards:
+            shard.build()
+        shards = [shard for shard in shards if len(shard)]
+        if not shards:
+            return index
+
+        terms = sorted(set().union(*(shard._vocab for shard in shards)))
+        index._vocab = {term: i for i, term in enumerate(terms)}
+        term_parts, doc_parts = [], []
+        base = 0
+        for shard in shards:
+            to_global = np.empty(len(shard._vocab), dtype=np.int64)
+            for term, local in shard._vocab.items():
+                to_global[local] = index._vocab[term]
+            term_parts.append(np.repeat(to_global, np.diff(shard._offsets)))
+            doc_parts.append(shard._doc_ids + base)
+            index.chunk_ids.extend(shard.chunk_ids)
+            index.paper_ids.extend(shard.paper_ids)
+            base += len(shard)
+
+        term_of = np.concatenate(term_parts)
+        order = np.argsort(term_of, kind="stable")  # documents stay in order within a term
+        index._doc_ids = np.concatenate(doc_parts)[order].astype(np.int32)
+        index._tfs = np.concatenate([shard._tfs for shard in shards])[order]
+        df = np.bincount(term_of, minlength=len(terms))
+        index._offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(df, out=index._offsets[1:])
+        index._doc_len = np.concatenate([shard._doc_len for shard in shards])
+        index._idf = np.log1p((base - df + 0.5) / (df + 0.5)).astype(np.float32)
+        return index
+
+    def search(self, query: str, k: int = 10, papers: Optional[Sequence[str]] = None) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(chunk_id, score)`` pairs with a positive BM25 score.
+
+        With ``papers`` only chunks of those paper IDs are returned.
+        """
+        self.build()
+        n_docs = len(self.chunk_ids)
+        term_ids = {self._vocab[t] for t in tokenize(query) if t in self._vocab}
+        if not n_docs or not term_ids or k <= 0:
+            return []
+
+        avg_len = float(self._doc_len.mean()) or 1.0
+        docs_parts, weight_parts = [], []
+        for term_id in term_ids:
+            start, stop = self._offsets[term_id], self._offsets[term_id + 1]
+            docs = self._doc_ids[start:stop]
+            tf = self._tfs[start:stop]
+            norm = self.k1 * (1.0 - self.b + self.b * self._doc_len[docs] / avg_len)
+            docs_parts.append(docs)
+            weight_parts.append(self._idf[term_id] * tf * (self.k1 + 1.0) / (tf + norm))
+        scores = np.bincount(
+            np.concatenate(docs_parts), weights=np.concatenate(weight_parts), minlength=n_docs
+        )
+
+        if papers is not None:
+            if self._paper_array is None:
+                self._paper_array = np.array(self.paper_ids, dtype=object)
+            scores[~np.isin(self._paper_array, list(papers))] = 0.0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.chunk_ids[doc], float(scores[doc])) for doc in candidates]
+
+
+def bm25_path(persist_directory: Path, collection_name: str) -> Path:
+    """Where the lexical index for a collection lives."""
+    return Path(persist_directory) / f"{collection_name}.bm25.npz"
+
+
+def bm25_shard_path(persist_directory: Path, collection_name: str, paper_id: str) -> Path:
+    """Where one paper's lexical index lives; ``merge`` combines them into ``bm25_path``."""
+    return Path(persist_directory) / f"{collection_name}.bm25" / f"{paper_id}.npz"
+
+
+@dataclass
+class HybridRetriever:
+    """Fuse BM25 and dense rankings with reciprocal rank fusion.
+
+    Dense candidates are fetched without the distance cut-off so that chunks
+    the lexical index also finds can still be promoted; dense-only hits keep
+    the usual ``MAX_DISTANCE`` filter. Without a lexical index this is plain
+    dense search. ``papers`` scopes both rankings to those paper IDs.
+    """
+
+    store: BaseVectorStore
+    index: Optional[BM25Index] = None
+    candidates: int = 20
+    rrf_k: int = 60
+    papers: Optional[Sequence[str]] = None
+
+    def similarity_search(self, query: str, k: int = 3) -> List[DocumentChunk]:
+        return self.similarity_search_many([query], k=k)
+
+    def similarity_search_many(
+        self, queries: Sequence[str], k: int = 3, limit: Optional[int] = None
+    ) -> List[DocumentChunk]:
+        """Fuse each query separately, then merge: a chunk keeps its best fused score."""
+        if self.index is None or not len(self.index):
+            return self.store.similarity_search_many(queries, k=k, limit=limit, **self._scope())
+        if not queries:
+            return []
+
+        pool = max(self.candidates, k)
+        dense_batches = self.store.search_many_with_distances(queries, k=pool, **self._scope())
+
+        best: Dict[str, float] = {}
+        by_id: Dict[str, DocumentChunk] = {}
+        for query, dense in zip(queries, dense_batches):
+            scores: Dict[str, float] = {}
+            for rank, (chunk_id, _score) in enumerate(self.index.search(query, k=pool, **self._scope())):
+                scores[chunk_id] = 1.0 / (self.rrf_k + rank + 1)
+            lexical_ids = set(scores)
+            for rank, (chunk, distance) in enumerate(dense):
+                if distance > MAX_DISTANCE and chunk.chunk_id not in lexical_ids:
+                    continue
+                by_id[chunk.chunk_id] = chunk
+                scores[chunk.chunk_id] = scores.get(chunk.chunk_id, 0.0) + 1.0 / (self.rrf_k + rank + 1)
+            for chunk_id in sorted(scores, key=scores.get, reverse=True)[:k]:
+                best[chunk_id] = max(best.get(chunk_id, 0.0), scores[chunk_id])
+
+        ranked = sorted(best, key=best.get, reverse=True)[:limit]
+        missing = [chunk_id for chunk_id in ranked if chunk_id not in by_id]
+        if missing:
+            by_id.update((chunk.chunk_id, chunk) for chunk in self.store.get(missing))
+        return [by_id[chunk_id] for chunk_id in ranked if chunk_id in by_id]
+
+    def _scope(self) -> Dict[str, Sequence[str]]:
+        # Only pass a filter when there is one, so any store or index works unscoped.
+        return {"papers": self.papers} if self.papers is not None else {}
+
+
+def scope_to_papers(retriever: Any, papers: Optional[Sequence[str]]) -> Any:
+    """Return ``retriever`` restricted to ``papers``; the store and index are shared, not copied."""
+    if not papers:
+        return retriever
+    if isinstance(retriever, HybridRetriever):
+        return replace(retriever, papers=list(papers))
+    return HybridRetriever(retriever, None, papers=list(papers))
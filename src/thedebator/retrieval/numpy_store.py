@@ -0,0 +1,198 @@
+"""In-process vector index backed by a NumPy matrix."""
+
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .base import BaseVectorStore
+from .types import DocumentChunk
+
+
+@dataclass
+class NumpyVectorStore(BaseVectorStore):
+    """Brute-force cosine search over a contiguous, L2-normalised float32 matrix.
+
+    For a single paper (a few thousand chunks) one matrix-vector product beats
+    starting a Chroma client and going through its query machinery. Vectors
+    are persisted with ``np.save`` and memory-mapped on load; chunk text and
+    page metadata live in a JSON file next to them. Writes are buffered in
+    memory until ``flush``. Paper filters mask rows before the partial sort.
+    """
+
+    _ids: List[str] = field(init=False, repr=False, default_factory=list)
+    _contents: List[str] = field(init=False, repr=False, default_factory=list)
+    _pages: List[List[int]] = field(init=False, repr=False, default_factory=list)
+    _papers: List[str] = field(init=False, repr=False, default_factory=list)
+    _titles: Dict[str, str] = field(init=False, repr=False, default_factory=dict)
+    _rows: Dict[str, int] = field(init=False, repr=False, default_factory=dict)
+    _matrix: np.ndarray | None = field(init=False, repr=False, default=None)
+    _paper_array: np.ndarray | None = field(init=False, repr=False, default=None)
+    _loaded: bool = field(init=False, repr=False, default=False)
+    _dirty: bool = field(init=False, repr=False, default=False)
+    _load_lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    @property
+    def vectors_path(self):
+        return self.persist_directory / f"{self.collection_name}.vectors.npy"
+
+    @property
+    def records_path(self):
+        return self.persist_directory / f"{self.collection_name}.records.json"
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._ids)
+
+    def reset(self) -> None:
+        """Drop the stored index if present."""
+        for path in (self.vectors_path, self.records_path):
+            path.unlink(missing_ok=True)
+        self._ids, self._contents, self._pages, self._rows = [], [], [], {}
+        self._papers, self._titles = [], {}
+        self._matrix = None
+        self._paper_array = None
+        self._loaded = True
+        self._dirty = False
+        self._invalidate()
+
+    def upsert(self, chunks: Iterable[DocumentChunk]) -> int:
+        self._load()
+        unique = {chunk.chunk_id: chunk for chunk in chunks}
+        new_chunks = [chunk for chunk_id, chunk in unique.items() if chunk_id not in self._rows]
+        if not new_chunks:
+            return 0
+
+        vectors = _normalise(self.embed([chunk.content for chunk in new_chunks]))
+        for chunk in new_chunks:
+            self._rows[chunk.chunk_id] = len(self._ids)
+            self._ids.append(chunk.chunk_id)
+            self._contents.append(chunk.content)
+            self._pages.append([chunk.page, chunk.page_start, chunk.page_end])
+            self._papers.append(chunk.paper_id)
+            if chunk.paper_id:
+                self._titles[chunk.paper_id] = chunk.title
+        self._matrix = vectors if self._matrix is None else np.concatenate([self._matrix, vectors])
+        self._paper_array = None
+        self._dirty = True
+        self._invalidate()
+        return len(new_chunks)
+
+    def prune(self, keep_ids: Iterable[str], paper_id: str | None = None) -> int:
+        self._load()
+        keep = set(keep_ids)
+        rows = [
+            row
+            for row, chunk_id in enumerate(self._ids)
+            if chunk_id in keep or (paper_id is not None and self._papers[row] != paper_id)
+        ]
+        removed = len(self._ids) - len(rows)
+        if removed:
+            self._ids = [self._ids[row] for row in rows]
+            self._contents = [self._contents[row] for row in rows]
+            self._pages = [self._pages[row] for row in rows]
+            self._papers = [self._papers[row] for row in rows]
+            remaining = set(self._papers)
+            self._titles = {paper: title for paper, title in self._titles.items() if paper in remaining}
+            self._rows = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+            self._matrix = np.ascontiguousarray(self._matrix[rows]) if rows else None
+            self._paper_array = None
+            self._dirty = True
+            self._invalidate()
+        self.flush()
+        return removed
+
+    def flush(self) -> None:
+        if not self._dirty:
+            return
+        if self._matrix is None:
+            self.reset()
+            return
+        # Write to temporary files first so a crash never leaves a half-written index.
+        vectors_tmp = self.vectors_path.with_suffix(".tmp.npy")
+        records_tmp = self.records_path.with_suffix(".tmp")
+        np.save(vectors_tmp, self._matrix)
+        records = {
+            "ids": self._ids,
+            "contents": self._contents,
+            "pages": self._pages,
+            "papers": self._papers,
+            "titles": self._titles,
+        }
+        records_tmp.write_text(json.dumps(records), encoding="utf-8")
+        vectors_tmp.replace(self.vectors_path)
+        records_tmp.replace(self.records_path)
+        self._dirty = False
+
+    def get(self, chunk_ids: Sequence[str]) -> List[DocumentChunk]:
+        self._load()
+        return [self._chunk(self._rows[chunk_id]) for chunk_id in chunk_ids if chunk_id in self._rows]
+
+    def _search_many(
+        self, queries: Sequence[str], k: int, papers: FrozenSet[str] | None = None
+    ) -> List[List[Tuple[DocumentChunk, float]]]:
+        self._load()
+        if self._matrix is None or not len(self._ids) or k <= 0 or not queries:
+            return [[] for _ in queries]
+        allowed = None
+        if papers is not None:
+            if self._paper_array is None:
+                self._paper_array = np.array(self._papers, dtype=object)
+            allowed = np.isin(self._paper_array, list(papers))
+            k = min(k, int(allowed.sum()))
+            if not k:
+                return [[] for _ in queries]
+
+        # One (queries x chunks) matmul, then a row-wise partial sort.
+        scores = _normalise(self.embed(list(queries))) @ self._matrix.T
+        if allowed is not None:
+            scores[:, ~allowed] = -np.inf
+        k = min(k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        # Cosine distance, as reported by Chroma's "cosine" space.
+        return [
+            [(self._chunk(row), 1.0 - float(scores[q, row])) for row in top[q]]
+            for q in range(len(queries))
+        ]
+
+    def _chunk(self, row: int) -> DocumentChunk:
+        page, page_start, page_end = self._pages[row]
+        return DocumentChunk(
+            chunk_id=self._ids[row],
+            content=self._contents[row],
+            page=page,
+            page_start=page_start,
+            page_end=page_end,
+            paper_id=self._papers[row],
+            title=self._titles.get(self._papers[row], ""),
+        )
+
+    def _load(self) -> None:
+        # Several threads may search one store; only mark it loaded once the
+        # matrix is in place, so none of them sees a half-loaded index.
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            if self.vectors_path.exists() and self.records_path.exists():
+                records = json.loads(self.records_path.read_text(encoding="utf-8"))
+                self._ids = records["ids"]
+                self._contents = records["contents"]
+                self._pages = records["pages"]
+                # Indexes written before paper metadata existed hold a single unnamed paper.
+                self._papers = records.get("papers", [""] * len(self._ids))
+                self._titles = records.get("titles", {})
+                self._rows = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+                self._matrix = np.load(self.vectors_path, mmap_mode="r")
+            self._loaded = True
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
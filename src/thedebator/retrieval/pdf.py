@@ -1,12 +1,13 @@
 """PDF ingestion utilities."""
 
-from itertools import islice
+import re
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterable, Iterator, List, Tuple
 
-from PyPDF2 import PdfReader
-
-from .types import DocumentChunk
+from .types import DocumentChunk, content_chunk_id
 
 
 class PDFIngestor:
@@ -15,75 +16,164 @@ class PDFIngestor:
     def __init__(self, path: Path) -> None:
         self.path = Path(path)
 
-    def read_pages(self) -> List[Tuple[int, str]]:
-        """Return all pages as list of (page_number, text) tuples."""
-        reader = PdfReader(str(self.path))
-        return [(i + 1, page.extract_text() or "") for i, page in enumerate(reader.pages)]
+    def page_count(self) -> int:
+        """Return the number of pages without extracting any text."""
+        return len(_open_pdf(str(self.path)).pages)
+
+    def title(self) -> str:
+        """The title from the PDF metadata, or one derived from the file name."""
+        return _title(_open_pdf(str(self.path)), self.path)
+
+    def iter_pages(self, workers: int = 1) -> Iterator[Tuple[int, str]]:
+        """Yield ``(page_number, text)`` tuples in page order as they are extracted.
+
+        With ``workers > 1`` page ranges are extracted in a process pool. Only a
+        bounded number of shards is in flight at once, so memory stays flat no
+        matter how long the document is.
+        """
+        reader = _open_pdf(str(self.path))
+        if workers <= 1:
+            for i, page in enumerate(reader.pages):
+                yield i + 1, page.extract_text() or ""
+            return
+
+        shards = deque(_shard(len(reader.pages), workers * SHARDS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            while shards or pending:
+                while shards and len(pending) < workers * 2:
+                    start, stop = shards.popleft()
+                    pending.append(executor.submit(_extract_page_range, str(self.path), start, stop))
+                yield from pending.popleft().result()
+
+    def read_pages(self, workers: int = 1) -> List[Tuple[int, str]]:
+        """Return all pages as list of (page_number, text) tuples.
+
+        With ``workers > 1`` page ranges are extracted in a process pool; the
+        result is identical to the serial path and stays in page order.
+        """
+        return list(self.iter_pages(workers=workers))
 
     def iter_chunks(
         self,
         chunk_size: int = 800,
         chunk_overlap: int = 200,
+        workers: int = 1,
     ) -> Iterable[DocumentChunk]:
         """Yield overlapping chunks with page tracking across boundaries."""
-        pages = self.read_pages()
+        return chunk_pages(self.iter_pages(workers=workers), chunk_size, chunk_overlap)
 
-        # Build full text with page position tracking
-        full_text_parts = []
-        page_positions = []  # track where each page starts in full text
-        current_pos = 0
 
-        for page_num, text in pages:
-            if not text.strip():
-                continue
-            page_positions.append((page_num, current_pos))
-            full_text_parts.append(text)
-            current_pos += len(text) + 1  # +1 for space separator
+# Shards per worker: more, smaller ranges keep workers busy when some pages are
+# much slower to extract than others.
+SHARDS_PER_WORKER = 4
 
-        if not full_text_parts:
-            return
 
-        full_text = " ".join(full_text_parts)
-        words = full_text.split()
+def _shard(total: int, count: int) -> List[Tuple[int, int]]:
+    """Split ``range(total)`` into at most ``count`` contiguous ``(start, stop)`` ranges."""
+    if total <= 0:
+        return []
+    size = -(-total // max(count, 1))
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
 
-        if not words:
-            return
 
-        chunk_words = max(chunk_size, 1)
-        overlap_words = min(chunk_overlap, chunk_words - 1) if chunk_words > 1 else 0
-        step = max(chunk_words - overlap_words, 1)
+def title_from_path(path: Path) -> str:
+    """A readable title from a file name: ``attention_is-all.pdf`` -> ``attention is all``."""
+    return " ".join(re.split(r"[-_\s]+", Path(path).stem)).strip()
+
+
+def _open_pdf(path: str):
+    # PyPDF2 is imported here so that importing this module (for
+    # ``chunk_pages``) does not pay for it.
+    from PyPDF2 import PdfReader
+
+    return PdfReader(path)
+
+
+def read_paper(path: str) -> Tuple[str, List[Tuple[int, str]]]:
+    """Return ``(title, pages)`` for a whole PDF; runs in corpus worker processes."""
+    reader = _open_pdf(path)
+    return _title(reader, Path(path)), [(i + 1, page.extract_text() or "") for i, page in enumerate(reader.pages)]
+
+
+def _title(reader, path: Path) -> str:
+    metadata = reader.metadata
+    title = (metadata.title if metadata else None) or ""
+    return " ".join(str(title).split()) or title_from_path(path)
+
 
-        for chunk_index, chunk in enumerate(_window(words, chunk_words, step)):
-            content = " ".join(chunk).strip()
-            if not content:
-                continue
+def _extract_page_range(path: str, start: int, stop: int) -> List[Tuple[int, str]]:
+    """Extract pages ``[start, stop)`` in a worker process."""
+    reader = _open_pdf(path)
+    return [(i + 1, reader.pages[i].extract_text() or "") for i in range(start, stop)]
 
-            # Determine page from character position in full text
-            chunk_start = full_text.find(chunk[0]) if chunk else 0
-            page = 1
-            for pg_num, pg_pos in reversed(page_positions):
-                if chunk_start >= pg_pos:
-                    page = pg_num
-                    break
 
-            chunk_id = f"p{page}-c{chunk_index}"
-            yield DocumentChunk(chunk_id=chunk_id, content=content, page=page)
+def chunk_pages(
+    pages: Iterable[Tuple[int, str]],
+    chunk_size: int = 800,
+    chunk_overlap: int = 200,
+    paper_id: str = "",
+    title: str = "",
+) -> Iterator[DocumentChunk]:
+    """Split ``(page_number, text)`` pairs into overlapping word windows.
 
+    Every chunk is tagged with ``paper_id`` and ``title``.
 
-def _window(words: List[str], size: int, step: int) -> Iterator[List[str]]:
-    """Slide a window across words with overlap."""
-    if size <= 0:
-        size = 1
-    if step <= 0:
-        step = 1
+    Runs in a single pass and consumes ``pages`` lazily. Only the words that a
+    future window can still reach are buffered; ``page_offsets[i]`` holds the
+    absolute index of the first word of each buffered page, so the page range
+    of any window is two ``bisect`` lookups instead of a search through the text.
+    """
+    chunk_words = max(chunk_size, 1)
+    overlap_words = min(chunk_overlap, chunk_words - 1) if chunk_words > 1 else 0
+    step = max(chunk_words - overlap_words, 1)
 
+    words: List[str] = []  # buffered words; words[0] has absolute index ``base``
+    page_offsets: List[int] = []
+    page_numbers: List[int] = []
+    base = 0
     start = 0
-    total = len(words)
-    while start < total:
-        chunk = list(islice(words, start, start + size))
-        if not chunk:
-            break
-        yield chunk
-        if start + size >= total:
-            break
+    last_end = 0
+
+    def make_chunk(begin: int, end: int) -> DocumentChunk:
+        content = " ".join(words[begin - base : end - base])
+        page_start = page_numbers[bisect_right(page_offsets, begin) - 1]
+        page_end = page_numbers[bisect_right(page_offsets, end - 1) - 1]
+        return DocumentChunk(
+            chunk_id=content_chunk_id(content, page_start, page_end, paper_id),
+            content=content,
+            page=page_start,
+            page_start=page_start,
+            page_end=page_end,
+            paper_id=paper_id,
+            title=title,
+        )
+
+    for page_num, text in pages:
+        page_words = text.split()
+        if not page_words:
+            continue
+        page_offsets.append(base + len(words))
+        page_numbers.append(page_num)
+        words.extend(page_words)
+
+        # Emit every window that is already complete.
+        while start + chunk_words <= base + len(words):
+            last_end = start + chunk_words
+            yield make_chunk(start, last_end)
+            start += step
+
+        # Drop words and pages no later window can reach.
+        if start > base:
+            del words[: start - base]
+            base = start
+        first_page = bisect_right(page_offsets, start) - 1
+        if first_page > 0:
+            del page_offsets[:first_page]
+            del page_numbers[:first_page]
+
+    total = base + len(words)
+    while start < total and last_end < total:
+        last_end = min(start + chunk_words, total)
+        yield make_chunk(start, last_end)
         start += step
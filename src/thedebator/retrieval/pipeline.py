@@ -0,0 +1,143 @@
+"""Streaming ingestion pipeline: pages -> chunks -> batches -> vector store."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Protocol, Set, Tuple, TypeVar
+
+from thedebator.metrics import Metrics
+
+from .lexical import BM25Index
+from .pdf import chunk_pages
+from .types import DocumentChunk
+
+T = TypeVar("T")
+
+
+class ChunkSink(Protocol):
+    """Anything that can persist a batch of chunks (e.g. ``VectorStore``)."""
+
+    def upsert(self, chunks: Iterable[DocumentChunk]) -> int:
+        ...
+
+    def prune(self, keep_ids: Iterable[str], paper_id: Optional[str] = None) -> int:
+        ...
+
+    def flush(self) -> None:
+        ...
+
+
+@dataclass
+class IngestStats:
+    """Counters reported at the end of an ingestion run."""
+
+    pages: int = 0
+    chunks: int = 0
+    batches: int = 0
+    stored: int = 0
+    removed: int = 0
+
+    @property
+    def unchanged(self) -> int:
+        """Chunks that were already persisted and did not need embedding."""
+        return self.chunks - self.stored
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group ``items`` into lists of at most ``size`` elements."""
+    size = max(size, 1)
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def ingest_stream(
+    pages: Iterable[Tuple[int, str]],
+    store: ChunkSink,
+    chunk_size: int = 800,
+    chunk_overlap: int = 200,
+    batch_size: int = 100,
+    max_in_flight: int = 2,
+    on_page: Callable[[int], None] | None = None,
+    prune: bool = False,
+    lexical_index: BM25Index | None = None,
+    metrics: Optional[Metrics] = None,
+    paper_id: str = "",
+    title: str = "",
+) -> IngestStats:
+    """Stream ``pages`` through the chunker into ``store`` with bounded memory.
+
+    Upserts run on a background thread so extraction and chunking overlap with
+    embedding. At most ``max_in_flight`` batches are queued or being written at
+    any time; the producer blocks once that limit is reached.
+
+    With ``prune`` the store is asked to delete every chunk this run did not
+    produce, which makes re-ingesting an edited document incremental. Chunks
+    are tagged with ``paper_id`` and ``title``; when ``paper_id`` is set only
+    that paper's chunks are pruned. Every chunk is also added to
+    ``lexical_index`` (if given), which is saved at the end.
+
+    ``metrics`` (if given) receives ``pdf_extraction``, ``chunking``,
+    ``store_upsert``, ``store_flush``, ``prune`` and ``lexical_index`` timings.
+    """
+    stats = IngestStats()
+    metrics = metrics or Metrics()
+    extraction_before = metrics.total("pdf_extraction")
+    pages = metrics.timed_iter("pdf_extraction", pages)
+
+    def counted_pages() -> Iterator[Tuple[int, str]]:
+        for page in pages:
+            stats.pages += 1
+            if on_page:
+                on_page(page[0])
+            yield page
+
+    slots = threading.Semaphore(max(max_in_flight, 1))
+    futures: List[Future] = []
+    seen_ids: Set[str] = set()
+
+    def write(batch: List[DocumentChunk]) -> int:
+        try:
+            with metrics.timer("store_upsert"):
+                return store.upsert(batch)
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-upsert") as executor:
+        chunks = metrics.timed_iter(
+            "chunk_stream", chunk_pages(counted_pages(), chunk_size, chunk_overlap, paper_id, title)
+        )
+        for batch in batched(chunks, batch_size):
+            slots.acquire()
+            if prune:
+                seen_ids.update(chunk.chunk_id for chunk in batch)
+            if lexical_index is not None:
+                for chunk in batch:
+                    lexical_index.add(chunk)
+            stats.chunks += len(batch)
+            stats.batches += 1
+            futures.append(executor.submit(write, batch))
+            # Surface upsert failures early and keep the future list short.
+            while futures and futures[0].done():
+                stats.stored += futures.pop(0).result()
+        for future in futures:
+            stats.stored += future.result()
+
+    # Pulling chunks also pulls pages; attribute the difference to the chunker.
+    extraction = metrics.total("pdf_extraction") - extraction_before
+    metrics.record("chunking", max(metrics.total("chunk_stream") - extraction, 0.0))
+    metrics.discard("chunk_stream")
+    with metrics.timer("store_flush"):
+        store.flush()
+    if prune:
+        with metrics.timer("prune"):
+            stats.removed = store.prune(seen_ids, paper_id=paper_id) if paper_id else store.prune(seen_ids)
+    if lexical_index is not None:
+        with metrics.timer("lexical_index"):
+            lexical_index.save()
+    return stats
@@ -1,30 +1,38 @@
 """Vector store management using ChromaDB."""
 
-import hashlib
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 import chromadb
 from chromadb.config import Settings
 
+from .base import BaseVectorStore
 from .types import DocumentChunk
 
+# Chroma caps the number of records per request; stay well below it.
+_DELETE_BATCH = 1000
+
 
 @dataclass
-class VectorStore:
-    """Wrapper around ChromaDB client managing document chunks."""
+class VectorStore(BaseVectorStore):
+    """Wrapper around ChromaDB client managing document chunks.
+
+    Chunk IDs are content-addressed (see ``content_chunk_id``), so ``upsert``
+    only writes chunks that are not stored yet and ``prune`` removes the ones a
+    re-ingested document no longer produces. Embeddings are computed by the
+    store's embedder and handed to Chroma precomputed. ``paper_id`` and
+    ``title`` are stored as metadata, which paper filters query with ``$in``.
+    """
 
-    persist_directory: Path
-    collection_name: str = "debate"
     _client: Optional[chromadb.Client] = field(init=False, repr=False, default=None)
+    _collection_handle: Optional[Any] = field(init=False, repr=False, default=None)
 
     def __post_init__(self) -> None:
-        self.persist_directory = Path(self.persist_directory)
-        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        super().__post_init__()
 
         # Optimized settings for M2 Mac with Metal acceleration
         settings = Settings(
+            is_persistent=True,
             persist_directory=str(self.persist_directory),
             anonymized_telemetry=False,
             allow_reset=True,
@@ -39,73 +47,123 @@ class VectorStore:
         existing = {col.name for col in self._client.list_collections()}
         if self.collection_name in existing:
             self._client.delete_collection(self.collection_name)
-
-    def _compute_content_hash(self, chunks: List[DocumentChunk]) -> str:
-        """Hash chunk contents to detect changes and avoid re-ingestion."""
-        hasher = hashlib.sha256()
-        for chunk in sorted(chunks, key=lambda c: c.chunk_id):
-            hasher.update(chunk.content.encode("utf-8"))
-        return hasher.hexdigest()
+        self._collection_handle = None
+        self._invalidate()
+
+    def _collection(self):
+        # Opened once and reused; ``reset`` drops the handle.
+        if self._collection_handle is None:
+            # Use cosine similarity for better semantic search. Embeddings are
+            # always passed in explicitly, so Chroma needs no embedding function.
+            self._collection_handle = self._client.get_or_create_collection(
+                self.collection_name, metadata={"hnsw:space": "cosine"}, embedding_function=None
+            )
+        return self._collection_handle
 
     def upsert(self, chunks: Iterable[DocumentChunk]) -> int:
         if not self._client:
             raise RuntimeError("VectorStore client is not initialized")
 
-        chunk_list = list(chunks)
-        if not chunk_list:
+        unique = {chunk.chunk_id: chunk for chunk in chunks}
+        if not unique:
             return 0
 
-        content_hash = self._compute_content_hash(chunk_list)
+        collection = self._collection()
+        stored = set(collection.get(ids=list(unique), include=[]).get("ids", []))
+        new_chunks = [chunk for chunk_id, chunk in unique.items() if chunk_id not in stored]
+        if not new_chunks:
+            return 0
 
-        # Use cosine similarity for better semantic search
-        collection = self._client.get_or_create_collection(
-            self.collection_name,
-            metadata={"hnsw:space": "cosine", "content_hash": content_hash},
+        documents = [chunk.content for chunk in new_chunks]
+        collection.upsert(
+            ids=[chunk.chunk_id for chunk in new_chunks],
+            embeddings=self.embed(documents),
+            documents=documents,
+            metadatas=[
+                {
+                    "page": chunk.page,
+                    "page_start": chunk.page_start,
+                    "page_end": chunk.page_end,
+                    "paper_id": chunk.paper_id,
+                    "title": chunk.title,
+                }
+                for chunk in new_chunks
+            ],
         )
+        self._invalidate()
+        return len(new_chunks)
 
-        # Check if already ingested with same content
-        existing_meta = collection.metadata or {}
-        if existing_meta.get("content_hash") == content_hash:
-            print(f"Content unchanged (hash: {content_hash[:8]}...), skipping re-ingestion")
-            return len(chunk_list)
-
-        ids: List[str] = []
-        documents: List[str] = []
-        metadatas: List[dict] = []
-
-        for chunk in chunk_list:
-            ids.append(chunk.chunk_id)
-            documents.append(chunk.content)
-            metadatas.append({"page": chunk.page})
-
-        if ids:
-            collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
-
-        return len(ids)
-
-    def similarity_search(self, query: str, k: int = 3) -> List[DocumentChunk]:
+    def prune(self, keep_ids: Iterable[str], paper_id: Optional[str] = None) -> int:
         if not self._client:
-            return []
+            return 0
 
-        collection = self._client.get_or_create_collection(
-            self.collection_name, metadata={"hnsw:space": "cosine"}
-        )
+        collection = self._collection()
+        keep = set(keep_ids)
+        scope = {"where": {"paper_id": paper_id}} if paper_id is not None else {}
+        stored = collection.get(include=[], **scope).get("ids", [])
+        stale = [chunk_id for chunk_id in stored if chunk_id not in keep]
+        for start in range(0, len(stale), _DELETE_BATCH):
+            collection.delete(ids=stale[start : start + _DELETE_BATCH])
+        if stale:
+            self._invalidate()
+        return len(stale)
+
+    def get(self, chunk_ids: Sequence[str]) -> List[DocumentChunk]:
+        if not self._client or not chunk_ids:
+            return []
 
-        results = collection.query(
-            query_texts=[query], n_results=k, include=["documents", "metadatas", "distances"]
+        records = self._collection().get(ids=list(chunk_ids), include=["documents", "metadatas"])
+        by_id = {
+            chunk_id: _chunk_from_record(chunk_id, content, metadata)
+            for chunk_id, content, metadata in zip(
+                records.get("ids", []), records.get("documents", []), records.get("metadatas", [])
+            )
+        }
+        return [by_id[chunk_id] for chunk_id in chunk_ids if chunk_id in by_id]
+
+    def _search_many(
+        self, queries: Sequence[str], k: int, papers: Optional[FrozenSet[str]] = None
+    ) -> List[List[Tuple[DocumentChunk, float]]]:
+        if not self._client or not queries or papers == frozenset():
+            return [[] for _ in queries]
+
+        scope = {"where": {"paper_id": {"$in": sorted(papers)}}} if papers else {}
+        results = self._collection().query(
+            query_embeddings=self.embed(list(queries)),
+            n_results=k,
+            include=["documents", "metadatas", "distances"],
+            **scope,
         )
 
-        ids = results.get("ids", [[]])[0]
-        documents = results.get("documents", [[]])[0]
-        metadatas = results.get("metadatas", [[]])[0]
-        distances = results.get("distances", [[]])[0]
-
-        chunks: List[DocumentChunk] = []
-        for chunk_id, content, metadata, dist in zip(ids, documents, metadatas, distances):
-            # Filter low-relevance chunks (cosine distance > 0.5 means weak match)
-            if dist > 0.5:
-                continue
-            page = int(metadata.get("page", 0)) if isinstance(metadata, dict) else 0
-            chunks.append(DocumentChunk(chunk_id=chunk_id, content=content, page=page))
-
-        return chunks
+        batches: List[List[Tuple[DocumentChunk, float]]] = []
+        for i in range(len(queries)):
+            ids = _column(results, "ids", i)
+            documents = _column(results, "documents", i)
+            metadatas = _column(results, "metadatas", i)
+            distances = _column(results, "distances", i)
+            batches.append(
+                [
+                    (_chunk_from_record(chunk_id, content, metadata), float(dist))
+                    for chunk_id, content, metadata, dist in zip(ids, documents, metadatas, distances)
+                ]
+            )
+        return batches
+
+
+def _column(results: dict, key: str, index: int) -> list:
+    rows = results.get(key) or []
+    return rows[index] if index < len(rows) and rows[index] is not None else []
+
+
+def _chunk_from_record(chunk_id: str, content: str, metadata: dict | None) -> DocumentChunk:
+    metadata = metadata if isinstance(metadata, dict) else {}
+    page = int(metadata.get("page", 0))
+    return DocumentChunk(
+        chunk_id=chunk_id,
+        content=content,
+        page=page,
+        page_start=int(metadata.get("page_start", page)),
+        page_end=int(metadata.get("page_end", page)),
+        paper_id=str(metadata.get("paper_id", "")),
+        title=str(metadata.get("title", "")),
+    )
@@ -1,12 +1,53 @@
 """Shared retrieval data structures."""
 
+import hashlib
 from dataclasses import dataclass
+from typing import List, Protocol
 
 
 @dataclass
 class DocumentChunk:
-    """A single chunk of document text with citation metadata."""
+    """A single chunk of document text with citation metadata.
+
+    ``page`` is the page the chunk starts on; ``page_start``/``page_end`` give
+    the full (inclusive) page range for chunks that span a page break. Both
+    default to ``page`` when not supplied. ``paper_id`` and ``title`` name the
+    paper the chunk came from in a multi-paper corpus; they are empty for
+    chunks ingested without one.
+    """
 
     chunk_id: str
     content: str
     page: int
+    page_start: int = 0
+    page_end: int = 0
+    paper_id: str = ""
+    title: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.page_start:
+            self.page_start = self.page
+        if not self.page_end:
+            self.page_end = max(self.page_start, self.page)
+
+
+class Retriever(Protocol):
+    """What the conversation needs from retrieval: a vector store or a hybrid retriever."""
+
+    def similarity_search(self, query: str, k: int = 3) -> List[DocumentChunk]:
+        ...
+
+
+def content_chunk_id(content: str, page_start: int, page_end: int, paper_id: str = "") -> str:
+    """Return a stable, content-addressed chunk ID.
+
+    The ID only changes when the chunk text, its page range or its paper
+    changes, which is what lets re-ingestion skip chunks that are already
+    stored. Chunks of a paper are prefixed with its ``paper_id``, so identical
+    text in two papers never collides.
+    """
+    key = f"{page_start}:{page_end}:{content}"
+    if not paper_id:
+        return f"p{page_start}-{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}"
+    digest = hashlib.sha256(f"{paper_id}:{key}".encode("utf-8")).hexdigest()
+    return f"{paper_id}/p{page_start}-{digest[:16]}"
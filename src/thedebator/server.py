@@ -0,0 +1,332 @@
+"""Long-running debate server: warm models and index behind a local JSON API.
+
+Endpoints (all JSON; streams are newline-delimited JSON):
+
+- ``POST /debates`` with ``{"topic": ..., "rounds": 3, "papers": [...]}``
+  queues a debate and answers ``202`` with its ID, or ``429`` when the queue
+  is full. Add ``?stream=1`` to get the turns back on the same connection.
+- ``GET /debates/<id>`` returns the debate's status, turns and, once done, its
+  markdown transcript.
+- ``GET /debates/<id>/stream`` streams turns as they are produced, then a
+  final status record.
+- ``GET /health`` and ``GET /metrics`` report queue depth and stage timings.
+"""
+
+import json
+import logging
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from thedebator.agents import ExplainerAgent, ReviewerAgent
+from thedebator.conversation import Conversation, ConversationTurn
+from thedebator.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+AgentFactory = Callable[[], Tuple[ExplainerAgent | ReviewerAgent, ...]]
+RetrieverFactory = Callable[[Sequence[str]], Any]
+
+
+class QueueFull(Exception):
+    """Raised by ``DebateService.submit`` when no more debates can be queued."""
+
+
+@dataclass
+class DebateJob:
+    """One submitted debate and the turns it has produced so far."""
+
+    job_id: str
+    topic: str
+    rounds: int
+    papers: List[str] = field(default_factory=list)
+    status: str = "queued"  # queued, running, done or failed
+    turns: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    markdown: Optional[str] = None
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    _changed: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def start(self) -> None:
+        with self._changed:
+            self.status, self.started = "running", time.time()
+            self._changed.notify_all()
+
+    def add_turn(self, turn: ConversationTurn) -> None:
+        record = {
+            "turn": len(self.turns) + 1,
+            "speaker": turn.speaker,
+            "message": turn.message,
+            "citations": turn.citations,
+            "metrics": turn.metrics,
+        }
+        with self._changed:
+            self.turns.append(record)
+            self._changed.notify_all()
+
+    def finish(self, error: Optional[str] = None, markdown: Optional[str] = None) -> None:
+        with self._changed:
+            self.status = "failed" if error else "done"
+            self.error, self.markdown, self.finished = error, markdown, time.time()
+            self._changed.notify_all()
+
+    def follow(self) -> Iterator[Dict[str, Any]]:
+        """Yield every turn, waiting for new ones, until the debate has finished."""
+        sent = 0
+        while True:
+            with self._changed:
+                self._changed.wait_for(lambda: len(self.turns) > sent or self.done)
+                new, finished = self.turns[sent:], self.done
+            yield from new
+            sent += len(new)
+            if finished:
+                return
+
+    def summary(self, include_turns: bool = True) -> Dict[str, Any]:
+        with self._changed:
+            result = {
+                "id": self.job_id,
+                "topic": self.topic,
+                "rounds": self.rounds,
+                "papers": self.papers,
+                "status": self.status,
+                "error": self.error,
+                "submitted": self.submitted,
+                "started": self.started,
+                "finished": self.finished,
+            }
+            if include_turns:
+                result["turns"] = list(self.turns)
+                result["markdown"] = self.markdown
+        return result
+
+
+class DebateService:
+    """Run debates on a fixed pool of workers that keep their agents between jobs.
+
+    ``make_agents`` is called once per worker when the service starts and
+    returns ``(explainer, reviewer, *panel)``; reviewers after the first form
+    a review panel (see ``Conversation.panel``). Each
+    worker reuses its agents for every debate it runs and resets the backend
+    sessions in between, so model clients and loaded models stay warm.
+    ``retriever_for(papers)`` returns a retriever over the shared, already open
+    store. At most ``queue_size`` debates wait for a worker; ``submit`` raises
+    ``QueueFull`` beyond that. Finished debates are kept for ``keep_jobs``
+    submissions so clients can still fetch them.
+    """
+
+    def __init__(
+        self,
+        make_agents: AgentFactory,
+        retriever_for: RetrieverFactory,
+        workers: int = 2,
+        queue_size: int = 32,
+        default_rounds: int = 3,
+        max_rounds: int = 10,
+        keep_jobs: int = 500,
+        conversation_options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self.make_agents = make_agents
+        self.retriever_for = retriever_for
+        self.workers = max(workers, 1)
+        self.default_rounds = default_rounds
+        self.max_rounds = max_rounds
+        self.keep_jobs = keep_jobs
+        self.conversation_options = conversation_options or {}
+        self.metrics = metrics or Metrics()
+        self._queue: "queue.Queue[Optional[DebateJob]]" = queue.Queue(maxsize=max(queue_size, 1))
+        self._jobs: "OrderedDict[str, DebateJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._running = 0
+
+    def start(self) -> None:
+        # Agents are built here, not in the workers, so a bad config fails at startup.
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, args=(self.make_agents(),), name=f"debate-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def close(self) -> None:
+        """Let queued debates finish, then stop the workers."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, topic: str, rounds: Optional[int] = None, papers: Sequence[str] = ()) -> DebateJob:
+        if not isinstance(topic, str) or not topic.strip():
+            raise ValueError("'topic' must be a non-empty string")
+        rounds = self.default_rounds if rounds is None else rounds
+        if not isinstance(rounds, int) or isinstance(rounds, bool) or not 1 <= rounds <= self.max_rounds:
+            raise ValueError(f"'rounds' must be an integer from 1 to {self.max_rounds}")
+        if isinstance(papers, str) or not all(isinstance(paper, str) for paper in papers):
+            raise ValueError("'papers' must be a list of paper IDs")
+
+        job = DebateJob(uuid.uuid4().hex[:12], topic.strip(), rounds, list(papers))
+        with self._lock:
+            self._jobs[job.job_id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.job_id]
+            raise QueueFull(f"{self._queue.maxsize} debates are already waiting") from None
+        self.metrics.incr("debates_submitted")
+        self._forget_old_jobs()
+        return job
+
+    def get(self, job_id: str) -> Optional[DebateJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "workers": len(self._threads),
+            "running": self._running,
+            "queued": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+        }
+
+    def _work(self, agents: Tuple[ExplainerAgent | ReviewerAgent, ...]) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                self._running += 1
+            try:
+                self._run(job, *agents)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+    def _run(self, job: DebateJob, explainer: ExplainerAgent, reviewer: ReviewerAgent, *panel: ReviewerAgent) -> None:
+        for agent in (explainer, reviewer, *panel):
+            reset = getattr(agent.backend, "reset_session", None)
+            if reset is not None:
+                reset()  # the previous debate's context is no use to this one
+        job.start()
+        self.metrics.record("queue_wait", job.started - job.submitted)
+        try:
+            conversation = Conversation(
+                explainer=explainer,
+                reviewer=reviewer,
+                rounds=job.rounds,
+                panel=list(panel),
+                store=self.retriever_for(job.papers),
+                metrics=self.metrics,
+                on_turn=job.add_turn,
+                **self.conversation_options,
+            )
+            with self.metrics.timer("debate"):
+                conversation.run(job.topic)
+            job.finish(markdown=conversation.to_markdown())
+            self.metrics.incr("debates_completed")
+        except Exception as exc:  # report to the client instead of killing the worker
+            logger.exception("Debate %s failed", job.job_id)
+            job.finish(error=f"{type(exc).__name__}: {exc}")
+            self.metrics.incr("debates_failed")
+
+    def _forget_old_jobs(self) -> None:
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.done]
+            for job_id in finished[: max(len(self._jobs) - self.keep_jobs, 0)]:
+                del self._jobs[job_id]
+
+
+class DebateRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a ``DebateService``; see the module docstring for the API."""
+
+    service: DebateService
+    server_version = "thedebator"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/health":
+            return self._send_json(HTTPStatus.OK, self.service.health())
+        if path == "/metrics":
+            return self._send_json(HTTPStatus.OK, self.service.metrics.snapshot())
+        match = re.fullmatch(r"/debates/(\w+)(/stream)?", path)
+        job = self.service.get(match.group(1)) if match else None
+        if job is None:
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "no such debate"})
+        if match.group(2):
+            return self._stream(job)
+        return self._send_json(HTTPStatus.OK, job.summary())
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/debates":
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown endpoint"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+            job = self.service.submit(body.get("topic"), body.get("rounds"), body.get("papers") or [])
+        except QueueFull as exc:
+            return self._send_json(HTTPStatus.TOO_MANY_REQUESTS, {"error": str(exc)}, {"Retry-After": "5"})
+        except ValueError as exc:  # includes malformed JSON
+            return self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+
+        if parse_qs(url.query).get("stream", ["0"])[0] not in ("0", "false", ""):
+            return self._stream(job)
+        self._send_json(HTTPStatus.ACCEPTED, job.summary(include_turns=False), {"Location": f"/debates/{job.job_id}"})
+
+    def _stream(self, job: DebateJob) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            self._write_line({"type": "debate", **job.summary(include_turns=False)})
+            for turn in job.follow():
+                self._write_line({"type": "turn", **turn})
+            self._write_line({"type": "end", **job.summary(include_turns=False)})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client went away; the debate itself carries on
+
+    def _write_line(self, record: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(record).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def _send_json(self, status: HTTPStatus, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(service: DebateService, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """An HTTP server for ``service``; each request is handled on its own thread."""
+    handler = type("BoundDebateRequestHandler", (DebateRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import OllamaBackend
+from thedebator.cli import run_debates
+from thedebator.config import AppConfig
+from thedebator.conversation import Conversation
+
+DELAY = 0.2
+
+
+class FakeOllama(ThreadingHTTPServer):
+    """Minimal ``/api/generate`` endpoint that records how many requests overlap."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeOllamaHandler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.prompts: list[str] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        server: FakeOllama = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.prompts.append(body["prompt"])
+        try:
+            time.sleep(DELAY)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+        words = ["fake ", "model ", "reply"]
+        if body.get("stream", True):
+            lines = [{"model": body["model"], "response": word, "done": False} for word in words]
+            lines.append({"model": body["model"], "response": "", "done": True, "eval_count": 3})
+            payload = "".join(json.dumps(line) + "\n" for line in lines).encode()
+            content_type = "application/x-ndjson"
+        else:
+            payload = json.dumps(
+                {"model": body["model"], "response": "".join(words), "done": True, "eval_count": 3}
+            ).encode()
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_ollama():
+    server = FakeOllama()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_backend_generates_and_streams(fake_ollama: FakeOllama) -> None:
+    backend = OllamaBackend(model="fake", host=fake_ollama.url)
+
+    async def run():
+        reply = await backend.agenerate("hello")
+        tokens = [token async for token in backend.astream("hello")]
+        return reply, tokens
+
+    reply, tokens = asyncio.run(run())
+
+    assert reply == "fake model reply"
+    assert "".join(tokens) == "fake model reply"
+    assert len(tokens) > 1
+    assert backend.generate("hello") == "fake model reply"
+
+
+def test_arun_alternates_agents(fake_ollama: FakeOllama) -> None:
+    backend = OllamaBackend(model="fake", host=fake_ollama.url)
+    conversation = Conversation(
+        explainer=ExplainerAgent(backend=backend), reviewer=ReviewerAgent(backend=backend), rounds=2
+    )
+
+    history = asyncio.run(conversation.arun("Explain cell growth"))
+
+    assert [turn.speaker for turn in history] == ["Explainer A", "Reviewer B"] * 2
+    assert all(turn.message == "fake model reply" for turn in history)
+
+
+def test_debate_batch_runs_concurrently(
+    fake_ollama: FakeOllama, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OLLAMA_HOST", fake_ollama.url)
+    app_config = AppConfig(rounds=1)
+    topics = [f"Topic number {i}" for i in range(4)]
+
+    start = time.perf_counter()
+    paths = asyncio.run(run_debates(topics, app_config, None, tmp_path / "out", concurrency=4))
+    elapsed = time.perf_counter() - start
+
+    assert [path.name for path in paths] == [f"{i + 1:03d}-topic-number-{i}.md" for i in range(4)]
+    assert all("fake model reply" in path.read_text(encoding="utf-8") for path in paths)
+    assert fake_ollama.peak == 4
+    # Two turns per debate: sequential would take 8 * DELAY.
+    assert elapsed < 6 * DELAY
+
+
+def test_debate_batch_respects_concurrency_limit(
+    fake_ollama: FakeOllama, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OLLAMA_HOST", fake_ollama.url)
+
+    asyncio.run(run_debates(["a", "b", "c"], AppConfig(rounds=1), None, tmp_path, concurrency=2))
+
+    assert fake_ollama.peak == 2
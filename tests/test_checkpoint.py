@@ -0,0 +1,117 @@
+import asyncio
+from pathlib import Path
+
+import click
+import pytest
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import CachedBackend, FakeBackend, ResponseCache
+from thedebator.checkpoint import TurnCheckpoint, checkpoint_path
+from thedebator.cli import _open_checkpoint
+from thedebator.conversation import Conversation
+
+
+class CrashingBackend(FakeBackend):
+    """Fails on the call after ``calls_before_crash``, like an interrupted run."""
+
+    def __init__(self, calls_before_crash: int) -> None:
+        super().__init__(response_tokens=8)
+        self.calls_before_crash = calls_before_crash
+
+    def reply(self, prompt: str):
+        if self.calls >= self.calls_before_crash + 1:
+            raise KeyboardInterrupt
+        return super().reply(prompt)
+
+
+def _debate(backend, checkpoint: TurnCheckpoint, history=(), rounds: int = 2) -> Conversation:
+    return Conversation(
+        explainer=ExplainerAgent(backend=backend),
+        reviewer=ReviewerAgent(backend=backend),
+        rounds=rounds,
+        history=list(history),
+        on_turn=checkpoint.append,
+    )
+
+
+def test_interrupted_debate_resumes_at_the_next_turn(tmp_path: Path) -> None:
+    path = checkpoint_path(tmp_path / "discussion.md")
+    assert path.name == "discussion.checkpoint.jsonl"
+
+    checkpoint = TurnCheckpoint.start(path, "Explain cell growth", rounds=2)
+    with pytest.raises(KeyboardInterrupt):
+        _debate(CrashingBackend(calls_before_crash=3), checkpoint).run("Explain cell growth")
+    checkpoint.close()
+
+    checkpoint, header, done = TurnCheckpoint.resume(path)
+    assert header == {"type": "debate", "topic": "Explain cell growth", "rounds": 2}
+    assert [turn.speaker for turn in done] == ["Explainer A", "Reviewer B", "Explainer A"]
+
+    backend = FakeBackend(response_tokens=8)
+    resumed = _debate(backend, checkpoint, history=done).run("Explain cell growth")
+    checkpoint.close()
+
+    assert backend.calls == 1
+    assert [turn.speaker for turn in resumed] == ["Explainer A", "Reviewer B"] * 2
+    assert [turn.message for turn in resumed[:3]] == [turn.message for turn in done]
+    _, saved = TurnCheckpoint.load(path)
+    assert [turn.message for turn in saved] == [turn.message for turn in resumed]
+
+
+def test_partly_written_turn_is_dropped(tmp_path: Path) -> None:
+    path = tmp_path / "debate.checkpoint.jsonl"
+    checkpoint = TurnCheckpoint.start(path, "topic", rounds=1)
+    checkpoint.close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"type": "turn", "speaker": "Explainer A", "mess')
+
+    checkpoint, _, done = TurnCheckpoint.resume(path)
+    checkpoint.close()
+
+    assert done == []
+    assert path.read_text(encoding="utf-8").count("\n") == 1
+
+
+def test_resume_refuses_another_topic(tmp_path: Path) -> None:
+    path = tmp_path / "debate.checkpoint.jsonl"
+    TurnCheckpoint.start(path, "topic one", rounds=1).close()
+
+    with pytest.raises(click.ClickException):
+        _open_checkpoint(path, "topic two", 1, resume=True)
+    checkpoint, done = _open_checkpoint(path, "topic two", 1, resume=False)
+    checkpoint.close()
+    assert done == [] and TurnCheckpoint.load(path)[0]["topic"] == "topic two"
+
+
+def test_response_cache_replays_identical_requests(tmp_path: Path) -> None:
+    def run(inner: FakeBackend) -> list:
+        backend = CachedBackend(inner, ResponseCache(tmp_path / "responses.sqlite"))
+        conversation = Conversation(
+            explainer=ExplainerAgent(backend=backend), reviewer=ReviewerAgent(backend=backend), rounds=2
+        )
+        return [turn.message for turn in conversation.run("Explain cell growth")]
+
+    first_backend, replay_backend = FakeBackend(response_tokens=10), FakeBackend(response_tokens=10)
+    first = run(first_backend)
+    replay = run(replay_backend)
+
+    assert first_backend.calls == 4 and replay_backend.calls == 0
+    assert replay == first
+    changed = FakeBackend(response_tokens=10, seed=1)
+    run(changed)
+    assert changed.calls == 4
+
+
+def test_response_cache_async_path(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "responses.sqlite")
+    inner = FakeBackend(response_tokens=10)
+    backend = CachedBackend(inner, cache)
+
+    first = asyncio.run(backend.agenerate("prompt", history=["Topic: cells"]))
+    again = asyncio.run(backend.agenerate("prompt", history=["Topic: cells"]))
+    other = asyncio.run(backend.agenerate("prompt", history=["Topic: bleu"]))
+
+    assert first == again == backend.generate("prompt", history=["Topic: cells"])
+    assert inner.calls == 2 and other
+    assert (cache.stats.hits, cache.stats.misses, len(cache)) == (2, 2, 2)
@@ -34,3 +34,56 @@ models:
     assert config.models.reviewer == "llama3:70b"
     # Legacy attribute mirrors explainer for backward compatibility
     assert config.model == "llama3:8b"
+
+
+def test_load_config_performance_section(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("performance:\n  batch_size: 150\n  workers: 4\n", encoding="utf-8")
+
+    config = load_config(config_path)
+
+    assert config.performance.batch_size == 150
+    assert config.performance.workers == 4
+
+
+def test_load_config_ollama_section(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("ollama:\n  keep_alive: 1h\n  retries: 5\n  warm: false\n", encoding="utf-8")
+
+    config = load_config(config_path)
+
+    assert config.ollama.keep_alive == "1h"
+    assert config.ollama.retries == 5
+    assert config.ollama.warm is False
+    assert config.ollama.host is None
+
+
+def test_load_config_numeric_keep_alive(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("ollama:\n  keep_alive: -1\n", encoding="utf-8")
+
+    assert load_config(config_path).ollama.keep_alive == -1
+
+    config_path.write_text("ollama:\n  keep_alive: 3600\n", encoding="utf-8")
+    assert load_config(config_path).ollama.keep_alive == 3600
+
+
+def test_load_config_paper_corpus(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("paper:\n  path: one.pdf\n  corpus: papers/\n", encoding="utf-8")
+
+    config = load_config(config_path)
+
+    assert config.paper.path == Path("one.pdf")
+    assert config.paper.corpus == ["papers/"]
+
+
+def test_load_config_server_section(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("server:\n  port: 9000\n  workers: 4\n", encoding="utf-8")
+
+    config = load_config(config_path)
+
+    assert config.server.port == 9000
+    assert config.server.workers == 4
+    assert config.server.host == "127.0.0.1"
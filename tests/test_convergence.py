@@ -0,0 +1,111 @@
+import asyncio
+from pathlib import Path
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import FakeBackend
+from thedebator.config import load_config
+from thedebator.convergence import ConvergenceDetector, text_similarity
+from thedebator.conversation import Conversation, ConversationTurn
+from thedebator.retrieval.types import DocumentChunk
+
+EXPLANATION = "Cells grow by dividing, and the rate doubles under heat stress [p.2]."
+
+
+class RepeatingBackend(FakeBackend):
+    """Says the same thing every turn, like a debate that has run dry."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__(response_tokens=len(text.split()))
+        self.text = text
+
+    def reply(self, prompt: str):
+        return [word + " " for word in self.text.split()]
+
+
+class SamePageStore:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def similarity_search(self, query: str, k: int = 3):
+        self.queries.append(query)
+        return [DocumentChunk(chunk_id="c1", content="Cells divide faster under heat.", page=2)]
+
+
+def _round(explanation: str, critique: str, citations=("[p.2]",)):
+    return [
+        ConversationTurn("Explainer A", explanation, list(citations)),
+        ConversationTurn("Reviewer B", critique, list(citations)),
+    ]
+
+
+def test_detector_needs_stale_rounds_past_min_rounds() -> None:
+    detector = ConvergenceDetector(min_rounds=2)
+    same = [_round(EXPLANATION, "What about the controls?") for _ in range(3)]
+
+    assert detector.check(same[:1]) is None
+    assert "no new citations" in detector.check(same[:2])
+    assert ConvergenceDetector(patience=2).check(same[:2]) is None
+    assert ConvergenceDetector(patience=2).check(same) is not None
+
+    new_page = [same[0], _round(EXPLANATION, "See also [p.7].")]
+    assert detector.check(new_page) is None
+    reworded = [same[0], _round("An entirely different account of membrane transport [p.2].", "Fine.")]
+    assert detector.check(reworded) is None
+    agreed = [same[0], _round("New point [p.9].", "I am now convinced; no further concerns.")]
+    assert detector.check(agreed) == "the reviewers agree"
+    conceded = (
+        "I agree the ablation exists, but it only covers one dataset and no variance is reported; "
+        "this claim is not established [p.6]"
+    )
+    assert detector.check([same[0], _round("New point [p.9].", conceded)]) is None
+    assert detector.check([same[0], _round("New point [p.9].", "I agree the ablation settles it [p.6].")]) is None
+    assert detector.check([same[0], _round("New point [p.9].", "I agree, with no further concerns [p.2].")])
+
+
+def test_text_similarity_ignores_shared_vocabulary() -> None:
+    assert text_similarity(EXPLANATION, EXPLANATION) > 0.99
+    assert text_similarity("cells divide under heat", "heat under divide cells") == 0.0
+    assert text_similarity("", EXPLANATION) == 0.0
+
+
+def test_converged_debate_stops_and_reports_savings() -> None:
+    for run in (lambda c: c.run("Explain cell growth"), lambda c: asyncio.run(c.arun("Explain cell growth"))):
+        explainer, reviewer = RepeatingBackend(EXPLANATION), RepeatingBackend("Is the effect robust? [p.2]")
+        conversation = Conversation(
+            explainer=ExplainerAgent(backend=explainer),
+            reviewer=ReviewerAgent(backend=reviewer),
+            rounds=5,
+            store=SamePageStore(),
+            convergence=ConvergenceDetector(min_rounds=2),
+        )
+
+        history = run(conversation)
+
+        assert len(history) == 4 and explainer.calls == reviewer.calls == 2
+        # The topic and the first three turns; the converged last turn needs no retrieval.
+        assert len(conversation.store.queries) == 4
+        stop = conversation.early_stop
+        assert (stop.rounds_run, stop.rounds_skipped) == (2, 3)
+        assert stop.tokens_saved == 3 * (len(EXPLANATION.split()) + 5)
+        counters = conversation.metrics.snapshot()["counters"]
+        assert counters["rounds_skipped"] == 3 and counters["generated_tokens_saved"] == stop.tokens_saved
+
+        # A resumed debate that had already converged does not start another round.
+        resumed = Conversation(
+            explainer=ExplainerAgent(backend=explainer),
+            reviewer=ReviewerAgent(backend=reviewer),
+            rounds=5,
+            history=list(history),
+            convergence=ConvergenceDetector(min_rounds=2),
+        )
+        assert len(resumed.run("Explain cell growth")) == 4 and explainer.calls == 2
+
+
+def test_load_config_convergence(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text("convergence:\n  enabled: true\n  patience: 2\n", encoding="utf-8")
+
+    settings = load_config(path).convergence
+
+    assert settings.enabled and settings.patience == 2 and settings.min_rounds == 2
@@ -52,3 +52,34 @@ def test_conversation_produces_citations(tmp_path: Path) -> None:
 
     content = output_path.read_text(encoding="utf-8")
     assert "[p.2]" in content
+
+
+class BatchedStore:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def similarity_search_many(self, queries, k=3, limit=None):
+        self.calls.append(list(queries))
+        return [DocumentChunk(chunk_id="c1", content="Cells divide faster.", page=2)]
+
+
+def test_conversation_batches_sub_queries_per_turn() -> None:
+    backend = FakeBackend(label="Cells divide faster at 37C [p.2]. Growth slows later")
+    store = BatchedStore()
+    conversation = Conversation(
+        explainer=ExplainerAgent(backend=backend),
+        reviewer=ReviewerAgent(backend=backend),
+        rounds=1,
+        store=store,
+        top_k=2,
+    )
+
+    conversation.run("Explain cell growth")
+
+    # One retrieval round-trip per turn.
+    assert len(store.calls) == 2
+    assert store.calls[0] == ["Explain cell growth"]
+    reviewer_queries = store.calls[1]
+    assert reviewer_queries[0].startswith("Cells divide faster")
+    assert "Cells divide faster at 37C." in reviewer_queries
+    assert reviewer_queries[-1] == "Explain cell growth"
@@ -0,0 +1,148 @@
+import os
+
+import numpy as np
+
+from benchmarks.synthetic import write_pdf
+from thedebator.backends.embedder import HashingEmbedder
+from thedebator.retrieval.corpus import CorpusManifest, corpus_manifest_path, discover_papers, ingest_corpus
+from thedebator.retrieval.lexical import BM25Index, HybridRetriever, bm25_path
+from thedebator.retrieval.numpy_store import NumpyVectorStore
+from thedebator.retrieval.types import DocumentChunk
+
+TOPICS = {
+    "attention": "attention heads transformer encoder decoder layer",
+    "cells": "cells divide membrane culture growth medium",
+    "bleu": "translation bleu wmt14 german english corpus",
+}
+
+
+def _paper(directory, name: str, pages: int = 3):
+    words = TOPICS[name].split()
+    texts = [" ".join(f"{words[(page + i) % len(words)]}" for i in range(60)) for page in range(pages)]
+    return write_pdf(directory / f"{name}.pdf", texts)
+
+
+def _store(path) -> NumpyVectorStore:
+    return NumpyVectorStore(path, embedder=HashingEmbedder(dimension=128), cache_embeddings=False)
+
+
+def _ingest(papers_dir, store_dir, **kwargs):
+    store = _store(store_dir)
+    stats = ingest_corpus(discover_papers([papers_dir]), store, chunk_size=40, chunk_overlap=10, **kwargs)
+    return stats, store
+
+
+def test_discover_papers_expands_sources_and_disambiguates(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    for path in (tmp_path / "a" / "Attention_Paper.pdf", tmp_path / "b" / "attention paper.pdf", tmp_path / "cells.pdf"):
+        path.write_bytes(b"%PDF-1.4")
+
+    papers = discover_papers([tmp_path / "a", str(tmp_path / "b" / "*.pdf"), tmp_path / "cells.pdf", tmp_path / "a"])
+
+    ids = [paper.paper_id for paper in papers]
+    assert len(ids) == 3 and len(set(ids)) == 3
+    assert "cells" in ids
+    assert all(paper_id.startswith("attention-paper-") for paper_id in ids if paper_id != "cells")
+
+
+def test_adding_a_paper_does_not_reprocess_the_others(tmp_path):
+    papers_dir = tmp_path / "papers"
+    papers_dir.mkdir()
+    _paper(papers_dir, "attention")
+    _paper(papers_dir, "cells")
+
+    first, store = _ingest(papers_dir, tmp_path / "store")
+    assert (first.ingested, first.skipped) == (2, 0)
+    before = len(store)
+
+    _paper(papers_dir, "bleu")
+    second, store = _ingest(papers_dir, tmp_path / "store")
+
+    assert (second.ingested, second.skipped) == (1, 2)
+    assert second.totals.stored == second.totals.chunks
+    assert len(store) == before + second.totals.chunks
+    manifest = CorpusManifest.load(corpus_manifest_path(store.persist_directory, store.collection_name))
+    assert sorted(manifest.papers) == ["attention", "bleu", "cells"]
+    assert manifest.papers["bleu"]["title"] == "bleu"
+
+
+def test_changed_paper_is_pruned_on_its_own(tmp_path):
+    papers_dir = tmp_path / "papers"
+    papers_dir.mkdir()
+    _paper(papers_dir, "attention")
+    cells = _paper(papers_dir, "cells")
+    _, store = _ingest(papers_dir, tmp_path / "store")
+    attention_ids = {chunk.chunk_id for chunk in store.get(store._ids) if chunk.paper_id == "attention"}
+
+    write_pdf(cells, ["cells now divide slowly " * 10])
+    os.utime(cells, ns=(1, 1))
+    stats, store = _ingest(papers_dir, tmp_path / "store")
+
+    assert (stats.ingested, stats.skipped) == (1, 1)
+    assert stats.totals.removed > 0
+    chunks = store.get(store._ids)
+    assert {chunk.chunk_id for chunk in chunks if chunk.paper_id == "attention"} == attention_ids
+    assert all("slowly" in chunk.content for chunk in chunks if chunk.paper_id == "cells")
+
+    cells.unlink()
+    stats, store = _ingest(papers_dir, tmp_path / "store", prune_missing=True)
+    assert stats.removed_papers == 1
+    assert {chunk.paper_id for chunk in store.get(store._ids)} == {"attention"}
+
+
+def test_retrieval_filters_to_a_paper_subset(tmp_path):
+    papers_dir = tmp_path / "papers"
+    papers_dir.mkdir()
+    for name in TOPICS:
+        _paper(papers_dir, name)
+    _, store = _ingest(papers_dir, tmp_path / "store")
+    index = BM25Index.load(bm25_path(store.persist_directory, store.collection_name))
+
+    query = "attention heads translation bleu"
+    dense = store.search_with_distances(query, k=10, papers=["bleu"])
+    assert dense and {chunk.paper_id for chunk, _ in dense} == {"bleu"}
+    assert store.search_with_distances(query, k=3, papers=[]) == []
+    lexical = index.search(query, papers=["cells", "bleu"])
+    assert {index.paper_ids[index.chunk_ids.index(chunk_id)] for chunk_id, _ in lexical} == {"bleu"}
+
+    hybrid = HybridRetriever(store, index, papers=["attention"])
+    results = hybrid.similarity_search(query, k=5)
+    assert results and {chunk.paper_id for chunk in results} == {"attention"}
+    assert all(chunk.title == "attention" for chunk in results)
+
+
+def test_bm25_merge_matches_single_build(tmp_path):
+    docs = [
+        DocumentChunk("a1", "attention heads attention", 1, paper_id="a"),
+        DocumentChunk("a2", "encoder layer", 2, paper_id="a"),
+        DocumentChunk("b1", "attention translation bleu", 1, paper_id="b"),
+    ]
+    whole = BM25Index(tmp_path / "whole.npz")
+    shards = [BM25Index(tmp_path / "a.npz"), BM25Index(tmp_path / "b.npz")]
+    for doc in docs:
+        whole.add(doc)
+        shards[doc.paper_id == "b"].add(doc)
+
+    merged = BM25Index.merge(tmp_path / "merged.npz", shards)
+    merged.save()
+    loaded = BM25Index.load(tmp_path / "merged.npz")
+
+    for query in ("attention", "translation encoder", "bleu heads"):
+        expected = whole.search(query)
+        actual = loaded.search(query)
+        assert [chunk_id for chunk_id, _ in actual] == [chunk_id for chunk_id, _ in expected]
+        assert np.allclose([score for _, score in actual], [score for _, score in expected])
+    assert loaded.paper_ids == ["a", "a", "b"]
+
+
+def test_parallel_workers_match_serial_ingest(tmp_path):
+    papers_dir = tmp_path / "papers"
+    papers_dir.mkdir()
+    for name in TOPICS:
+        _paper(papers_dir, name)
+
+    _, serial = _ingest(papers_dir, tmp_path / "serial")
+    _, parallel = _ingest(papers_dir, tmp_path / "parallel", workers=2)
+
+    assert sorted(parallel._ids) == sorted(serial._ids)
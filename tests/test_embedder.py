@@ -0,0 +1,34 @@
+import numpy as np
+
+from thedebator.backends.embedder import HashingEmbedder
+
+
+def test_hashing_embedder_is_deterministic_and_normalised():
+    embedder = HashingEmbedder(dimension=64)
+
+    first = embedder.embed(["Attention is all you need", ""])
+    second = HashingEmbedder(dimension=64).embed(["Attention is all you need", ""])
+
+    assert first.shape == (2, 64)
+    assert first.dtype == np.float32
+    assert np.array_equal(first, second)
+    assert np.isclose(np.linalg.norm(first[0]), 1.0)
+    assert not first[1].any()
+
+
+def test_hashing_embedder_batches_and_threads_match_single_call():
+    texts = [f"chunk {i} about layer norm and BLEU" for i in range(50)]
+
+    single = HashingEmbedder(dimension=32, batch_size=100).embed(texts)
+    batched = HashingEmbedder(dimension=32, batch_size=7, threads=3).embed(texts)
+
+    assert np.array_equal(single, batched)
+
+
+def test_hashing_embedder_ranks_overlapping_text_higher():
+    embedder = HashingEmbedder()
+    query, related, unrelated = embedder.embed(
+        ["BLEU score on WMT14", "We report BLEU on WMT14 En-De", "Cells divide faster"]
+    )
+
+    assert query @ related > query @ unrelated
@@ -0,0 +1,32 @@
+import numpy as np
+
+from thedebator.retrieval.embedding_cache import EmbeddingCache
+
+
+def test_embedding_cache_hits_misses_and_models(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite")
+    cache.put_many("model-a", ["alpha"], [[1.0, 2.0]])
+
+    hit, miss = cache.get_many("model-a", ["alpha", "beta"])
+    (other_model,) = cache.get_many("model-b", ["alpha"])
+
+    assert hit.dtype == np.float32
+    assert hit.tolist() == [1.0, 2.0]
+    assert miss is None
+    assert other_model is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite", max_entries=2)
+    cache.put_many("m", ["a"], [[1.0]])
+    cache.put_many("m", ["b"], [[2.0]])
+    cache.get_many("m", ["a"])  # refresh "a" so "b" becomes the oldest
+    cache.put_many("m", ["c"], [[3.0]])
+
+    a, b, c = cache.get_many("m", ["a", "b", "c"])
+
+    assert len(cache) == 2
+    assert b is None
+    assert a is not None and c is not None
+    assert cache.stats.evictions == 1
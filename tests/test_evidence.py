@@ -0,0 +1,113 @@
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import OllamaBackend
+from thedebator.backends.ollama import NUM_CTX
+from thedebator.conversation import Conversation
+from thedebator.evidence import EvidenceLedger
+from thedebator.retrieval.types import DocumentChunk
+
+from tests.test_ollama import FakeClient
+
+CHUNKS = [
+    DocumentChunk("c1", "Cells divide faster at 37C in rich medium. " * 5, 2),
+    DocumentChunk("c2", "Growth slows once nutrients are depleted. " * 5, 3, paper_id="cells"),
+]
+
+
+class StreamingClient(FakeClient):
+    def generate(self, stream: bool = False, **request):
+        response = super().generate(**request)
+        return iter([{**response, "done": True}]) if stream else response
+
+
+class FakeStore:
+    def similarity_search(self, query: str, k: int = 3):
+        return CHUNKS[:k]
+
+
+def _backend(reuse_context: bool = True) -> OllamaBackend:
+    backend = OllamaBackend(model="fake", reuse_context=reuse_context)
+    backend._client = StreamingClient()
+    return backend
+
+
+def _debate(rounds: int = 2, **kwargs) -> Conversation:
+    conversation = Conversation(
+        explainer=ExplainerAgent(backend=kwargs.pop("explainer_backend", _backend())),
+        reviewer=ReviewerAgent(backend=kwargs.pop("reviewer_backend", _backend())),
+        rounds=rounds,
+        store=FakeStore(),
+        top_k=2,
+        prefetch=False,
+        **kwargs,
+    )
+    conversation.run("Explain cell growth")
+    return conversation
+
+
+def test_ledger_references_evidence_a_reader_has_seen() -> None:
+    ledger = EvidenceLedger()
+
+    first = ledger.render("A", CHUNKS)
+    ledger.mark_seen("A", first.sent)
+    again = ledger.render("A", CHUNKS[::-1])
+    other = ledger.render("B", CHUNKS)
+
+    assert first.text.startswith("[E1] [p.2] Cells divide")
+    assert "[E2] [p.3, cells] Growth slows" in first.text
+    assert again.text.splitlines() == ["[E2] [p.3, cells] (quoted earlier)", "[E1] [p.2] (quoted earlier)"]
+    assert again.citations == ["[p.3, cells]", "[p.2]"]
+    assert again.tokens_saved > 0 and again.sent == []
+    assert other.text == first.text and other.tokens_saved == 0
+
+    ledger.mark_seen("A", ["c2"], new_session=True)
+    assert ledger.render("A", CHUNKS).referenced == ["c2"]
+
+
+def test_repeated_evidence_is_not_resent_within_a_session() -> None:
+    conversation = _debate()
+    prompts = [request["prompt"] for request in conversation.explainer.backend._client.requests]
+
+    assert "Cells divide faster" in prompts[0]
+    assert "Cells divide faster" not in prompts[1]
+    assert "[E1] [p.2] (quoted earlier)" in prompts[1]
+    assert [turn.metrics["evidence_tokens_saved"] > 0 for turn in conversation.history] == [False, False, True, True]
+    assert conversation.metrics.counters["evidence_tokens_saved"] == sum(
+        turn.metrics["evidence_tokens_saved"] for turn in conversation.history
+    )
+    assert conversation.history[2].citations == ["[p.2]", "[p.3, cells]"]
+
+
+def test_evidence_is_resent_without_a_session() -> None:
+    stateless = _debate(explainer_backend=_backend(reuse_context=False))
+    disabled = _debate(dedupe_evidence=False)
+
+    for conversation in (stateless, disabled):
+        prompts = [request["prompt"] for request in conversation.explainer.backend._client.requests]
+        assert all("Cells divide faster" in prompt for prompt in prompts)
+        assert conversation.history[2].metrics["evidence_tokens_saved"] == 0
+
+
+class FullContextClient(StreamingClient):
+    """Returns a context too full to continue, so every turn rebuilds the session."""
+
+    def generate(self, stream: bool = False, **request):
+        response = super().generate(stream=stream, **request)
+        first = next(response) if stream else response
+        first = {**first, "context": [0] * NUM_CTX}
+        return iter([first]) if stream else first
+
+
+def test_evidence_is_resent_when_the_session_is_rebuilt() -> None:
+    backends = [_backend(), _backend()]
+    for backend in backends:
+        backend._client = FullContextClient()
+
+    conversation = _debate(explainer_backend=backends[0], reviewer_backend=backends[1])
+
+    for backend in backends:
+        assert backend.has_session
+        later = backend._client.requests[1]
+        assert "context" not in later
+        assert "Cells divide faster" in later["prompt"] and "(quoted earlier)" not in later["prompt"]
+    assert all(turn.metrics["evidence_tokens_saved"] == 0 for turn in conversation.history)
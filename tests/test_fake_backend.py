@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+from thedebator.backends import FakeBackend
+
+
+def test_fake_backend_is_deterministic() -> None:
+    backend = FakeBackend(response_tokens=30, seed=3)
+
+    first = backend.generate("Explain attention")
+    assert backend.generate("Explain attention") == first
+    assert FakeBackend(response_tokens=30, seed=4).generate("Explain attention") != first
+    assert backend.generate("Explain convolution") != first
+    assert len(first.split()) == 30
+    assert first.rstrip().endswith(".")
+    assert backend.calls == 3
+    assert backend.last_stats.eval_tokens == 30
+
+
+def test_fake_backend_paces_tokens() -> None:
+    backend = FakeBackend(latency=0.05, tokens_per_second=200, response_tokens=10)
+
+    start = time.perf_counter()
+    streamed = list(backend.generate_stream("prompt"))
+    elapsed = time.perf_counter() - start
+
+    assert "".join(streamed) == "".join(backend.reply("prompt"))
+    assert elapsed >= 0.05 + 10 / 200
+    assert backend.last_stats.tokens_per_second == 200
+
+
+def test_fake_backend_async_matches_sync() -> None:
+    backend = FakeBackend(response_tokens=20)
+
+    assert asyncio.run(backend.agenerate("prompt")) == backend.generate("prompt")
+
+
+def test_benchmark_suite_records_and_compares() -> None:
+    from benchmarks.run_suite import bench_debate, bench_retrieval, compare
+
+    results = {"results": [*bench_retrieval([50]), *bench_debate([1])]}
+    assert [r["benchmark"] for r in results["results"]] == ["retrieval", "debate"]
+    assert results["results"][0]["metrics"]["dense_p50_ms"] > 0
+    assert compare(results, results, tolerance=0.25) == []
+
+    slower = {"results": [dict(r, metrics={k: v * 2 for k, v in r["metrics"].items()}) for r in results["results"]]}
+    regressions = compare(slower, results, tolerance=0.25)
+    assert any("overhead_per_round_ms" in line for line in regressions)
@@ -0,0 +1,45 @@
+from thedebator.history import HistoryWindow, TokenCounter, trim_history
+
+
+def test_window_keeps_recent_turns_within_budget() -> None:
+    window = HistoryWindow(max_tokens=10, counter=TokenCounter(tokenizer=str.split))
+    for i in range(20):
+        window.append(f"A: turn {i}")  # 3 tokens each
+
+    assert window.texts() == ["A: turn 17", "A: turn 18", "A: turn 19"]
+    assert window.tokens <= 10
+    assert window.tokens == sum(window.counter.count(turn) for turn in window.texts())
+    assert window.evicted == 20 - len(window)
+
+
+def test_window_matches_trim_history() -> None:
+    counter = TokenCounter()
+    turns = [f"Speaker {i % 2}: " + "word " * (i * 7 % 40) for i in range(50)]
+    window = HistoryWindow(max_tokens=300, counter=counter)
+    for turn in turns:
+        window.append(turn)
+
+    assert window.texts() == trim_history(turns, 300, counter)
+
+
+def test_evicted_turns_are_summarised() -> None:
+    window = HistoryWindow(max_tokens=60, summarize=True, summary_tokens=30)
+    window.append("Explainer A: Cells divide faster under light. More detail follows here.")
+    window.append("Reviewer B: " + "filler " * 6)
+
+    texts = window.texts()
+
+    assert texts[0] == "Earlier in the debate:\n- Explainer A: Cells divide faster under light."
+    assert texts[1].startswith("Reviewer B:")
+
+
+def test_counter_uses_tokenizer_or_calibrates() -> None:
+    assert TokenCounter(tokenizer=str.split).count("three word text") == 3
+
+    counter = TokenCounter()
+    for _ in range(50):
+        counter.calibrate(chars=300, tokens=100)
+    counter.calibrate(chars=10_000, tokens=10)  # cached-prefix report, ignored
+
+    assert round(counter.chars_per_token, 2) == 3.0
+    assert counter.count("x" * 30) == 10
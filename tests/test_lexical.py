@@ -0,0 +1,61 @@
+from thedebator.retrieval.lexical import BM25Index, HybridRetriever, tokenize
+from thedebator.retrieval.types import DocumentChunk
+
+CHUNKS = [
+    DocumentChunk(chunk_id="c1", content="We fine-tune BERT-base with AdamW at lr 3e-5.", page=4),
+    DocumentChunk(chunk_id="c2", content="The baseline reaches 27.3 BLEU on WMT14.", page=6),
+    DocumentChunk(chunk_id="c3", content="Results improve when the model is larger.", page=8),
+]
+
+
+class NoMatchStore:
+    """Dense search that only finds weak matches, as happens with acronyms."""
+
+    def search_many_with_distances(self, queries, k=3):
+        return [[(CHUNKS[2], 0.9)] for _ in queries]
+
+    def get(self, chunk_ids):
+        return [chunk for chunk in CHUNKS if chunk.chunk_id in chunk_ids]
+
+    def similarity_search_many(self, queries, k=3, limit=None):
+        return []
+
+
+def _index(tmp_path) -> BM25Index:
+    index = BM25Index(tmp_path / "debate.bm25.npz")
+    for chunk in CHUNKS:
+        index.add(chunk)
+    index.save()
+    return index
+
+
+def test_tokenize_keeps_compounds_and_parts():
+    assert tokenize("BERT-base, 3e-5") == ["bert-base", "bert", "base", "3e-5", "3e", "5"]
+
+
+def test_bm25_ranks_exact_symbol_matches(tmp_path):
+    index = _index(tmp_path)
+
+    results = index.search("BERT-base AdamW", k=2)
+
+    assert results[0][0] == "c1"
+    assert index.search("transformer") == []
+
+
+def test_bm25_roundtrip(tmp_path):
+    _index(tmp_path)
+
+    loaded = BM25Index.load(tmp_path / "debate.bm25.npz")
+
+    assert loaded.search("WMT14 BLEU", k=1)[0][0] == "c2"
+    assert BM25Index.load(tmp_path / "missing.bm25.npz") is None
+
+
+def test_hybrid_retriever_recovers_lexical_hits(tmp_path):
+    retriever = HybridRetriever(NoMatchStore(), _index(tmp_path))
+
+    results = retriever.similarity_search("BLEU on WMT14", k=3)
+
+    # The weak dense-only match is still filtered; the lexical hit is returned.
+    assert [chunk.chunk_id for chunk in results] == ["c2"]
+    assert HybridRetriever(NoMatchStore()).similarity_search("BLEU on WMT14") == []
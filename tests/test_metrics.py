@@ -0,0 +1,82 @@
+import io
+import json
+import time
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends.base import Backend, GenerationStats
+from thedebator.conversation import Conversation
+from thedebator.metrics import Metrics, turn_records, write_jsonl
+from thedebator.retrieval.pipeline import ingest_stream
+
+
+class StreamingBackend(Backend):
+    def __init__(self, report_stats: bool = False) -> None:
+        self.report_stats = report_stats
+        self.last_stats = None
+
+    def generate(self, prompt: str, history=None) -> str:
+        return "".join(self.generate_stream(prompt, history))
+
+    def generate_stream(self, prompt: str, history=None):
+        time.sleep(0.01)
+        for word in ["Cells ", "divide ", "fast."]:
+            yield word
+        if self.report_stats:
+            self.last_stats = GenerationStats(prompt_tokens=40, prompt_seconds=0.2, eval_tokens=3, eval_seconds=0.1)
+
+
+class ListStore:
+    def upsert(self, chunks):
+        return len(list(chunks))
+
+    def flush(self):
+        pass
+
+
+def test_metrics_aggregate_timers_and_counters() -> None:
+    metrics = Metrics()
+    metrics.record("retrieval", 0.5)
+    metrics.record("retrieval", 1.5)
+    metrics.incr("generated_tokens", 3)
+    assert list(metrics.timed_iter("pages", range(3))) == [0, 1, 2]
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["timers"]["retrieval"] == {"count": 2, "total_s": 2.0, "mean_s": 1.0, "max_s": 1.5}
+    assert snapshot["timers"]["pages"]["count"] == 3
+    assert snapshot["counters"] == {"generated_tokens": 3}
+    assert metrics.format_table().splitlines()[1].startswith("retrieval")
+
+
+def test_turns_carry_generation_metrics() -> None:
+    conversation = Conversation(
+        explainer=ExplainerAgent(backend=StreamingBackend()),
+        reviewer=ReviewerAgent(backend=StreamingBackend(report_stats=True)),
+        rounds=1,
+    )
+    history = conversation.run("Explain cell growth")
+
+    explainer, reviewer = history
+    assert explainer.metrics["ttft_s"] >= 0.01
+    assert explainer.metrics["generated_tokens"] == 3
+    assert reviewer.metrics["prompt_tokens"] == 40
+    assert reviewer.metrics["tokens_per_s"] == 30
+    assert conversation.metrics.counters["generated_tokens"] == 6
+    assert conversation.metrics.timers["generation"].count == 2
+
+    buffer = io.StringIO()
+    write_jsonl(turn_records(history), buffer)
+    records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert [record["speaker"] for record in records] == ["Explainer A", "Reviewer B"]
+
+
+def test_ingest_stream_records_stage_timings() -> None:
+    pages = ((page, "word " * 300) for page in range(1, 4))
+    metrics = Metrics()
+
+    ingest_stream(pages, ListStore(), chunk_size=100, chunk_overlap=20, batch_size=4, metrics=metrics)
+
+    assert metrics.timers["pdf_extraction"].count == 3
+    assert {"chunking", "store_upsert", "store_flush"} <= set(metrics.timers)
+    assert "chunk_stream" not in metrics.timers
@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from thedebator.backends.embedder import HashingEmbedder
+from thedebator.retrieval.numpy_store import NumpyVectorStore
+from thedebator.retrieval.types import DocumentChunk, content_chunk_id
+
+
+def _chunk(content: str, page: int) -> DocumentChunk:
+    return DocumentChunk(chunk_id=content_chunk_id(content, page, page), content=content, page=page)
+
+
+def _store(tmp_path) -> NumpyVectorStore:
+    return NumpyVectorStore(tmp_path, embedder=HashingEmbedder(dimension=128), cache_embeddings=False)
+
+
+CHUNKS = [
+    _chunk("We report BLEU on WMT14 English German", 3),
+    _chunk("Cells divide faster in warm media", 7),
+    _chunk("Attention heads specialise by layer", 9),
+]
+
+
+def test_numpy_store_search_ranks_and_filters(tmp_path):
+    store = _store(tmp_path)
+
+    assert store.upsert(CHUNKS) == 3
+    assert store.upsert(CHUNKS) == 0
+
+    results = store.similarity_search("BLEU on WMT14", k=2)
+
+    assert [chunk.page for chunk in results] == [3]
+
+
+def test_numpy_store_persists_and_memory_maps(tmp_path):
+    store = _store(tmp_path)
+    store.upsert(CHUNKS)
+    store.flush()
+
+    reopened = _store(tmp_path)
+    results = reopened.similarity_search("attention heads layer", k=1)
+
+    assert isinstance(reopened._matrix, np.memmap)
+    assert len(reopened) == 3
+    assert results[0].chunk_id == CHUNKS[2].chunk_id
+
+
+def test_numpy_store_prune_and_reset(tmp_path):
+    store = _store(tmp_path)
+    store.upsert(CHUNKS)
+
+    removed = store.prune([CHUNKS[0].chunk_id])
+
+    assert removed == 2
+    assert len(_store(tmp_path)) == 1
+
+    store.reset()
+    assert len(_store(tmp_path)) == 0
+    assert store.similarity_search("BLEU") == []
+
+
+def test_numpy_store_search_many_dedupes_in_one_pass(tmp_path):
+    embedder = HashingEmbedder(dimension=128)
+    calls = []
+    original = embedder.embed
+    embedder.embed = lambda texts: calls.append(list(texts)) or original(texts)
+    store = NumpyVectorStore(tmp_path, embedder=embedder, cache_embeddings=False)
+    store.upsert(CHUNKS)
+    calls.clear()
+
+    results = store.similarity_search_many(["BLEU on WMT14", "WMT14 English German BLEU", "attention heads"], k=2)
+
+    assert len(calls) == 1
+    assert [chunk.page for chunk in results].count(3) == 1
+    assert {chunk.page for chunk in results} == {3, 9}
+
+
+def test_numpy_store_first_searches_from_many_threads(tmp_path):
+    store = _store(tmp_path)
+    store.upsert(CHUNKS)
+    store.flush()
+
+    reopened = _store(tmp_path)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: reopened.similarity_search("attention heads layer", k=1), range(8)))
+
+    assert all([chunk.page for chunk in found] == [9] for found in results)
@@ -0,0 +1,138 @@
+import ollama
+import pytest
+
+from thedebator.backends import OllamaBackend
+from thedebator.backends.ollama import NUM_CTX
+
+
+class FakeClient:
+    """Echoes Ollama's generate contract: context grows by one token per prompt char."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+
+    def generate(self, **request):
+        self.requests.append(request)
+        context = list(request.get("context") or []) + [0] * len(request["prompt"])
+        return {
+            "response": f"reply {len(self.requests)}",
+            "context": context,
+            "prompt_eval_count": len(request["prompt"]),
+            "prompt_eval_duration": 2_000_000,
+            "eval_count": 5,
+            "eval_duration": 10_000_000,
+        }
+
+
+def _backend(**kwargs) -> tuple[OllamaBackend, FakeClient]:
+    backend = OllamaBackend(model="fake", **kwargs)
+    backend._client = FakeClient()
+    return backend, backend._client
+
+
+def test_second_turn_sends_only_new_suffix() -> None:
+    backend, client = _backend()
+    history = ["Topic: cells"]
+
+    first = backend.generate("Explain", history=history)
+    history += ["Explainer A: " + first, "Reviewer B: I disagree."]
+    backend.generate("Respond to the critique", history=history)
+
+    assert "context" not in client.requests[0]
+    assert client.requests[1]["context"] == [0] * len(client.requests[0]["prompt"])
+    # Own reply is already in the cached context; only the reviewer's turn is new.
+    assert client.requests[1]["prompt"] == "Reviewer B: I disagree.\n\nRespond to the critique"
+    assert [stats.reused_context for stats in backend.stats] == [False, True]
+    assert backend.last_stats.prompt_tokens == len(client.requests[1]["prompt"])
+    assert backend.last_stats.prompt_seconds == 0.002
+
+
+def test_session_rebuilds_when_window_fills() -> None:
+    backend, client = _backend()
+    history: list[str] = []
+    for turn in range(8):
+        reply = backend.generate("x" * 1500, history=history)
+        history.append(f"Explainer A: {reply}")
+
+    assert all(len(request.get("context", [])) <= NUM_CTX for request in client.requests)
+    assert any("context" not in request for request in client.requests[1:])
+
+
+def test_reuse_disabled_sends_full_history() -> None:
+    backend, client = _backend(reuse_context=False)
+    backend.generate("Explain", history=["Topic: cells"])
+    backend.generate("Again", history=["Topic: cells", "Explainer A: reply 1"])
+
+    assert all("context" not in request for request in client.requests)
+    assert client.requests[1]["prompt"].startswith("Topic: cells\n\nExplainer A: reply 1")
+
+
+class FlakyClient(FakeClient):
+    """Fails the first ``failures`` requests like an Ollama server that is still starting."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+
+    def generate(self, stream: bool = False, **request):
+        self.attempts += 1
+        if stream:
+            return self._stream(request)
+        if self.attempts <= self.failures:
+            raise ollama.ResponseError("model is loading", 503)
+        return super().generate(**request)
+
+    def _stream(self, request):
+        if self.attempts <= self.failures:
+            raise ConnectionError("connection refused")
+        response = super().generate(**request)
+        yield {"response": response["response"], "done": False}
+        yield {"response": "", "done": True, "context": response["context"]}
+
+
+def test_requests_keep_model_loaded_and_share_connections() -> None:
+    backend, client = _backend(keep_alive="1h")
+    backend.generate("Explain")
+    backend.warm()
+
+    assert [request["keep_alive"] for request in client.requests] == ["1h", "1h"]
+    assert client.requests[1]["prompt"] == ""
+    assert OllamaBackend(model="a", host="http://h:1")._client is OllamaBackend(model="b", host="http://h:1")._client
+
+
+def test_transient_errors_are_retried() -> None:
+    backend = OllamaBackend(model="fake", retries=2, retry_backoff=0)
+    backend._client = FlakyClient(failures=2)
+    assert backend.generate("Explain") == "reply 1"
+
+    backend._client = FlakyClient(failures=1)
+    assert "".join(backend.generate_stream("Explain")) == "reply 1"
+
+    backend._client = FlakyClient(failures=3)
+    with pytest.raises(ollama.ResponseError):
+        backend.generate("Explain")
+    assert backend._client.attempts == 3
+
+
+def test_client_errors_are_not_retried() -> None:
+    class MissingModel(FakeClient):
+        def generate(self, **request):
+            self.requests.append(request)
+            raise ollama.ResponseError("model not found", 404)
+
+    backend = OllamaBackend(model="fake", retry_backoff=0)
+    backend._client = client = MissingModel()
+    with pytest.raises(ollama.ResponseError):
+        backend.generate("Explain")
+    assert len(client.requests) == 1
+
+
+def test_session_survives_sliding_history_window() -> None:
+    backend, client = _backend()
+    backend.generate("Explain", history=["Topic: cells", "Reviewer B: old point"])
+    # The conversation's window evicted the oldest turn and added two new ones.
+    backend.generate("Continue", history=["Reviewer B: old point", "Explainer A: reply 1", "Reviewer B: new point"])
+
+    assert "context" in client.requests[1]
+    assert client.requests[1]["prompt"] == "Reviewer B: new point\n\nContinue"
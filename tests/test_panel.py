@@ -0,0 +1,115 @@
+import asyncio
+import time
+from pathlib import Path
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import FakeBackend
+from thedebator.config import load_config
+from thedebator.conversation import Conversation
+from thedebator.retrieval.types import DocumentChunk
+
+FOCUSES = ["methods", "statistics", "related work"]
+
+
+class RecordingBackend(FakeBackend):
+    def __init__(self, latency: float = 0.0) -> None:
+        super().__init__(latency=latency, response_tokens=12)
+        self.prompts: list[str] = []
+
+    def reply(self, prompt: str):
+        self.prompts.append(prompt)
+        return super().reply(prompt)
+
+
+class CountingStore:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def similarity_search(self, query: str, k: int = 3):
+        self.queries.append(query)
+        return [DocumentChunk(chunk_id="c1", content="Cells divide faster.", page=2)]
+
+
+def _panel_debate(latency: float, rounds: int = 1, history=()) -> Conversation:
+    return Conversation(
+        explainer=ExplainerAgent(backend=RecordingBackend()),
+        reviewer=ReviewerAgent(backend=RecordingBackend()),
+        rounds=rounds,
+        history=list(history),
+        store=CountingStore(),
+        prefetch=False,
+        panel=[
+            ReviewerAgent(backend=RecordingBackend(latency), name=f"{focus.title()} Reviewer", focus=focus)
+            for focus in FOCUSES
+        ],
+    )
+
+
+def test_panel_round_takes_as_long_as_the_slowest_reviewer() -> None:
+    for run in (lambda c: c.run("Explain cell growth"), lambda c: asyncio.run(c.arun("Explain cell growth"))):
+        conversation = _panel_debate(latency=0.2)
+        start = time.perf_counter()
+        history = run(conversation)
+        elapsed = time.perf_counter() - start
+
+        assert [turn.speaker for turn in history] == [
+            "Explainer A",
+            "Methods Reviewer",
+            "Statistics Reviewer",
+            "Related Work Reviewer",
+        ]
+        assert elapsed < 0.2 * len(FOCUSES) * 0.75
+        # One retrieval for the explainer and one shared by the whole panel.
+        assert len(conversation.store.queries) <= 2 * conversation.max_claim_queries
+        assert conversation.reviewer.backend.prompts == []
+        assert all(turn.citations == ["[p.2]"] for turn in history)
+
+
+def test_merged_critique_is_the_explainers_next_prompt() -> None:
+    conversation = _panel_debate(latency=0.0, rounds=2)
+    history = conversation.run("Explain cell growth")
+
+    assert len(history) == 8
+    second_prompt = conversation.explainer.backend.prompts[1]
+    assert "Critiques from the review panel" in second_prompt
+    assert all(f"### {turn.speaker}\n{turn.message.strip()}" in second_prompt for turn in history[1:4])
+    assert "focus on statistics" in conversation.panel[1].system_prompt()
+
+
+def test_resume_part_way_through_the_panel() -> None:
+    history = _panel_debate(latency=0.0, rounds=2).run("Explain cell growth")
+    resumed = _panel_debate(latency=0.0, rounds=2, history=history[:6])
+
+    resumed_history = resumed.run("Explain cell growth")
+
+    assert resumed.explainer.backend.prompts == [] and resumed.panel[0].backend.prompts == []
+    assert all(history[4].message in reviewer.backend.prompts[0] for reviewer in resumed.panel[1:])
+    assert [turn.speaker for turn in resumed_history] == [turn.speaker for turn in history]
+
+
+def test_load_config_panel(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "models:\n  reviewer: qwen\npanel:\n  - methods\n  - name: Stats\n    focus: statistics\n    model: llama\n",
+        encoding="utf-8",
+    )
+
+    panel = load_config(path).panel
+
+    assert [(r.name, r.focus, r.model) for r in panel] == [
+        ("Methods Reviewer", "methods", None),
+        ("Stats", "statistics", "llama"),
+    ]
+
+
+def test_load_config_numbers_duplicate_panel_names(tmp_path: Path) -> None:
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "panel:\n  - statistics\n  - statistics\n  - focus: ''\n  - name: Reviewer\n  - statistics\n",
+        encoding="utf-8",
+    )
+
+    names = [reviewer.name for reviewer in load_config(path).panel]
+
+    assert names == ["Statistics Reviewer", "Statistics Reviewer 2", "Reviewer", "Reviewer 2", "Statistics Reviewer 3"]
@@ -0,0 +1,63 @@
+import tracemalloc
+
+from thedebator.retrieval.pipeline import batched, ingest_stream
+
+
+class CountingStore:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def upsert(self, chunks):
+        chunk_list = list(chunks)
+        self.batches.append(len(chunk_list))
+        return len(chunk_list)
+
+    def flush(self):
+        pass
+
+
+def _pages(count: int, words_per_page: int = 400):
+    for page in range(1, count + 1):
+        yield page, " ".join(f"w{page}-{i}" for i in range(words_per_page))
+
+
+def _peak_bytes(pages: int) -> int:
+    tracemalloc.start()
+    try:
+        ingest_stream(_pages(pages), CountingStore(), chunk_size=200, chunk_overlap=50, batch_size=16)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_batched_groups_items():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_ingest_stream_reports_pages_and_batches():
+    store = CountingStore()
+    seen_pages = []
+
+    stats = ingest_stream(
+        _pages(10, words_per_page=50),
+        store,
+        chunk_size=40,
+        chunk_overlap=10,
+        batch_size=4,
+        on_page=seen_pages.append,
+    )
+
+    assert seen_pages == list(range(1, 11))
+    assert stats.pages == 10
+    assert stats.chunks == sum(store.batches) == stats.stored
+    assert stats.batches == len(store.batches)
+    assert max(store.batches) <= 4
+
+
+def test_ingest_stream_peak_memory_is_bounded():
+    # A 4x larger document must not need 4x the memory: the pipeline only
+    # buffers a window of words and a bounded number of batches.
+    small = _peak_bytes(250)
+    large = _peak_bytes(1000)
+
+    assert large < small * 1.5
@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends.base import Backend
+from thedebator.conversation import Conversation
+from thedebator.prefetch import RetrievalPrefetcher
+from thedebator.retrieval.types import DocumentChunk
+
+SENTENCES = [f"Claim number {i} holds for growing cells. " for i in range(12)]
+
+
+class StreamingBackend(Backend):
+    def __init__(self, token_delay: float = 0.0) -> None:
+        self.token_delay = token_delay
+
+    def generate(self, prompt: str, history=None) -> str:
+        time.sleep(self.token_delay * len(SENTENCES))
+        return "".join(SENTENCES)
+
+    def generate_stream(self, prompt: str, history=None):
+        for sentence in SENTENCES:
+            time.sleep(self.token_delay)
+            yield sentence
+
+
+class SlowStore:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.queries: list[str] = []
+
+    def similarity_search(self, query: str, k: int = 3):
+        self.queries.append(query)
+        time.sleep(self.delay)
+        return [DocumentChunk(chunk_id="c1", content="Cells divide faster.", page=2)]
+
+
+def test_prefetcher_speculates_on_partial_text() -> None:
+    retrieved: list[str] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prefetcher = RetrievalPrefetcher(lambda text: retrieved.append(text) or len(text), executor, min_chars=100)
+        for sentence in SENTENCES:
+            prefetcher.feed(sentence)
+            time.sleep(0.005)
+        final = "".join(SENTENCES)
+        result, speculative = prefetcher.result(final)
+
+    assert speculative
+    assert prefetcher.speculations >= 2
+    assert all(final.startswith(text) for text in retrieved)
+    assert result >= 0.7 * len(final)
+
+
+def test_prefetcher_refines_when_speculation_is_too_short() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prefetcher = RetrievalPrefetcher(len, executor, min_chars=10)
+        prefetcher.feed("Short start. ")
+        final = "Short start. " + "and a long unpunctuated tail" * 10
+
+        assert prefetcher.result(final) == (len(final), False)
+
+
+def test_prefetch_overlaps_retrieval_with_generation() -> None:
+    def debate(prefetch: bool) -> tuple[float, Conversation]:
+        backend = StreamingBackend(token_delay=0.03)
+        conversation = Conversation(
+            explainer=ExplainerAgent(backend=backend),
+            reviewer=ReviewerAgent(backend=backend),
+            rounds=2,
+            store=SlowStore(delay=0.1),
+            prefetch=prefetch,
+            prefetch_min_chars=40,
+        )
+        start = time.perf_counter()
+        conversation.run("Explain cell growth")
+        return time.perf_counter() - start, conversation
+
+    serial_time, serial = debate(prefetch=False)
+    pipelined_time, pipelined = debate(prefetch=True)
+
+    assert [turn.citations for turn in pipelined.history] == [turn.citations for turn in serial.history]
+    # Three of the four turns hand their retrieval to the background thread.
+    assert pipelined.prefetch_stats.hits == 3
+    # The saving is about 0.3s of ~1.9s; keep the bound loose enough for a loaded machine.
+    assert pipelined_time < serial_time * 0.95
@@ -0,0 +1,91 @@
+import io
+from pathlib import Path
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import FakeBackend
+from thedebator.conversation import Conversation, ConversationTurn
+from thedebator.render import TokenRenderer, TranscriptWriter
+
+
+class CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_renderer_coalesces_tokens_by_size_and_time() -> None:
+    stream, clock = CountingStream(), FakeClock()
+    renderer = TokenRenderer(stream, max_delay=0.05, max_chars=10, clock=clock)
+
+    for token in ["ab", "cd", "ef", "gh"]:
+        renderer.write(token)
+    assert stream.getvalue() == ""
+    renderer.write("ij")
+    assert stream.getvalue() == "abcdefghij" and stream.writes == 1
+
+    renderer.write("k")
+    clock.now = 0.06
+    renderer.write("l")
+    assert stream.getvalue().endswith("kl") and renderer.frames == 2
+
+    renderer.write("m")
+    renderer.line("## Next")
+    assert stream.getvalue().endswith("m## Next\n")
+
+
+def test_streamed_debate_writes_frames_not_tokens() -> None:
+    stream = CountingStream()
+    backend = FakeBackend(response_tokens=200)
+    conversation = Conversation(
+        explainer=ExplainerAgent(backend=backend),
+        reviewer=ReviewerAgent(backend=backend),
+        rounds=1,
+        stream_output=True,
+        renderer=TokenRenderer(stream, max_delay=60),
+    )
+
+    history = conversation.run("Explain cell growth")
+
+    output = stream.getvalue()
+    assert "Round 1/1" in output
+    assert all(f"## {turn.speaker}\n{turn.message}\n" in output for turn in history)
+    assert stream.writes < 400 / 10
+
+
+def test_transcript_writer_matches_to_markdown(tmp_path: Path) -> None:
+    path = tmp_path / "discussion.md"
+    done = [ConversationTurn("Explainer A", "Cells divide. ", ["[p.2]"])]
+    backend = FakeBackend(response_tokens=20)
+    snapshots = []
+    transcript = TranscriptWriter(path, done)
+
+    def on_turn(turn: ConversationTurn) -> None:
+        transcript.append(turn)
+        snapshots.append((path.read_text(encoding="utf-8"), conversation.to_markdown()))
+
+    conversation = Conversation(
+        explainer=ExplainerAgent(backend=backend),
+        reviewer=ReviewerAgent(backend=backend),
+        rounds=2,
+        history=list(done),
+        on_turn=on_turn,
+    )
+    conversation.run("Explain cell growth")
+    transcript.close()
+
+    assert len(snapshots) == 3
+    assert all(written == expected for written, expected in snapshots)
+    assert path.read_text(encoding="utf-8").startswith("# Debate Discussion\n\n## Explainer A\nCells divide.\n_Sources_: [p.2]\n")
@@ -1,4 +1,4 @@
-from thedebator.retrieval.pdf import PDFIngestor
+from thedebator.retrieval.pdf import PDFIngestor, chunk_pages
 from thedebator.retrieval.types import DocumentChunk
 
 
@@ -8,10 +8,35 @@ def test_pdf_ingestor_iter_chunks(monkeypatch, tmp_path):
 
     ingestor = PDFIngestor(pdf_path)
 
-    monkeypatch.setattr(PDFIngestor, "read_pages", lambda self: ["word " * 20])
+    monkeypatch.setattr(PDFIngestor, "iter_pages", lambda self, workers=1: iter([(1, "word " * 20)]))
 
     chunks = list(ingestor.iter_chunks(chunk_size=5, chunk_overlap=2))
 
     assert chunks
     assert isinstance(chunks[0], DocumentChunk)
     assert chunks[0].page == 1
+
+
+def test_chunk_pages_attributes_page_ranges():
+    # Every page repeats the same common word, which used to pin all chunks to page 1.
+    pages = [(1, "the alpha the beta"), (2, ""), (3, "the gamma the delta"), (4, "the epsilon")]
+
+    chunks = list(chunk_pages(pages, chunk_size=4, chunk_overlap=1))
+
+    assert [(c.page_start, c.page_end) for c in chunks] == [(1, 1), (1, 3), (3, 4)]
+    assert [c.page for c in chunks] == [1, 1, 3]
+    assert chunks[1].content == "beta the gamma the"
+    assert chunks[-1].content.endswith("the epsilon")
+
+
+def test_read_pages_parallel_matches_serial(tmp_path):
+    from benchmarks.synthetic import write_synthetic_pdf
+
+    pdf_path = write_synthetic_pdf(tmp_path / "paper.pdf", pages=9, words_per_page=40)
+    ingestor = PDFIngestor(pdf_path)
+
+    serial = ingestor.read_pages()
+    parallel = ingestor.read_pages(workers=2)
+
+    assert parallel == serial
+    assert [page for page, _ in parallel] == list(range(1, 10))
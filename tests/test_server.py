@@ -0,0 +1,145 @@
+import http.client
+import json
+import threading
+import time
+
+import pytest
+
+from thedebator.agents.explainer import ExplainerAgent
+from thedebator.agents.reviewer import ReviewerAgent
+from thedebator.backends import FakeBackend
+from thedebator.retrieval.types import DocumentChunk
+from thedebator.server import DebateService, QueueFull, make_server
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.papers = []
+
+    def similarity_search(self, query: str, k: int = 3):
+        return [DocumentChunk(chunk_id="c1", content="Cells divide faster.", page=2)]
+
+
+class AgentFactory:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return ExplainerAgent(backend=FakeBackend(response_tokens=12)), ReviewerAgent(backend=FakeBackend(response_tokens=12))
+
+
+def _service(factory=None, store=None, **kwargs) -> DebateService:
+    store = store or FakeStore()
+
+    def retriever_for(papers):
+        store.papers.append(list(papers))
+        return store
+
+    return DebateService(factory or AgentFactory(), retriever_for, conversation_options={"prefetch": False}, **kwargs)
+
+
+@pytest.fixture
+def running():
+    servers = []
+
+    def start(service):
+        service.start()
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append((server, service))
+        return server.server_address[1]
+
+    yield start
+    for server, service in servers:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def _request(port: int, method: str, path: str, body=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request(method, path, body=None if body is None else json.dumps(body))
+    response = connection.getresponse()
+    data = response.read().decode("utf-8")
+    connection.close()
+    return response.status, data
+
+
+def test_post_streams_turns(running) -> None:
+    port = running(_service())
+
+    status, data = _request(port, "POST", "/debates?stream=1", {"topic": "Explain cell growth", "rounds": 2})
+
+    records = [json.loads(line) for line in data.splitlines()]
+    assert status == 200
+    assert [record["type"] for record in records] == ["debate", "turn", "turn", "turn", "turn", "end"]
+    assert [record["speaker"].split()[0] for record in records[1:-1]] == ["Explainer", "Reviewer"] * 2
+    assert records[1]["citations"] == ["[p.2]"]
+    assert records[-1]["status"] == "done"
+
+
+def test_submit_then_poll(running) -> None:
+    store = FakeStore()
+    port = running(_service(store=store))
+
+    status, data = _request(port, "POST", "/debates", {"topic": "Explain cell growth", "rounds": 1, "papers": ["cells"]})
+    assert status == 202
+    job_id = json.loads(data)["id"]
+
+    deadline = time.monotonic() + 10
+    while True:
+        status, data = _request(port, "GET", f"/debates/{job_id}")
+        job = json.loads(data)
+        if job["status"] == "done" or time.monotonic() > deadline:
+            break
+        time.sleep(0.01)
+
+    assert status == 200 and job["status"] == "done"
+    assert len(job["turns"]) == 2
+    assert job["markdown"].startswith("# Debate Discussion")
+    assert store.papers == [["cells"]]
+    _, health = _request(port, "GET", "/health")
+    assert json.loads(health)["workers"] == 2
+    _, metrics = _request(port, "GET", "/metrics")
+    assert json.loads(metrics)["counters"]["debates_completed"] == 1
+
+
+def test_bad_requests_are_rejected(running) -> None:
+    port = running(_service(max_rounds=3))
+
+    assert _request(port, "POST", "/debates", {"rounds": 1})[0] == 400
+    assert _request(port, "POST", "/debates", {"topic": "x", "rounds": 4})[0] == 400
+    assert _request(port, "POST", "/debates", {"topic": "x", "papers": "cells"})[0] == 400
+    assert _request(port, "GET", "/debates/missing")[0] == 404
+
+
+def test_full_queue_is_refused() -> None:
+    service = _service(queue_size=2)  # not started, so nothing leaves the queue
+    service.submit("one")
+    service.submit("two")
+
+    with pytest.raises(QueueFull):
+        service.submit("three")
+
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        status, _ = _request(server.server_address[1], "POST", "/debates", {"topic": "three"})
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 429
+
+
+def test_workers_keep_their_agents_across_debates() -> None:
+    factory = AgentFactory()
+    service = _service(factory, workers=2)
+    service.start()
+    jobs = [service.submit(f"topic {i}", rounds=1) for i in range(5)]
+    for job in jobs:
+        list(job.follow())
+    service.close()
+
+    assert factory.calls == 2
+    assert all(job.status == "done" and len(job.turns) == 2 for job in jobs)
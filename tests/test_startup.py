@@ -0,0 +1,25 @@
+from benchmarks.bench_startup import import_profile, loaded_heavy
+
+# Importing the CLI used to take ~0.7s, nearly all of it chromadb and ollama.
+# Lazily imported it is well under 0.1s; the budget leaves room for slow machines.
+STARTUP_BUDGET_S = 0.4
+
+
+def test_cli_import_skips_heavy_dependencies() -> None:
+    assert loaded_heavy("thedebator.cli") == []
+    assert loaded_heavy("thedebator.conversation") == []
+
+
+def test_cli_import_within_budget() -> None:
+    seconds = min(import_profile("thedebator.cli")[0] for _ in range(3))
+
+    assert 0 < seconds < STARTUP_BUDGET_S
+
+
+def test_lazy_exports_resolve() -> None:
+    import thedebator.backends as backends
+    import thedebator.retrieval as retrieval
+
+    assert retrieval.NumpyVectorStore.__module__ == "thedebator.retrieval.numpy_store"
+    assert backends.HashingEmbedder.__module__ == "thedebator.backends.embedder"
+    assert set(retrieval.__all__) <= set(dir(retrieval))
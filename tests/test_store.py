@@ -1,14 +1,28 @@
+import numpy as np
+
+from thedebator.backends.embedder import Embedder
 from thedebator.retrieval.store import VectorStore
-from thedebator.retrieval.types import DocumentChunk
+from thedebator.retrieval.types import DocumentChunk, content_chunk_id
 
 
 class DummyCollection:
     def __init__(self) -> None:
         self.records = []
+        self.upserted = []
+
+    def get(self, ids=None, include=None):
+        stored = [record[0] for record in self.records]
+        if ids is not None:
+            stored = [chunk_id for chunk_id in stored if chunk_id in ids]
+        return {"ids": stored}
 
-    def upsert(self, ids, documents, metadatas):
+    def upsert(self, ids, documents, metadatas, embeddings=None):
+        self.upserted.extend(ids)
         self.records.extend(zip(ids, documents, metadatas))
 
+    def delete(self, ids):
+        self.records = [record for record in self.records if record[0] not in ids]
+
     def query(self, *args, **kwargs):
         query_texts = kwargs.get("query_texts")
         n_results = kwargs.get("n_results")
@@ -20,26 +34,46 @@ class DummyCollection:
         ids = [[record[0] for record in self.records[:n_results]]]
         documents = [[record[1] for record in self.records[:n_results]]]
         metadatas = [[record[2] for record in self.records[:n_results]]]
-        return {"ids": ids, "documents": documents, "metadatas": metadatas}
+        distances = [[0.1 for _ in self.records[:n_results]]]
+        return {"ids": ids, "documents": documents, "metadatas": metadatas, "distances": distances}
 
 
 class DummyClient:
     def __init__(self, collection):
         self.collection = collection
 
-    def get_or_create_collection(self, _name):
+    def get_or_create_collection(self, _name, metadata=None, embedding_function=None):
         return self.collection
 
     def delete_collection(self, _name):
         self.collection.records.clear()
 
 
-def test_vector_store_upsert_and_query(tmp_path):
-    store = VectorStore(tmp_path)
+class CountingEmbedder(Embedder):
+    name = "counting"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    def _embed_batch(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+def _store_with_dummy(tmp_path, embedder=None, **kwargs):
+    store = VectorStore(tmp_path, embedder=embedder or CountingEmbedder(), **kwargs)
     collection = DummyCollection()
-    client = DummyClient(collection)
+    object.__setattr__(store, "_client", DummyClient(collection))
+    return store, collection
+
+
+def _chunk(content: str, page: int) -> DocumentChunk:
+    return DocumentChunk(chunk_id=content_chunk_id(content, page, page), content=content, page=page)
 
-    object.__setattr__(store, "_client", client)
+
+def test_vector_store_upsert_and_query(tmp_path):
+    store, _collection = _store_with_dummy(tmp_path)
 
     chunk = DocumentChunk(chunk_id="c1", content="Cell growth increases.", page=5)
     count = store.upsert([chunk])
@@ -49,3 +83,54 @@ def test_vector_store_upsert_and_query(tmp_path):
     results = store.similarity_search("cell growth")
     assert results
     assert results[0].page == 5
+
+
+def test_vector_store_reingest_only_writes_changed_chunks(tmp_path):
+    store, collection = _store_with_dummy(tmp_path)
+    original = [_chunk("Intro text.", 1), _chunk("Methods text.", 2), _chunk("Results text.", 3)]
+    store.upsert(original)
+    collection.upserted.clear()
+
+    edited = [original[0], _chunk("Revised methods text.", 2), original[2]]
+    written = store.upsert(edited)
+    removed = store.prune(chunk.chunk_id for chunk in edited)
+
+    assert written == 1
+    assert collection.upserted == [edited[1].chunk_id]
+    assert removed == 1
+    assert sorted(record[0] for record in collection.records) == sorted(c.chunk_id for c in edited)
+
+
+def test_vector_store_reuses_cached_embeddings(tmp_path):
+    embedder = CountingEmbedder()
+    store, _collection = _store_with_dummy(tmp_path, embedder, query_cache_size=0)
+
+    store.similarity_search("cell growth")
+    store.similarity_search("cell growth")
+
+    assert embedder.calls == [["cell growth"]]
+    assert store.embedding_cache.stats.hits == 1
+
+    # A fresh store over the same directory finds the vector on disk.
+    reopened, _ = _store_with_dummy(tmp_path, embedder, query_cache_size=0)
+    reopened.similarity_search("cell growth")
+    assert embedder.calls == [["cell growth"]]
+
+
+def test_vector_store_caches_results_until_write(tmp_path):
+    store, collection = _store_with_dummy(tmp_path, cache_embeddings=False)
+    queries = []
+    original_query = collection.query
+    collection.query = lambda **kwargs: queries.append(kwargs) or original_query(**kwargs)
+    store.upsert([_chunk("Cell growth increases.", 5)])
+
+    store.similarity_search("Cell  growth")
+    store.similarity_search("cell growth")
+    assert len(queries) == 1
+    assert store.query_cache_stats.hits == 1
+
+    store.upsert([_chunk("Cells divide faster.", 6)])
+    results = store.similarity_search("cell growth")
+
+    assert len(queries) == 2
+    assert len(results) == 2